@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
-from pathlib import Path
-
-from dotenv import load_dotenv
-
-load_dotenv()
+import re
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+_REQUIRED = ("GARMIN_EMAIL", "GARMIN_PASSWORD", "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID")
+_FALSY = frozenset({"false", "0", "no", "off", ""})
+_TIME_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*$")
+# WEEKLY_REPORT_DAY prefixes (English or Portuguese) → three-letter cron day
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_WEEKDAY_ALIASES = {
+    **{d: d for d in _WEEKDAYS},
+    "seg": "mon", "ter": "tue", "qua": "wed", "qui": "thu", "sex": "fri",
+    "sab": "sat", "sáb": "sat", "dom": "sun",
+}
 
 
 class ConfigError(Exception):
     """Raised when required configuration is missing or invalid."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     garmin_email: str
     garmin_password: str
@@ -44,128 +52,188 @@ class Config:
     newsletter_enabled: bool
     fatsecret_consumer_key: str | None
     fatsecret_consumer_secret: str | None
-
-    # Derived fields
-    sync_hour: int = field(init=False)
-    sync_minute: int = field(init=False)
-    report_hour: int = field(init=False)
-    report_minute: int = field(init=False)
-    weekly_hour: int = field(init=False)
-    weekly_minute: int = field(init=False)
-    wake_start_hour: int = field(init=False)
-    wake_start_minute: int = field(init=False)
-    wake_end_hour: int = field(init=False)
-    wake_end_minute: int = field(init=False)
-
-    def __post_init__(self) -> None:
-        self.sync_hour, self.sync_minute = self._parse_time(self.daily_sync_time, "DAILY_SYNC_TIME")
-        self.report_hour, self.report_minute = self._parse_time(self.daily_report_time, "DAILY_REPORT_TIME")
-        self.weekly_hour, self.weekly_minute = self._parse_time(self.weekly_report_time, "WEEKLY_REPORT_TIME")
-        self.wake_start_hour, self.wake_start_minute = self._parse_time(self.wake_check_start, "WAKE_CHECK_START")
-        self.wake_end_hour, self.wake_end_minute = self._parse_time(self.wake_check_end, "WAKE_CHECK_END")
+    garmin_pool_size: int
+
+    # Derived fields — parsed from the HH:MM strings on first access
+    @cached_property
+    def sync_hour(self) -> int:
+        return self._parse_time(self.daily_sync_time, "DAILY_SYNC_TIME")[0]
+
+    @cached_property
+    def sync_minute(self) -> int:
+        return self._parse_time(self.daily_sync_time, "DAILY_SYNC_TIME")[1]
+
+    @cached_property
+    def report_hour(self) -> int:
+        return self._parse_time(self.daily_report_time, "DAILY_REPORT_TIME")[0]
+
+    @cached_property
+    def report_minute(self) -> int:
+        return self._parse_time(self.daily_report_time, "DAILY_REPORT_TIME")[1]
+
+    @cached_property
+    def weekly_hour(self) -> int:
+        return self._parse_time(self.weekly_report_time, "WEEKLY_REPORT_TIME")[0]
+
+    @cached_property
+    def weekly_minute(self) -> int:
+        return self._parse_time(self.weekly_report_time, "WEEKLY_REPORT_TIME")[1]
+
+    @cached_property
+    def wake_start_hour(self) -> int:
+        return self._parse_time(self.wake_check_start, "WAKE_CHECK_START")[0]
+
+    @cached_property
+    def wake_start_minute(self) -> int:
+        return self._parse_time(self.wake_check_start, "WAKE_CHECK_START")[1]
+
+    @cached_property
+    def wake_end_hour(self) -> int:
+        return self._parse_time(self.wake_check_end, "WAKE_CHECK_END")[0]
+
+    @cached_property
+    def wake_end_minute(self) -> int:
+        return self._parse_time(self.wake_check_end, "WAKE_CHECK_END")[1]
+
+    @cached_property
+    def weekly_day(self) -> str:
+        """WEEKLY_REPORT_DAY normalised to a three-letter day ("mon".."sun")."""
+        day = _WEEKDAY_ALIASES.get(self.weekly_report_day.strip().casefold()[:3])
+        if day is None:
+            raise ConfigError(
+                f"WEEKLY_REPORT_DAY must be a weekday name, got: {self.weekly_report_day!r}"
+            )
+        return day
 
     @staticmethod
     def _parse_time(value: str, name: str) -> tuple[int, int]:
         """Parse HH:MM string into (hour, minute) tuple."""
-        try:
-            parts = value.strip().split(":")
-            return int(parts[0]), int(parts[1])
-        except (ValueError, IndexError):
+        m = _TIME_RE.match(value)
+        if not m:
             raise ConfigError(f"{name} must be in HH:MM format, got: {value!r}")
+        return int(m.group(1)), int(m.group(2))
+
+
+def _parse_bool(raw: str | None, default: bool) -> bool:
+    """Coerce an env value to bool; any value in _FALSY disables a flag."""
+    if raw is None:
+        return default
+    return raw.strip().lower() not in _FALSY
+
+
+def _parse_int(
+    raw: str | None,
+    name: str,
+    default: int | None = None,
+    minv: int | None = None,
+    maxv: int | None = None,
+) -> int | None:
+    """Coerce an env value to int within [minv, maxv], returning *default* when unset."""
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ConfigError(f"{name} must be an integer, got: {raw!r}")
+    if (minv is not None and value < minv) or (maxv is not None and value > maxv):
+        low = "" if minv is None else minv
+        high = "" if maxv is None else maxv
+        raise ConfigError(f"{name} out of range [{low}..{high}], got: {value}")
+    return value
+
+
+# Directories already created/verified in this process
+_ensured_dirs: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create *path* (and parents) once per process, skipping known directories."""
+    if path in _ensured_dirs:
+        return
+    if path and not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
+
 
+def _optional_str(raw: str | None) -> str | None:
+    """Treat unset and empty env values alike as missing."""
+    return raw or None
 
+
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load and validate configuration from environment variables."""
-    required = {
-        "GARMIN_EMAIL": os.getenv("GARMIN_EMAIL"),
-        "GARMIN_PASSWORD": os.getenv("GARMIN_PASSWORD"),
-        "TELEGRAM_BOT_TOKEN": os.getenv("TELEGRAM_BOT_TOKEN"),
-        "TELEGRAM_CHAT_ID": os.getenv("TELEGRAM_CHAT_ID"),
-    }
-
-    missing = [k for k, v in required.items() if not v]
+    """Load and validate configuration from environment variables (and .env, if present).
+
+    The result is memoized for the lifetime of the process; call
+    ``load_config.cache_clear()`` to force a re-read of the environment.
+    """
+    # Deployments that inject env vars directly can opt out of the .env lookup
+    if os.environ.get("GARMINBOT_USE_DOTENV", "1") != "0":
+        from dotenv import load_dotenv
+
+        load_dotenv(override=False)
+
+    # Snapshot the environment once instead of going through os.environ per key
+    env = os.environ.copy()
+    values = tuple(env.get(k) for k in _REQUIRED)
+    missing = [k for k, v in zip(_REQUIRED, values) if not v]
     if missing:
         raise ConfigError(f"Missing required environment variables: {', '.join(missing)}")
+    garmin_email, garmin_password, telegram_bot_token, telegram_chat_id = values
 
     # Ensure data and logs directories exist
-    database_path = os.getenv("DATABASE_PATH", "./data/garmin_data.db")
-    log_file = os.getenv("LOG_FILE", "./logs/bot.log")
-
-    Path(database_path).parent.mkdir(parents=True, exist_ok=True)
-    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-
-    # HEALTH_PORT: optional int
-    health_port_raw = os.getenv("HEALTH_PORT")
-    health_port: int | None = None
-    if health_port_raw is not None:
-        try:
-            health_port = int(health_port_raw)
-        except ValueError:
-            raise ConfigError(f"HEALTH_PORT must be an integer, got: {health_port_raw!r}")
-
-    # DAILY_ALERTS: default True, False only if value is "false"
-    daily_alerts_raw = os.getenv("DAILY_ALERTS", "true")
-    daily_alerts = daily_alerts_raw.strip().lower() != "false"
-
-    # SYNC_RETRY_DELAY_MINUTES: default 30
-    sync_retry_delay_minutes = int(os.getenv("SYNC_RETRY_DELAY_MINUTES", "30"))
-
-    # GROQ_API_KEY: optional — nutrition features disabled if absent
-    groq_api_key = os.getenv("GROQ_API_KEY") or None
-
-    # USDA_API_KEY: optional — fallback nutrition lookup for generic ingredients
-    usda_api_key = os.getenv("USDA_API_KEY") or None
-
-    # API_NINJAS_KEY: optional — second fallback nutrition lookup
-    api_ninjas_key = os.getenv("API_NINJAS_KEY") or None
-
-    # Wake detection: poll Garmin for sleep data instead of fixed report time
-    wake_detection_raw = os.getenv("WAKE_DETECTION", "true")
-    wake_detection = wake_detection_raw.strip().lower() != "false"
-    wake_check_interval_minutes = int(os.getenv("WAKE_CHECK_INTERVAL_MINUTES", "10"))
-    wake_check_start = os.getenv("WAKE_CHECK_START", "05:00")
-    wake_check_end = os.getenv("WAKE_CHECK_END", "12:00")
-
-    # Data API: optional read-only HTTP API for external integrations
-    garmin_api_port_raw = os.getenv("GARMIN_API_PORT")
-    garmin_api_port: int | None = None
-    if garmin_api_port_raw is not None:
-        try:
-            garmin_api_port = int(garmin_api_port_raw)
-        except ValueError:
-            raise ConfigError(f"GARMIN_API_PORT must be an integer, got: {garmin_api_port_raw!r}")
-    garmin_api_key = os.getenv("GARMIN_API_KEY") or None
-
-    # FATSECRET: optional — food diary sync disabled if absent
-    fatsecret_consumer_key = os.getenv("FATSECRET_CONSUMER_KEY") or None
-    fatsecret_consumer_secret = os.getenv("FATSECRET_CONSUMER_SECRET") or None
-
-    return Config(
-        garmin_email=required["GARMIN_EMAIL"],  # type: ignore[arg-type]
-        garmin_password=required["GARMIN_PASSWORD"],  # type: ignore[arg-type]
-        telegram_bot_token=required["TELEGRAM_BOT_TOKEN"],  # type: ignore[arg-type]
-        telegram_chat_id=required["TELEGRAM_CHAT_ID"],  # type: ignore[arg-type]
+    database_path = env.get("DATABASE_PATH", "./data/garmin_data.db")
+    log_file = env.get("LOG_FILE", "./logs/bot.log")
+
+    _ensure_dir(os.path.dirname(database_path))
+    _ensure_dir(os.path.dirname(log_file))
+
+    health_port = _parse_int(env.get("HEALTH_PORT"), "HEALTH_PORT", None, 1, 65535)
+    garmin_api_port = _parse_int(env.get("GARMIN_API_PORT"), "GARMIN_API_PORT", None, 1, 65535)
+    sync_retry_delay_minutes = _parse_int(
+        env.get("SYNC_RETRY_DELAY_MINUTES"), "SYNC_RETRY_DELAY_MINUTES", 30, minv=1
+    )
+    wake_check_interval_minutes = _parse_int(
+        env.get("WAKE_CHECK_INTERVAL_MINUTES"), "WAKE_CHECK_INTERVAL_MINUTES", 10, minv=1
+    )
+    garmin_pool_size = _parse_int(env.get("GARMIN_POOL_SIZE"), "GARMIN_POOL_SIZE", 20, minv=1)
+
+    config = Config(
+        garmin_email=garmin_email,  # type: ignore[arg-type]
+        garmin_password=garmin_password,  # type: ignore[arg-type]
+        telegram_bot_token=telegram_bot_token,  # type: ignore[arg-type]
+        telegram_chat_id=telegram_chat_id,  # type: ignore[arg-type]
         database_path=database_path,
-        daily_sync_time=os.getenv("DAILY_SYNC_TIME", "07:00"),
-        daily_report_time=os.getenv("DAILY_REPORT_TIME", "08:00"),
-        weekly_report_day=os.getenv("WEEKLY_REPORT_DAY", "sunday"),
-        weekly_report_time=os.getenv("WEEKLY_REPORT_TIME", "20:00"),
-        timezone=os.getenv("TIMEZONE", "Europe/Lisbon"),
-        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        daily_sync_time=env.get("DAILY_SYNC_TIME", "07:00"),
+        daily_report_time=env.get("DAILY_REPORT_TIME", "08:00"),
+        weekly_report_day=env.get("WEEKLY_REPORT_DAY", "sunday"),
+        weekly_report_time=env.get("WEEKLY_REPORT_TIME", "20:00"),
+        timezone=env.get("TIMEZONE", "Europe/Lisbon"),
+        log_level=env.get("LOG_LEVEL", "INFO"),
         log_file=log_file,
         sync_retry_delay_minutes=sync_retry_delay_minutes,
         health_port=health_port,
-        daily_alerts=daily_alerts,
-        groq_api_key=groq_api_key,
-        usda_api_key=usda_api_key,
-        api_ninjas_key=api_ninjas_key,
-        wake_detection=wake_detection,
+        daily_alerts=_parse_bool(env.get("DAILY_ALERTS"), True),
+        # Optional API keys — the matching feature is disabled when absent
+        groq_api_key=_optional_str(env.get("GROQ_API_KEY")),
+        usda_api_key=_optional_str(env.get("USDA_API_KEY")),
+        api_ninjas_key=_optional_str(env.get("API_NINJAS_KEY")),
+        wake_detection=_parse_bool(env.get("WAKE_DETECTION"), True),
         wake_check_interval_minutes=wake_check_interval_minutes,
-        wake_check_start=wake_check_start,
-        wake_check_end=wake_check_end,
+        wake_check_start=env.get("WAKE_CHECK_START", "05:00"),
+        wake_check_end=env.get("WAKE_CHECK_END", "12:00"),
         garmin_api_port=garmin_api_port,
-        garmin_api_key=garmin_api_key,
-        newsletter_enabled=os.getenv("NEWSLETTER_ENABLED", "true").strip().lower() != "false",
-        fatsecret_consumer_key=fatsecret_consumer_key,
-        fatsecret_consumer_secret=fatsecret_consumer_secret,
+        garmin_api_key=_optional_str(env.get("GARMIN_API_KEY")),
+        newsletter_enabled=_parse_bool(env.get("NEWSLETTER_ENABLED"), True),
+        fatsecret_consumer_key=_optional_str(env.get("FATSECRET_CONSUMER_KEY")),
+        fatsecret_consumer_secret=_optional_str(env.get("FATSECRET_CONSUMER_SECRET")),
+        garmin_pool_size=garmin_pool_size,  # type: ignore[arg-type]
     )
+
+    # Fail fast on malformed values instead of at first scheduler access
+    for attr in (
+        "sync_hour", "report_hour", "weekly_hour", "wake_start_hour", "wake_end_hour", "weekly_day",
+    ):
+        getattr(config, attr)
+
+    return config
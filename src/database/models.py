@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from datetime import UTC, date, datetime
-
-from sqlalchemy import Boolean, Column, Date, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, Date, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.sql.elements import ColumnElement
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch DB-generated defaults back via RETURNING so timestamps stay loaded
+    # on instances used after their session has closed.
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def _utc_now() -> ColumnElement:
+    """UTC timestamp computed by SQLite inside the INSERT, in SQLAlchemy's DateTime format."""
+    return func.strftime("%Y-%m-%d %H:%M:%f", "now")
 
 
 class DailyMetrics(Base):
@@ -17,8 +23,8 @@ class DailyMetrics(Base):
 
     __tablename__ = "daily_metrics"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    date = Column(Date, unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, unique=True, nullable=False)  # UNIQUE already creates an index
     sleep_hours = Column(Float, nullable=True)
     sleep_score = Column(Integer, nullable=True)
     sleep_quality = Column(String(20), nullable=True)
@@ -39,7 +45,7 @@ class DailyMetrics(Base):
     body_battery_low = Column(Integer, nullable=True)
     spo2_avg = Column(Float, nullable=True)
     weight_kg = Column(Float, nullable=True)
-    synced_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    synced_at = Column(DateTime, default=_utc_now())
     garmin_sync_success = Column(Boolean, default=True)
 
     def __repr__(self) -> str:
@@ -50,10 +56,16 @@ class SyncLog(Base):
     """Records each sync attempt with its outcome."""
 
     __tablename__ = "sync_log"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    sync_date = Column(DateTime, default=lambda: datetime.now(UTC))
-    status = Column(String(20), nullable=False)  # "success" | "partial" | "error"
+    # Serves the has_*_today checks and "latest sync with status X" lookups
+    __table_args__ = (Index("ix_sync_log_status_date", "status", "sync_date"),)
+
+    id = Column(Integer, primary_key=True)
+    sync_date = Column(DateTime, default=_utc_now())
+    status = Column(
+        Enum("success", "partial", "error", "report_sent", name="sync_status",
+             length=20, create_constraint=True, validate_strings=True),
+        nullable=False,
+    )
     error_message = Column(Text, nullable=True)
 
     def __repr__(self) -> str:
@@ -63,10 +75,10 @@ class SyncLog(Base):
 class UserGoal(Base):
     """User-defined health targets."""
     __tablename__ = "user_goals"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     metric = Column(String(30), unique=True, nullable=False)  # "steps" | "sleep_hours"
     target_value = Column(Float, nullable=False)
-    updated_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    updated_at = Column(DateTime, default=_utc_now())
 
     def __repr__(self) -> str:
         return f"<UserGoal {self.metric}={self.target_value}>"
@@ -74,8 +86,10 @@ class UserGoal(Base):
 
 class FoodEntry(Base):
     __tablename__ = "food_entries"
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    date = Column(Date, nullable=False, index=True)
+    # Serves "entries for a day ordered by created_at" without a separate sort
+    __table_args__ = (Index("ix_food_date_created", "date", "created_at"),)
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False)
     name = Column(String(200), nullable=False)
     quantity = Column(Float, nullable=False, default=1.0)
     unit = Column(String(20), nullable=False, default="un")
@@ -86,15 +100,15 @@ class FoodEntry(Base):
     fiber_g = Column(Float, nullable=True)
     source = Column(String(30), nullable=False, default="openfoodfacts")
     barcode = Column(String(50), nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(DateTime, default=_utc_now())
 
 
 class MealPreset(Base):
     """A named collection of food items that can be quickly registered."""
     __tablename__ = "meal_presets"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), unique=True, nullable=False, index=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(DateTime, default=_utc_now())
     items = relationship("MealPresetItem", back_populates="preset",
                          cascade="all, delete-orphan", order_by="MealPresetItem.id")
 
@@ -105,7 +119,7 @@ class MealPreset(Base):
 class MealPresetItem(Base):
     """One food item belonging to a MealPreset."""
     __tablename__ = "meal_preset_items"
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     preset_id = Column(Integer, ForeignKey("meal_presets.id"), nullable=False, index=True)
     name = Column(String(200), nullable=False)
     quantity = Column(Float, nullable=False, default=1.0)
@@ -127,7 +141,7 @@ class UserSetting(Base):
 
     key = Column(String(100), primary_key=True)
     value = Column(Text, nullable=False)
-    updated_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    updated_at = Column(DateTime, default=_utc_now())
 
     def __repr__(self) -> str:
         return f"<UserSetting {self.key!r}={self.value!r}>"
@@ -137,10 +151,10 @@ class TrainingEntry(Base):
     """Records a training session done by the user on a given day."""
     __tablename__ = "training_entries"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     date = Column(Date, unique=True, nullable=False, index=True)
     description = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(DateTime, default=_utc_now())
 
     def __repr__(self) -> str:
         return f"<TrainingEntry date={self.date} description={self.description!r}>"
@@ -164,7 +178,7 @@ class GarminActivity(Base):
     total_reps = Column(Integer, nullable=True)
     min_weight_kg = Column(Float, nullable=True)
     max_weight_kg = Column(Float, nullable=True)
-    synced_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    synced_at = Column(DateTime, default=_utc_now())
 
     def __repr__(self) -> str:
         return f"<GarminActivity id={self.garmin_activity_id} date={self.date} name={self.name!r}>"
@@ -174,10 +188,10 @@ class WaistEntry(Base):
     """Records a waist circumference measurement for a given day."""
     __tablename__ = "waist_entries"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     date = Column(Date, unique=True, nullable=False, index=True)
     waist_cm = Column(Float, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(DateTime, default=_utc_now())
 
     def __repr__(self) -> str:
         return f"<WaistEntry date={self.date} waist_cm={self.waist_cm}>"
@@ -187,10 +201,10 @@ class WaterEntry(Base):
     """Records a water intake entry for a given day (multiple entries allowed)."""
     __tablename__ = "water_entries"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     date = Column(Date, nullable=False, index=True)
     ml = Column(Integer, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(DateTime, default=_utc_now())
 
     def __repr__(self) -> str:
         return f"<WaterEntry date={self.date} ml={self.ml}>"
@@ -203,13 +217,38 @@ class FoodCache(Base):
     query_text = Column(String(500), primary_key=True)  # lower-cased, stripped
     items_json = Column(Text, nullable=False)            # JSON list of FoodItemResult dicts
     use_count = Column(Integer, default=1, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
-    last_used_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(DateTime, default=_utc_now())
+    last_used_at = Column(DateTime, default=_utc_now())
 
     def __repr__(self) -> str:
         return f"<FoodCache query={self.query_text!r} use_count={self.use_count}>"
 
 
+class BarcodeCache(Base):
+    """Cache for OpenFoodFacts barcode lookups (per-100g data), keyed by barcode."""
+    __tablename__ = "barcode_cache"
+
+    barcode = Column(String(32), primary_key=True)
+    nutrition_json = Column(Text, nullable=False)  # JSON of a NutritionData dict
+    fetched_at = Column(DateTime, default=_utc_now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<BarcodeCache barcode={self.barcode!r} fetched_at={self.fetched_at}>"
+
+
+class FoodLookupCache(Base):
+    """Cache for per-food-name nutrition lookups (API hit or LLM estimate, per 100g)."""
+    __tablename__ = "food_lookup_cache"
+
+    name = Column(String(500), primary_key=True)   # case-folded, whitespace-collapsed
+    source = Column(String(20), nullable=False)    # "openfoodfacts" | "usda" | "api_ninjas" | "llm_estimate"
+    nutrition_json = Column(Text, nullable=False)  # JSON of a NutritionData dict
+    fetched_at = Column(DateTime, default=_utc_now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<FoodLookupCache name={self.name!r} source={self.source}>"
+
+
 class NewsletterPost(Base):
     """A scraped post from The Pump (Arnold's newsletter)."""
     __tablename__ = "newsletter_posts"
@@ -218,7 +257,7 @@ class NewsletterPost(Base):
     title = Column(String(300), nullable=False)
     published_date = Column(Date, nullable=True)
     content_text = Column(Text, nullable=False)
-    scraped_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    scraped_at = Column(DateTime, default=_utc_now())
 
     def __repr__(self) -> str:
         return f"<NewsletterPost title={self.title!r} date={self.published_date}>"
@@ -228,13 +267,13 @@ class NewsletterInsight(Base):
     """LLM-generated insight from a newsletter post, stored for delivery via /sync."""
     __tablename__ = "newsletter_insights"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     # post_url is None for the one-time historical summary
     post_url = Column(String(500), ForeignKey("newsletter_posts.url"), nullable=True)
     insight_type = Column(String(20), nullable=False)  # "daily" | "historical"
     insight_pt = Column(Text, nullable=False)           # final Portuguese text
     metrics_context = Column(Text, nullable=True)       # JSON snapshot of metrics used
-    generated_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    generated_at = Column(DateTime, default=_utc_now())
     sent = Column(Boolean, default=False)
 
     def __repr__(self) -> str:
@@ -3,17 +3,64 @@
 from __future__ import annotations
 
 import logging
+import time
 from contextlib import contextmanager
 from datetime import UTC, date, datetime, timedelta
-from typing import Any, Generator
+from typing import Any, Generator, Iterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine, event, func, insert, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from .models import Base, DailyMetrics, FoodCache, FoodEntry, GarminActivity, MealPreset, MealPresetItem, NewsletterInsight, NewsletterPost, SyncLog, TrainingEntry, UserGoal, UserSetting, WaistEntry, WaterEntry
+from .models import Base, BarcodeCache, DailyMetrics, FoodCache, FoodEntry, FoodLookupCache, GarminActivity, MealPreset, MealPresetItem, NewsletterInsight, NewsletterPost, SyncLog, TrainingEntry, UserGoal, UserSetting, WaistEntry, WaterEntry
 
 logger = logging.getLogger(__name__)
 
+_DM_COLS = frozenset(DailyMetrics.__table__.columns.keys())
+_FOOD_COLS = frozenset(FoodEntry.__table__.columns.keys())
+# Columns a caller-supplied metrics dict may set; id/date are owned by the repository
+_DM_WRITABLE = _DM_COLS - {"id", "date"}
+
+# get_goals is hit by every report; goals only change via set_goal
+_GOALS_TTL_SECONDS = 60
+
+# Barcode/food-name → nutrition data barely changes; look it up again after this
+_LOOKUP_CACHE_MAX_AGE_DAYS = 30
+
+# Applied to every new SQLite connection. synchronous=NORMAL is durable under WAL
+# (only the last transactions can be lost on power failure, never corrupted).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",       # ~20 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=67108864",      # 64 MB; container runs with a 256 MB limit
+)
+
+
+def _food_rows(day: date, entries: list[dict]) -> list[dict[str, Any]]:
+    """Restrict food entry dicts to FoodEntry columns and stamp them with *day*."""
+    return [{**{k: e[k] for k in _FOOD_COLS & e.keys()}, "date": day} for e in entries]
+
+
+def _normalise_food_name(name: str) -> str:
+    """Cache key for a food name: case-folded with whitespace collapsed."""
+    return " ".join(name.casefold().split())
+
+
+def _configure_connection(dbapi_conn: Any, read_only: bool) -> None:
+    """Switch the database to WAL and apply per-connection tuning PRAGMAs."""
+    cursor = dbapi_conn.cursor()
+    try:
+        # journal_mode is persistent and needs write access; read-only
+        # connections inherit whatever the writer set.
+        if not read_only:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        for pragma in _CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class Repository:
     """Handles all database operations using SQLAlchemy."""
@@ -27,9 +74,28 @@ class Repository:
             url = f"sqlite:///file:{posix_path}?mode=ro&uri=true"
         else:
             url = f"sqlite:///{database_path}"
-        self._engine = create_engine(url, connect_args={"check_same_thread": False})
+        # Keep connections open across sessions (QueuePool) instead of reopening
+        # the .db/-wal/-shm files per call; WAL lets the pooled readers run
+        # alongside the single writer, which waits up to 30 s for the lock.
+        # check_same_thread=False is required, not a workaround: a pooled connection
+        # is checked out by whichever thread (scheduler, PTB loop, executor) opens
+        # the next session, but never by two threads at once.
+        self._engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False, "timeout": 30},
+            poolclass=QueuePool,
+            pool_size=4,
+            max_overflow=4,
+        )
+        event.listen(
+            self._engine, "connect",
+            lambda dbapi_conn, _record: _configure_connection(dbapi_conn, read_only),
+        )
         # expire_on_commit=False lets ORM objects be used after session.close()
         self._Session = sessionmaker(bind=self._engine, expire_on_commit=False)
+        # (monotonic timestamp, goals) — see get_goals
+        self._goals_cache: tuple[float, dict[str, float]] | None = None
+        self._today_cache: tuple[date, datetime] | None = None
 
     def init_database(self) -> None:
         """Create all tables if they don't already exist."""
@@ -73,6 +139,20 @@ class Repository:
             if "food_entries" not in inspector.get_table_names():
                 FoodEntry.__table__.create(self._engine)
                 logger.info("Migration: created table food_entries")
+            # ix_food_date_created covers food_entries.date, so its single-column
+            # index is redundant
+            for index in (*FoodEntry.__table__.indexes, *SyncLog.__table__.indexes):
+                index.create(conn, checkfirst=True)
+            conn.execute(text("DROP INDEX IF EXISTS ix_food_entries_date"))
+            # Databases created before the UNIQUE constraint moved onto the column
+            # rely on ix_daily_metrics_date (a UNIQUE index) for uniqueness and as
+            # the upsert conflict target — keep it, and recreate it if it's missing
+            unique_cols = [u["column_names"] for u in inspector.get_unique_constraints("daily_metrics")]
+            unique_cols += [i["column_names"] for i in inspector.get_indexes("daily_metrics") if i["unique"]]
+            if ["date"] not in unique_cols:
+                conn.execute(text("CREATE UNIQUE INDEX ix_daily_metrics_date ON daily_metrics (date)"))
+                logger.info("Migration: created unique index ix_daily_metrics_date")
+            conn.commit()
             # Create meal preset tables if missing
             table_names = inspector.get_table_names()
             if "meal_presets" not in table_names:
@@ -113,6 +193,12 @@ class Repository:
             if "food_cache" not in table_names:
                 FoodCache.__table__.create(self._engine)
                 logger.info("Migration: created table food_cache")
+            if "barcode_cache" not in table_names:
+                BarcodeCache.__table__.create(self._engine)
+                logger.info("Migration: created table barcode_cache")
+            if "food_lookup_cache" not in table_names:
+                FoodLookupCache.__table__.create(self._engine)
+                logger.info("Migration: created table food_lookup_cache")
             if "newsletter_posts" not in table_names:
                 NewsletterPost.__table__.create(self._engine)
                 logger.info("Migration: created table newsletter_posts")
@@ -143,18 +229,15 @@ class Repository:
             day: Calendar date the metrics belong to.
             metrics: Dict with keys matching DailyMetrics columns.
         """
+        values = {k: metrics[k] for k in _DM_WRITABLE & metrics.keys()}
+        stmt = sqlite_insert(DailyMetrics).values(date=day, **values)
+        # On an existing day only overwrite the supplied columns (plus synced_at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DailyMetrics.date],
+            set_={**{k: stmt.excluded[k] for k in values}, "synced_at": stmt.excluded.synced_at},
+        )
         with self._session() as session:
-            existing = session.query(DailyMetrics).filter_by(date=day).first()
-            if existing:
-                for key, value in metrics.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-                existing.synced_at = datetime.now(UTC)
-            else:
-                row = DailyMetrics(date=day, synced_at=datetime.now(UTC), **{
-                    k: v for k, v in metrics.items() if hasattr(DailyMetrics, k)
-                })
-                session.add(row)
+            session.execute(stmt)
         logger.debug("Saved metrics for %s", day)
 
     def log_sync(self, status: str, error_message: str | None = None) -> None:
@@ -166,7 +249,6 @@ class Repository:
         """
         with self._session() as session:
             session.add(SyncLog(
-                sync_date=datetime.now(UTC),
                 status=status,
                 error_message=error_message,
             ))
@@ -195,64 +277,80 @@ class Repository:
 
         Returns a dict with avg/min/max/total values for sleep and activity.
         """
-        start = end_date - timedelta(days=6)
-        rows = self.get_metrics_range(start, end_date)
+        with self._session() as session:
+            return self._weekly_stats(session, end_date)
 
-        if not rows:
+    @staticmethod
+    def _weekly_stats(session: Session, end_date: date) -> dict[str, Any]:
+        start = end_date - timedelta(days=6)
+        in_range = DailyMetrics.date.between(start, end_date)
+        agg = session.execute(
+            select(
+                func.count(),
+                func.avg(DailyMetrics.sleep_hours),
+                func.avg(DailyMetrics.sleep_score),
+                func.avg(DailyMetrics.steps),
+                func.sum(DailyMetrics.steps),
+                func.sum(DailyMetrics.active_calories),
+                func.sum(DailyMetrics.resting_calories),
+            ).where(in_range)
+        ).one()
+        if not agg[0]:
             return {}
 
-        sleep_hours = [r.sleep_hours for r in rows if r.sleep_hours is not None]
-        sleep_scores = [r.sleep_score for r in rows if r.sleep_score is not None]
-        steps = [r.steps for r in rows if r.steps is not None]
-        active_cals = [r.active_calories for r in rows if r.active_calories is not None]
-        resting_cals = [r.resting_calories for r in rows if r.resting_calories is not None]
-
-        def _avg(lst: list) -> float | None:
-            return round(sum(lst) / len(lst), 2) if lst else None
-
-        # Find best/worst sleep day
-        best_sleep_row = max((r for r in rows if r.sleep_hours), key=lambda r: r.sleep_hours, default=None)
-        worst_sleep_row = min((r for r in rows if r.sleep_hours), key=lambda r: r.sleep_hours, default=None)
-
+        # Best/worst sleep day; ties resolve to the earliest date
+        slept = select(DailyMetrics.date, DailyMetrics.sleep_hours).where(
+            in_range, DailyMetrics.sleep_hours != 0
+        )
+        best = session.execute(
+            slept.order_by(DailyMetrics.sleep_hours.desc(), DailyMetrics.date).limit(1)
+        ).first()
+        worst = session.execute(
+            slept.order_by(DailyMetrics.sleep_hours, DailyMetrics.date).limit(1)
+        ).first()
+
+        days, sleep_avg, score_avg, steps_avg, steps_total, active_total, resting_total = agg
         return {
             "start_date": start,
             "end_date": end_date,
-            "days_with_data": len(rows),
-            "sleep_avg_hours": _avg(sleep_hours),
-            "sleep_avg_score": round(sum(sleep_scores) / len(sleep_scores)) if sleep_scores else None,
-            "sleep_best_hours": best_sleep_row.sleep_hours if best_sleep_row else None,
-            "sleep_best_day": best_sleep_row.date if best_sleep_row else None,
-            "sleep_worst_hours": worst_sleep_row.sleep_hours if worst_sleep_row else None,
-            "sleep_worst_day": worst_sleep_row.date if worst_sleep_row else None,
-            "steps_avg": int(_avg(steps)) if steps else None,
-            "steps_total": sum(steps) if steps else None,
-            "active_calories_total": sum(active_cals) if active_cals else None,
-            "resting_calories_total": sum(resting_cals) if resting_cals else None,
+            "days_with_data": days,
+            "sleep_avg_hours": round(sleep_avg, 2) if sleep_avg is not None else None,
+            "sleep_avg_score": round(score_avg) if score_avg is not None else None,
+            "sleep_best_hours": best.sleep_hours if best else None,
+            "sleep_best_day": best.date if best else None,
+            "sleep_worst_hours": worst.sleep_hours if worst else None,
+            "sleep_worst_day": worst.date if worst else None,
+            "steps_avg": int(round(steps_avg, 2)) if steps_avg is not None else None,
+            "steps_total": steps_total,
+            "active_calories_total": active_total,
+            "resting_calories_total": resting_total,
         }
 
     def get_monthly_stats(self, end_date: date) -> dict[str, Any]:
         """Calculate 30-day averages ending on end_date (inclusive)."""
         start = end_date - timedelta(days=29)
-        rows = self.get_metrics_range(start, end_date)
-
-        if not rows:
+        with self._session() as session:
+            days, sleep_avg, steps_avg, steps_total, active_total = session.execute(
+                select(
+                    func.count(),
+                    func.avg(DailyMetrics.sleep_hours),
+                    func.avg(DailyMetrics.steps),
+                    func.sum(DailyMetrics.steps),
+                    func.sum(DailyMetrics.active_calories),
+                ).where(DailyMetrics.date.between(start, end_date))
+            ).one()
+
+        if not days:
             return {}
 
-        sleep_hours = [r.sleep_hours for r in rows if r.sleep_hours is not None]
-        steps = [r.steps for r in rows if r.steps is not None]
-        active_cals = [r.active_calories for r in rows if r.active_calories is not None]
-
-        def _avg(lst: list) -> float | None:
-            return round(sum(lst) / len(lst), 2) if lst else None
-
         return {
             "start_date": start,
             "end_date": end_date,
-            "days_with_data": len(rows),
-            "sleep_avg_hours": _avg(sleep_hours),
-            "steps_avg": int(_avg(steps)) if steps else None,
-            "steps_total": sum(steps) if steps else None,
-            "active_calories_total": sum(active_cals) if active_cals else None,
+            "days_with_data": days,
+            "sleep_avg_hours": round(sleep_avg, 2) if sleep_avg is not None else None,
+            "steps_avg": int(round(steps_avg, 2)) if steps_avg is not None else None,
+            "steps_total": steps_total,
+            "active_calories_total": active_total,
         }
 
     def get_recent_sync_logs(self, limit: int = 5) -> list[SyncLog]:
@@ -260,7 +358,7 @@ class Repository:
         with self._session() as session:
             return (
                 session.query(SyncLog)
-                .order_by(SyncLog.sync_date.desc())
+                .order_by(SyncLog.sync_date.desc(), SyncLog.id.desc())
                 .limit(limit)
                 .all()
             )
@@ -271,76 +369,107 @@ class Repository:
             return (
                 session.query(SyncLog)
                 .filter_by(status="success")
-                .order_by(SyncLog.sync_date.desc())
+                .order_by(SyncLog.sync_date.desc(), SyncLog.id.desc())
                 .first()
             )
 
     def count_stored_days(self) -> int:
         """Return total number of days stored in daily_metrics."""
         with self._session() as session:
-            return session.query(DailyMetrics).count()
+            return session.execute(select(func.count()).select_from(DailyMetrics)).scalar_one()
+
+    def _today_start(self) -> datetime:
+        """Return midnight UTC of the current day, recomputed only when the day changes."""
+        now = datetime.now(UTC)
+        cached = self._today_cache
+        if cached and cached[0] == now.date():
+            return cached[1]
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._today_cache = (now.date(), today_start)
+        return today_start
+
+    def _logged_today(self, status: str) -> bool:
+        """Return True if a sync_log row with *status* exists for today (UTC)."""
+        stmt = select(
+            select(SyncLog.id)
+            .where(SyncLog.status == status, SyncLog.sync_date >= self._today_start())
+            .exists()
+        )
+        with self._session() as session:
+            return session.execute(stmt).scalar_one()
 
     def has_successful_sync_today(self) -> bool:
         """Return True if there is a successful sync log entry for today (UTC)."""
-        today_start = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-        with self._session() as session:
-            result = (
-                session.query(SyncLog)
-                .filter(SyncLog.status == "success", SyncLog.sync_date >= today_start)
-                .first()
-            )
-            return result is not None
+        return self._logged_today("success")
 
     def has_report_sent_today(self) -> bool:
         """Return True if a daily report was already sent today (UTC)."""
-        today_start = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-        with self._session() as session:
-            result = (
-                session.query(SyncLog)
-                .filter(SyncLog.status == "report_sent", SyncLog.sync_date >= today_start)
-                .first()
-            )
-            return result is not None
+        return self._logged_today("report_sent")
 
     def log_report_sent(self) -> None:
-        """Record that the daily report was sent today."""
-        self.log_sync("report_sent")
+        """Record that the daily report was sent today (at most one row per UTC day).
+
+        The existence check and the insert run as a single INSERT ... SELECT ...
+        WHERE NOT EXISTS statement.
+        """
+        already_sent = (
+            select(SyncLog.id)
+            .where(SyncLog.status == "report_sent", SyncLog.sync_date >= self._today_start())
+            .exists()
+        )
+        stmt = insert(SyncLog).from_select(
+            ["sync_date", "status"],
+            select(literal(datetime.now(UTC), DateTime), literal("report_sent")).where(~already_sent),
+        )
+        with self._session() as session:
+            session.execute(stmt)
+
+    def _existing_dates(self, start_date: date, end_date: date) -> set[date]:
+        """Return the dates in [start_date, end_date] that have a daily_metrics row."""
+        stmt = select(DailyMetrics.date).where(DailyMetrics.date.between(start_date, end_date))
+        with self._session() as session:
+            return set(session.execute(stmt).scalars())
 
     def get_missing_dates(self, start_date: date, end_date: date) -> list[date]:
         """Return dates in [start_date, end_date] that have no entry in daily_metrics."""
-        rows = self.get_metrics_range(start_date, end_date)
-        existing = {r.date for r in rows}
-        current = start_date
-        missing = []
-        while current <= end_date:
-            if current not in existing:
-                missing.append(current)
-            current += timedelta(days=1)
-        return missing
-
-    def get_all_metrics(self, limit_days: int | None = None) -> list:
-        """Return all daily_metrics rows ordered by date, optionally limited to last N days."""
+        existing = self._existing_dates(start_date, end_date)
+        all_days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        return [d for d in all_days if d not in existing]
+
+    def iter_all_metrics(self, limit_days: int | None = None) -> Iterator[DailyMetrics]:
+        """Yield daily_metrics rows oldest first, optionally limited to the last N days.
+
+        Rows are streamed in batches of 500, so the session stays open until the
+        iterator is exhausted or closed.
+        """
         with self._session() as session:
-            q = session.query(DailyMetrics).order_by(DailyMetrics.date.desc())
+            q = session.query(DailyMetrics)
             if limit_days:
-                q = q.limit(limit_days)
-            rows = q.all()
-            return list(reversed(rows))
+                latest = (
+                    select(DailyMetrics.id)
+                    .order_by(DailyMetrics.date.desc())
+                    .limit(limit_days)
+                    .scalar_subquery()
+                )
+                q = q.filter(DailyMetrics.id.in_(latest))
+            yield from q.order_by(DailyMetrics.date).yield_per(500)
 
     def get_goals(self) -> dict[str, float]:
         """Return all user goals as {metric: target_value}. Uses defaults if not set."""
-        from .models import UserGoal
+        cached = self._goals_cache
+        if cached and time.monotonic() - cached[0] < _GOALS_TTL_SECONDS:
+            return dict(cached[1])
         defaults = {"steps": 10000.0, "sleep_hours": 7.0}
         with self._session() as session:
             rows = session.query(UserGoal).all()
             result = dict(defaults)
             for row in rows:
                 result[row.metric] = row.target_value
-            return result
+        self._goals_cache = (time.monotonic(), result)
+        return dict(result)
 
     def set_goal(self, metric: str, target_value: float) -> None:
         """Insert or update a user goal."""
-        from .models import UserGoal
         with self._session() as session:
             existing = session.query(UserGoal).filter_by(metric=metric).first()
             if existing:
@@ -348,11 +477,22 @@ class Repository:
                 existing.updated_at = datetime.now(UTC)
             else:
                 session.add(UserGoal(metric=metric, target_value=target_value))
+        self._goals_cache = None
 
     def get_previous_weekly_stats(self, end_date: date) -> dict:
         """Calculate stats for the 7 days ending 7 days before end_date (the prior week)."""
         prev_end = end_date - timedelta(days=7)
-        return self.get_weekly_stats(prev_end)
+        with self._session() as session:
+            return self._weekly_stats(session, prev_end)
+
+    def get_weekly_report_stats(self, end_date: date) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """Return (this week, previous week, weight) stats for end_date in a single session."""
+        with self._session() as session:
+            return (
+                self._weekly_stats(session, end_date),
+                self._weekly_stats(session, end_date - timedelta(days=7)),
+                self._weekly_weight_stats(session, end_date),
+            )
 
     # ------------------------------------------------------------------ #
     # Weight operations                                                     #
@@ -375,7 +515,9 @@ class Repository:
     def get_latest_weight(self, before_date: date | None = None) -> tuple[float | None, date | None]:
         """Return the most recent (weight_kg, date) pair, or (None, None)."""
         with self._session() as session:
-            q = session.query(DailyMetrics).filter(DailyMetrics.weight_kg.isnot(None))
+            q = session.query(DailyMetrics.weight_kg, DailyMetrics.date).filter(
+                DailyMetrics.weight_kg.isnot(None)
+            )
             if before_date:
                 q = q.filter(DailyMetrics.date <= before_date)
             row = q.order_by(DailyMetrics.date.desc()).first()
@@ -390,22 +532,33 @@ class Repository:
         delta, min_weight, max_weight, entries_count.
         Empty dict if no weight data.
         """
-        start = end_date - timedelta(days=6)
-        rows = self.get_metrics_range(start, end_date)
-        weight_rows = [(r.weight_kg, r.date) for r in rows if r.weight_kg is not None]
+        with self._session() as session:
+            return self._weekly_weight_stats(session, end_date)
 
-        if not weight_rows:
+    @staticmethod
+    def _weekly_weight_stats(session: Session, end_date: date) -> dict[str, Any]:
+        start = end_date - timedelta(days=6)
+        prev_start = start - timedelta(days=7)
+        has_weight = DailyMetrics.weight_kg.isnot(None)
+        latest = select(DailyMetrics.weight_kg, DailyMetrics.date).where(has_weight)
+        latest = latest.order_by(DailyMetrics.date.desc()).limit(1)
+        min_weight, max_weight, entries_count = session.execute(
+            select(
+                func.min(DailyMetrics.weight_kg),
+                func.max(DailyMetrics.weight_kg),
+                func.count(),
+            ).where(has_weight, DailyMetrics.date.between(start, end_date))
+        ).one()
+        if not entries_count:
             return {}
-
-        weights = [w for w, _ in weight_rows]
-        current_weight, current_date = weight_rows[-1]
-
+        current_weight, current_date = session.execute(
+            latest.where(DailyMetrics.date.between(start, end_date))
+        ).one()
         # Previous week's last weight for delta
-        prev_start = start - timedelta(days=7)
-        prev_rows = self.get_metrics_range(prev_start, start - timedelta(days=1))
-        prev_weight_rows = [(r.weight_kg, r.date) for r in prev_rows if r.weight_kg is not None]
-        prev_weight = prev_weight_rows[-1][0] if prev_weight_rows else None
-        prev_date = prev_weight_rows[-1][1] if prev_weight_rows else None
+        prev = session.execute(
+            latest.where(DailyMetrics.date.between(prev_start, start - timedelta(days=1)))
+        ).first()
+        prev_weight, prev_date = prev if prev else (None, None)
 
         delta = round(current_weight - prev_weight, 1) if prev_weight is not None else None
 
@@ -415,9 +568,9 @@ class Repository:
             "prev_weight": prev_weight,
             "prev_date": prev_date,
             "delta": delta,
-            "min_weight": min(weights),
-            "max_weight": max(weights),
-            "entries_count": len(weight_rows),
+            "min_weight": min_weight,
+            "max_weight": max_weight,
+            "entries_count": entries_count,
         }
 
     def get_recent_weight_records(self, limit: int = 10) -> list[tuple[date, float]]:
@@ -511,14 +664,18 @@ class Repository:
 
     def save_food_entries(self, day: date, entries: list[dict]) -> list[int]:
         """Save multiple food entries for a day. Returns list of IDs."""
-        ids = []
+        if not entries:
+            return []
+        stmt = insert(FoodEntry).returning(FoodEntry.id, sort_by_parameter_order=True)
         with self._session() as session:
-            for entry in entries:
-                row = FoodEntry(date=day, **{k: v for k, v in entry.items() if hasattr(FoodEntry, k)})
-                session.add(row)
-                session.flush()
-                ids.append(row.id)
-        return ids
+            return list(session.scalars(stmt, _food_rows(day, entries)))
+
+    def save_food_entries_no_ids(self, day: date, entries: list[dict]) -> None:
+        """Save multiple food entries for a day as one executemany INSERT (no RETURNING)."""
+        if not entries:
+            return
+        with self._session() as session:
+            session.execute(insert(FoodEntry), _food_rows(day, entries))
 
     def upsert_fatsecret_entries(self, day: date, entries: list[dict]) -> dict:
         """Upsert FatSecret diary entries for a day.
@@ -541,7 +698,7 @@ class Repository:
                 barcode = entry.get("barcode")
                 if barcode is None:
                     # No dedup key — insert without lookup to avoid matching null-barcode rows
-                    row = FoodEntry(date=day, **{k: v for k, v in entry.items() if hasattr(FoodEntry, k)})
+                    row = FoodEntry(date=day, **{k: entry[k] for k in (_FOOD_COLS & entry.keys()) - {"date"}})
                     session.add(row)
                     inserted += 1
                     continue
@@ -557,7 +714,7 @@ class Repository:
                             setattr(existing, field, entry[field])
                     updated += 1
                 else:
-                    row = FoodEntry(date=day, **{k: v for k, v in entry.items() if hasattr(FoodEntry, k)})
+                    row = FoodEntry(date=day, **{k: entry[k] for k in (_FOOD_COLS & entry.keys()) - {"date"}})
                     session.add(row)
                     inserted += 1
         return {"inserted": inserted, "updated": updated}
@@ -568,7 +725,7 @@ class Repository:
             return (
                 session.query(FoodEntry)
                 .filter_by(date=day)
-                .order_by(FoodEntry.created_at)
+                .order_by(FoodEntry.created_at, FoodEntry.id)
                 .all()
             )
 
@@ -578,7 +735,7 @@ class Repository:
             return (
                 session.query(FoodEntry)
                 .filter(FoodEntry.date >= start_date, FoodEntry.date <= end_date)
-                .order_by(FoodEntry.date, FoodEntry.created_at)
+                .order_by(FoodEntry.date, FoodEntry.created_at, FoodEntry.id)
                 .all()
             )
 
@@ -588,7 +745,7 @@ class Repository:
             row = (
                 session.query(FoodEntry)
                 .filter_by(date=day)
-                .order_by(FoodEntry.created_at.desc())
+                .order_by(FoodEntry.created_at.desc(), FoodEntry.id.desc())
                 .first()
             )
             if row:
@@ -676,6 +833,54 @@ class Repository:
                 entry.last_used_at = datetime.now(UTC)
         logger.debug("Food cache set for query %r", normalized)
 
+    def get_barcode_cache(self, barcode: str) -> dict | None:
+        """Return the cached NutritionData dict for *barcode*, or None if missing or stale."""
+        import json
+        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=_LOOKUP_CACHE_MAX_AGE_DAYS)
+        with self._session() as session:
+            entry = session.get(BarcodeCache, barcode)
+            if entry is None or entry.fetched_at < cutoff:
+                return None
+            return json.loads(entry.nutrition_json)
+
+    def set_barcode_cache(self, barcode: str, nutrition: dict) -> None:
+        """Store or refresh the OpenFoodFacts result for *barcode*."""
+        import json
+        nutrition_json = json.dumps(nutrition, ensure_ascii=False)
+        with self._session() as session:
+            entry = session.get(BarcodeCache, barcode)
+            if entry is None:
+                session.add(BarcodeCache(barcode=barcode, nutrition_json=nutrition_json))
+            else:
+                entry.nutrition_json = nutrition_json
+                entry.fetched_at = datetime.now(UTC).replace(tzinfo=None)
+        logger.debug("Barcode cache set for %s", barcode)
+
+    def get_food_lookup_cache(self, name: str) -> tuple[dict, str] | None:
+        """Return (NutritionData dict, source) cached for a food name, or None if missing or stale."""
+        import json
+        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=_LOOKUP_CACHE_MAX_AGE_DAYS)
+        with self._session() as session:
+            entry = session.get(FoodLookupCache, _normalise_food_name(name))
+            if entry is None or entry.fetched_at < cutoff:
+                return None
+            return json.loads(entry.nutrition_json), entry.source
+
+    def set_food_lookup_cache(self, name: str, nutrition: dict, source: str) -> None:
+        """Store or refresh the per-100g lookup result for a food name."""
+        import json
+        normalized = _normalise_food_name(name)
+        nutrition_json = json.dumps(nutrition, ensure_ascii=False)
+        with self._session() as session:
+            entry = session.get(FoodLookupCache, normalized)
+            if entry is None:
+                session.add(FoodLookupCache(name=normalized, source=source, nutrition_json=nutrition_json))
+            else:
+                entry.source = source
+                entry.nutrition_json = nutrition_json
+                entry.fetched_at = datetime.now(UTC).replace(tzinfo=None)
+        logger.debug("Food lookup cache set for %r (%s)", normalized, source)
+
     # ------------------------------------------------------------------ #
     # Meal preset operations                                               #
     # ------------------------------------------------------------------ #
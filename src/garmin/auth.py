@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 TOKEN_FILE = Path("./data/garmin_tokens.json")
 
+# (mtime, contents) of TOKEN_FILE as last read or written by this process
+_TOKEN_CACHE: tuple[float, str] | None = None
+
 
 def _is_rate_limit(exc: BaseException) -> bool:
     return "429" in str(exc)
@@ -54,11 +57,17 @@ def create_garmin_client(email: str, password: str) -> garminconnect.Garmin:
     Raises:
         Exception: If authentication fails after 3 attempts.
     """
+    global _TOKEN_CACHE
     client = garminconnect.Garmin(email, password)
 
     if TOKEN_FILE.exists():
         try:
-            token_str = TOKEN_FILE.read_text(encoding="utf-8")
+            mtime = TOKEN_FILE.stat().st_mtime
+            if _TOKEN_CACHE and _TOKEN_CACHE[0] == mtime:
+                token_str = _TOKEN_CACHE[1]
+            else:
+                token_str = TOKEN_FILE.read_text(encoding="utf-8")
+                _TOKEN_CACHE = (mtime, token_str)
             client.garth.loads(token_str)
             client.display_name = client.garth.profile.get("displayName")
             logger.info("Garmin: reused existing token (user=%s)", client.display_name)
@@ -66,6 +75,7 @@ def create_garmin_client(email: str, password: str) -> garminconnect.Garmin:
         except Exception as exc:
             logger.warning("Garmin: saved token invalid (%s), re-authenticating", exc)
             TOKEN_FILE.unlink(missing_ok=True)
+            _TOKEN_CACHE = None
 
     client.login()
     _save_token(client)
@@ -74,9 +84,13 @@ def create_garmin_client(email: str, password: str) -> garminconnect.Garmin:
 
 
 def _save_token(client: garminconnect.Garmin) -> None:
-    """Persist the OAuth2 token to disk."""
+    """Persist the OAuth2 token to disk, skipping the write if it is unchanged."""
+    global _TOKEN_CACHE
     try:
         token_data = client.garth.dumps()
+        if _TOKEN_CACHE and _TOKEN_CACHE[1] == token_data and TOKEN_FILE.exists():
+            logger.debug("Garmin token unchanged, not rewriting %s", TOKEN_FILE)
+            return
         TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
         TOKEN_FILE.write_text(token_data, encoding="utf-8")
         # Restrict file permissions on Unix-like systems
@@ -84,6 +98,7 @@ def _save_token(client: garminconnect.Garmin) -> None:
             os.chmod(TOKEN_FILE, 0o600)
         except OSError:
             pass
+        _TOKEN_CACHE = (TOKEN_FILE.stat().st_mtime, token_data)
         logger.debug("Garmin token saved to %s", TOKEN_FILE)
     except Exception as exc:
         logger.warning("Could not save Garmin token: %s", exc)
@@ -91,5 +106,7 @@ def _save_token(client: garminconnect.Garmin) -> None:
 
 def invalidate_token() -> None:
     """Delete the persisted token, forcing re-authentication on next login."""
+    global _TOKEN_CACHE
     TOKEN_FILE.unlink(missing_ok=True)
+    _TOKEN_CACHE = None
     logger.info("Garmin token invalidated")
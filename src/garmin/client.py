@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+import threading
+from bisect import bisect_right
 import time as _time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Any
@@ -23,6 +26,33 @@ logger = logging.getLogger(__name__)
 
 _RATE_LIMIT_BACKOFF_SECONDS = 3600  # 1 hour
 
+# Shared circuit breaker: after this many consecutive failed fetches, all
+# endpoints pause for 2**failures seconds (capped), so concurrent retries
+# back off together instead of each hammering Garmin on its own schedule.
+_BREAKER_FAILURE_THRESHOLD = 3
+_BREAKER_MAX_COOLDOWN_SECONDS = 60
+
+# Garmin answers bursts with an hour-long 429, so at most this many API requests
+# are in flight per client, however many days and endpoints are fanned out.
+_MAX_CONCURRENT_REQUESTS = 4
+
+# How long a daily stats payload is reused; activity and health both read it
+_STATS_CACHE_TTL_SECONDS = 300
+
+# How long a "no sleep yet" answer is reused during wake-detection polling.
+# A positive answer is final and is kept for the life of the client.
+_SLEEP_PROBE_NEGATIVE_TTL_SECONDS = 60
+
+# Wellness endpoints queried by get_health_data, keyed by the client method name.
+# They are independent of each other, so they are fetched concurrently.
+_HEALTH_ENDPOINTS = (
+    "get_stats",
+    "get_stress_data",
+    "get_body_battery",
+    "get_spo2_data",
+    "get_intensity_minutes_data",
+)
+
 
 def _is_rate_limit(exc: BaseException) -> bool:
     return "429" in str(exc) or isinstance(exc, garminconnect.GarminConnectTooManyRequestsError)
@@ -55,7 +85,7 @@ def _is_indoor_activity(type_key: str, item: dict) -> bool:
     return bool(indoor_flag)
 
 
-@dataclass
+@dataclass(slots=True)
 class SleepData:
     hours: float | None
     score: int | None
@@ -66,7 +96,7 @@ class SleepData:
     awake_min: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityData:
     steps: int | None
     active_calories: int | None
@@ -75,7 +105,7 @@ class ActivityData:
     floors_ascended: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DailySummary:
     date: date
     sleep: SleepData
@@ -90,17 +120,16 @@ class DailySummary:
     weight_kg: float | None = None
 
 
+# Lower bound (inclusive) of each sleep-quality band above "Mau"
+_SLEEP_THRESHOLDS = (60, 70, 80)
+_SLEEP_LABELS = ("Mau", "Razoável", "Bom", "Excelente")
+
+
 def _assess_sleep_quality(score: int | None) -> str | None:
     """Map a numeric sleep score to a Portuguese quality label."""
     if score is None:
         return None
-    if score >= 80:
-        return "Excelente"
-    if score >= 70:
-        return "Bom"
-    if score >= 60:
-        return "Razoável"
-    return "Mau"
+    return _SLEEP_LABELS[bisect_right(_SLEEP_THRESHOLDS, score)]
 
 
 def _parse_weight_response(raw: dict | None) -> float | None:
@@ -144,6 +173,14 @@ def _parse_weight_response(raw: dict | None) -> float | None:
     return None
 
 
+class _CircuitOpenError(garminconnect.GarminConnectConnectionError):
+    """Raised without touching the network while the shared breaker is open."""
+
+
+def _should_retry(exc: BaseException) -> bool:
+    return not _is_rate_limit(exc) and not isinstance(exc, _CircuitOpenError)
+
+
 def _on_retry(retry_state) -> None:
     logger.warning(
         "Garmin API attempt %d failed: %s",
@@ -155,11 +192,36 @@ def _on_retry(retry_state) -> None:
 class GarminClient:
     """High-level wrapper around garminconnect for fetching daily metrics."""
 
-    def __init__(self, email: str, password: str) -> None:
+    def __init__(self, email: str, password: str, pool_size: int = 20) -> None:
         self._email = email
         self._password = password
+        self._pool_size = pool_size
         self._client: garminconnect.Garmin | None = None
         self._rate_limit_until: float = 0.0  # NOTE: resets on container restart — one extra 429 per redeploy is acceptable
+        # date_str -> (monotonic fetch time, get_stats payload)
+        self._stats_cache: dict[str, tuple[float, dict]] = {}
+        # date_str -> pending get_stats request; guarded (with the cache) by _stats_lock
+        self._stats_inflight: dict[str, Future] = {}
+        self._stats_lock = threading.Lock()
+        self._auth_lock = threading.Lock()
+        # day -> (monotonic probe time, sleep available?)
+        self._sleep_probe_cache: dict[date, tuple[float, bool]] = {}
+        self._breaker_open_until: float = 0.0
+        self._breaker_failures = 0
+        self._breaker_lock = threading.Lock()
+        self._request_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_REQUESTS)
+        # Shared fan-out pools, created once per client. Per-day fetches
+        # (summary pool) wait on single requests (request pool); request tasks
+        # never wait on the pools, so nesting them cannot deadlock.
+        self._summary_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="garmin-day")
+        self._request_pool = ThreadPoolExecutor(
+            max_workers=len(_HEALTH_ENDPOINTS), thread_name_prefix="garmin-req"
+        )
+
+    def _request(self, method: Any, *args: Any) -> Any:
+        """Call one garminconnect API method within the client-wide in-flight limit."""
+        with self._request_slots:
+            return method(*args)
 
     def _handle_rate_limit(self) -> None:
         self._rate_limit_until = _time.monotonic() + _RATE_LIMIT_BACKOFF_SECONDS
@@ -174,17 +236,91 @@ class GarminClient:
                 f"429 backoff activo — aguarda ainda {int(remaining // 60)} min"
             )
 
+    def _check_breaker(self) -> None:
+        remaining = self._breaker_open_until - _time.monotonic()
+        if remaining > 0:
+            raise _CircuitOpenError(f"Garmin em pausa após falhas consecutivas — aguarda {remaining:.0f}s")
+
+    def _record_failure(self) -> None:
+        with self._breaker_lock:
+            self._breaker_failures += 1
+            if self._breaker_failures >= _BREAKER_FAILURE_THRESHOLD:
+                cooldown = min(_BREAKER_MAX_COOLDOWN_SECONDS, 2 ** self._breaker_failures)
+                self._breaker_open_until = _time.monotonic() + cooldown
+                logger.warning("Garmin: %d falhas seguidas — pausa de %ds", self._breaker_failures, cooldown)
+
+    def _record_success(self) -> None:
+        with self._breaker_lock:
+            self._breaker_failures = 0
+            self._breaker_open_until = 0.0
+
+    def _get_stats_cached(self, date_str: str) -> dict:
+        """Return ``get_stats`` for *date_str*, reusing a recent payload.
+
+        A concurrent caller for the same day waits on the in-flight request
+        instead of issuing a duplicate one; callers for other days fetch in
+        parallel, since the lock only guards the bookkeeping, never the HTTP call.
+        """
+        with self._stats_lock:
+            cached = self._stats_cache.get(date_str)
+            if cached and _time.monotonic() - cached[0] < _STATS_CACHE_TTL_SECONDS:
+                return cached[1]
+            pending = self._stats_inflight.get(date_str)
+            if pending is None:
+                future: Future = Future()
+                self._stats_inflight[date_str] = future
+        if pending is not None:
+            return pending.result()
+
+        try:
+            raw = self._request(self._ensure_authenticated().get_stats, date_str)
+        except BaseException as exc:
+            with self._stats_lock:
+                del self._stats_inflight[date_str]
+            future.set_exception(exc)
+            raise
+
+        with self._stats_lock:
+            del self._stats_inflight[date_str]
+            if raw:
+                now = _time.monotonic()
+                # Drop expired days so a long-running process doesn't keep every payload
+                for key in [k for k, (ts, _) in self._stats_cache.items()
+                            if now - ts >= _STATS_CACHE_TTL_SECONDS]:
+                    del self._stats_cache[key]
+                self._stats_cache[date_str] = (now, raw)
+        future.set_result(raw)
+        return raw
+
     def authenticate(self) -> None:
-        """Initialise (or refresh) the authenticated Garmin client."""
-        self._client = create_garmin_client(self._email, self._password)
+        """Initialise (or refresh) the authenticated Garmin client.
+
+        Holds the auth lock, so a fetch that needs a client waits for this login
+        instead of starting a second one against the same token store.
+        """
+        with self._auth_lock:
+            self._login()
+
+    def _login(self) -> None:
+        """Log in and install the client. Caller must hold ``_auth_lock``."""
+        client = create_garmin_client(self._email, self._password)
+        # Size garth's keep-alive pool for the concurrent fetches so connections
+        # are reused instead of discarded when the pool is full
+        client.garth.configure(pool_connections=self._pool_size, pool_maxsize=self._pool_size)
+        self._client = client
 
     def _ensure_authenticated(self) -> garminconnect.Garmin:
-        if self._client is None:
-            self.authenticate()
-        return self._client  # type: ignore[return-value]
+        client = self._client
+        if client is None:
+            with self._auth_lock:
+                # Concurrent fetches may race here; only the first one logs in
+                if self._client is None:
+                    self._login()
+                client = self._client
+        return client  # type: ignore[return-value]
 
     @retry(
-        retry=retry_if_exception(lambda exc: not _is_rate_limit(exc)),
+        retry=retry_if_exception(_should_retry),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2, min=4, max=30),
         before_sleep=_on_retry,
@@ -199,16 +335,23 @@ class GarminClient:
         Returns:
             SleepData with hours, score, and quality (any may be None).
         """
+        self._check_breaker()
         client = self._ensure_authenticated()
         date_str = day.isoformat()
 
         try:
-            raw: dict[str, Any] = client.get_sleep_data(date_str)
+            raw: dict[str, Any] = self._request(client.get_sleep_data, date_str)
         except garminconnect.GarminConnectAuthenticationError:
             logger.warning("Garmin: auth error, invalidating token and retrying")
             invalidate_token()
             self._client = None
+            self._record_failure()
             raise
+        except Exception as exc:
+            if not _is_rate_limit(exc):
+                self._record_failure()
+            raise
+        self._record_success()
 
         if not raw:
             logger.warning("Garmin: no sleep data for %s", date_str)
@@ -239,7 +382,7 @@ class GarminClient:
         )
 
     @retry(
-        retry=retry_if_exception(lambda exc: not _is_rate_limit(exc)),
+        retry=retry_if_exception(_should_retry),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2, min=4, max=30),
         before_sleep=_on_retry,
@@ -254,16 +397,23 @@ class GarminClient:
         Returns:
             ActivityData with steps, active_calories, resting_calories.
         """
-        client = self._ensure_authenticated()
+        self._check_breaker()
         date_str = day.isoformat()
 
         try:
-            raw: dict[str, Any] = client.get_stats(date_str)
+            raw: dict[str, Any] = self._get_stats_cached(date_str)
         except garminconnect.GarminConnectAuthenticationError:
             logger.warning("Garmin: auth error, invalidating token and retrying")
             invalidate_token()
             self._client = None
+            self._stats_cache.clear()
+            self._record_failure()
             raise
+        except Exception as exc:
+            if not _is_rate_limit(exc):
+                self._record_failure()
+            raise
+        self._record_success()
 
         if not raw:
             logger.warning("Garmin: no activity data for %s", date_str)
@@ -288,8 +438,13 @@ class GarminClient:
 
         Returns a dict with keys: resting_heart_rate, avg_stress, body_battery_high,
         body_battery_low, spo2_avg, intensity_moderate_min, intensity_vigorous_min.
-        Any value may be None. Never raises — fails silently.
+        Any value may be None; individual endpoint failures are logged and skipped.
+
+        Raises:
+            _CircuitOpenError: While the breaker is open, so the caller skips the
+                save instead of overwriting stored values with an all-None result.
         """
+        self._check_breaker()
         client = self._ensure_authenticated()
         date_str = day.isoformat()
         result = {
@@ -301,8 +456,18 @@ class GarminClient:
             "intensity_moderate_min": None,
             "intensity_vigorous_min": None,
         }
+        # Issue all requests up-front; each result is still handled on its own
+        # below so one failing endpoint doesn't discard the others.
+        futures = {
+            name: (
+                self._request_pool.submit(self._get_stats_cached, date_str)
+                if name == "get_stats"
+                else self._request_pool.submit(self._request, getattr(client, name), date_str)
+            )
+            for name in _HEALTH_ENDPOINTS
+        }
         try:
-            stats = client.get_stats(date_str)
+            stats = futures["get_stats"].result()
             if stats:
                 result["resting_heart_rate"] = stats.get("restingHeartRate")
         except Exception as exc:
@@ -311,7 +476,7 @@ class GarminClient:
                 raise
             logger.debug("Could not fetch HR for %s: %s", date_str, exc)
         try:
-            stress = client.get_stress_data(date_str)
+            stress = futures["get_stress_data"].result()
             if stress:
                 result["avg_stress"] = stress.get("avgStressLevel")
         except Exception as exc:
@@ -320,19 +485,26 @@ class GarminClient:
                 raise
             logger.debug("Could not fetch stress for %s: %s", date_str, exc)
         try:
-            bb = client.get_body_battery(date_str)
-            if bb and isinstance(bb, list) and len(bb) > 0:
-                values = [item.get("charged", 0) for item in bb if item.get("charged") is not None]
-                if values:
-                    result["body_battery_high"] = max(values)
-                    result["body_battery_low"] = min(values)
+            bb = futures["get_body_battery"].result()
+            if bb and isinstance(bb, list):
+                low = high = None
+                for item in bb:
+                    charged = item.get("charged")
+                    if charged is None:
+                        continue
+                    if low is None or charged < low:
+                        low = charged
+                    if high is None or charged > high:
+                        high = charged
+                result["body_battery_high"] = high
+                result["body_battery_low"] = low
         except Exception as exc:
             if _is_rate_limit(exc):
                 self._handle_rate_limit()
                 raise
             logger.debug("Could not fetch body battery for %s: %s", date_str, exc)
         try:
-            spo2 = client.get_spo2_data(date_str)
+            spo2 = futures["get_spo2_data"].result()
             if spo2 and isinstance(spo2, dict):
                 avg = spo2.get("averageSpO2")
                 if avg is not None:
@@ -343,7 +515,7 @@ class GarminClient:
                 raise
             logger.debug("Could not fetch SpO2 for %s: %s", date_str, exc)
         try:
-            intensity = client.get_intensity_minutes_data(date_str)
+            intensity = futures["get_intensity_minutes_data"].result()
             if intensity and isinstance(intensity, dict):
                 mod = intensity.get("moderateIntensityMinutes")
                 vig = intensity.get("vigorousIntensityMinutes")
@@ -369,7 +541,7 @@ class GarminClient:
 
         # Try get_daily_weigh_ins first (most specific per-day endpoint)
         try:
-            raw = client.get_daily_weigh_ins(date_str)
+            raw = self._request(client.get_daily_weigh_ins, date_str)
             if raw:
                 logger.debug("get_daily_weigh_ins keys for %s: %s", date_str, list(raw.keys()) if isinstance(raw, dict) else type(raw))
                 weight = _parse_weight_response(raw)
@@ -384,7 +556,7 @@ class GarminClient:
 
         # Fall back to get_body_composition
         try:
-            raw = client.get_body_composition(date_str)
+            raw = self._request(client.get_body_composition, date_str)
             if raw:
                 logger.debug("get_body_composition keys for %s: %s", date_str, list(raw.keys()) if isinstance(raw, dict) else type(raw))
                 weight = _parse_weight_response(raw)
@@ -412,7 +584,7 @@ class GarminClient:
         client = self._ensure_authenticated()
         date_str = day.isoformat()
         try:
-            raw = client.get_activities_by_date(date_str, date_str)
+            raw = self._request(client.get_activities_by_date, date_str, date_str)
             if not raw:
                 return []
             result = []
@@ -463,7 +635,7 @@ class GarminClient:
         max_weight_kg (only keys with data are included). Empty on any error.
         """
         try:
-            data = client.get_activity_exercise_sets(activity_id)
+            data = self._request(client.get_activity_exercise_sets, activity_id)
         except Exception as exc:
             logger.debug("Could not fetch exercise sets for %s: %s", activity_id, exc)
             return {}
@@ -505,26 +677,30 @@ class GarminClient:
         Returns:
             True if sleep data with sleepTimeSeconds is available.
         """
+        cached = self._sleep_probe_cache.get(day)
+        if cached and (cached[1] or _time.monotonic() - cached[0] < _SLEEP_PROBE_NEGATIVE_TTL_SECONDS):
+            return cached[1]
+
         client = self._ensure_authenticated()
         date_str = day.isoformat()
 
         try:
-            raw: dict[str, Any] = client.get_sleep_data(date_str)
+            raw: dict[str, Any] = self._request(client.get_sleep_data, date_str)
         except garminconnect.GarminConnectAuthenticationError:
             logger.warning("Garmin: auth error during sleep check, invalidating token")
             invalidate_token()
             self._client = None
+            self._sleep_probe_cache.clear()
             return False
         except Exception as exc:
             logger.debug("Sleep availability check failed for %s: %s", date_str, exc)
             return False
 
-        if not raw:
-            return False
-
-        daily = raw.get("dailySleepDTO", {})
+        daily = (raw or {}).get("dailySleepDTO", {})
         sleep_seconds = daily.get("sleepTimeSeconds")
-        return sleep_seconds is not None and sleep_seconds > 0
+        available = sleep_seconds is not None and sleep_seconds > 0
+        self._sleep_probe_cache[day] = (_time.monotonic(), available)
+        return available
 
     def get_yesterday_summary(self) -> DailySummary:
         """Convenience method: fetch all metrics for yesterday.
@@ -545,9 +721,18 @@ class GarminClient:
         sleep = SleepData(hours=None, score=None, quality=None)
         activity = ActivityData(steps=None, active_calories=None, resting_calories=None)
 
+        # Authenticate once up-front so the concurrent fetches share one client.
+        # Sleep: query today — Garmin tags last night's sleep with today's date.
+        # Activity: query yesterday — steps/calories belong to the day they happened.
+        self._ensure_authenticated()
+        pool = self._summary_pool
+        sleep_f = pool.submit(self.get_sleep_data, today)
+        activity_f = pool.submit(self.get_activity_data, yesterday)
+        health_f = pool.submit(self.get_health_data, yesterday)
+        weight_f = pool.submit(self.get_weight_data, yesterday)
+
         try:
-            # Sleep: query today — Garmin tags last night's sleep with today's date
-            sleep = self.get_sleep_data(today)
+            sleep = sleep_f.result()
         except Exception as exc:
             if _is_rate_limit(exc):
                 self._handle_rate_limit()
@@ -555,16 +740,15 @@ class GarminClient:
             logger.error("Failed to fetch sleep data: %s", exc)
 
         try:
-            # Activity: query yesterday — steps/calories belong to the day they happened
-            activity = self.get_activity_data(yesterday)
+            activity = activity_f.result()
         except Exception as exc:
             if _is_rate_limit(exc):
                 self._handle_rate_limit()
                 raise
             logger.error("Failed to fetch activity data: %s", exc)
 
-        health = self.get_health_data(yesterday)
-        weight = self.get_weight_data(yesterday)
+        health = health_f.result()
+        weight = weight_f.result()
 
         # Store everything under yesterday's date (the "day being reported")
         return DailySummary(date=yesterday, sleep=sleep, activity=activity, weight_kg=weight, **health)
@@ -588,31 +772,46 @@ class GarminClient:
         sleep = SleepData(hours=None, score=None, quality=None)
         activity = ActivityData(steps=None, active_calories=None, resting_calories=None)
 
-        # Try day+1 for sleep first (wake-up date convention), fall back to day
-        for sleep_date in [day + timedelta(days=1), day]:
-            try:
-                candidate = self.get_sleep_data(sleep_date)
-                if candidate.hours is not None:
-                    sleep = candidate
-                    break
-            except Exception as exc:
-                if _is_rate_limit(exc):
-                    self._handle_rate_limit()
-                    raise
-                logger.debug("Sleep fetch for %s failed: %s", sleep_date, exc)
+        self._ensure_authenticated()
+        pool = self._summary_pool
+        sleep_f = pool.submit(self._find_sleep_for_date, day)
+        activity_f = pool.submit(self.get_activity_data, day)
+        health_f = pool.submit(self.get_health_data, day)
+        weight_f = pool.submit(self.get_weight_data, day)
+
+        sleep = sleep_f.result() or sleep
 
         try:
-            activity = self.get_activity_data(day)
+            activity = activity_f.result()
         except Exception as exc:
             if _is_rate_limit(exc):
                 self._handle_rate_limit()
                 raise
             logger.error("Failed to fetch activity data for %s: %s", day, exc)
 
-        health = self.get_health_data(day)
-        weight = self.get_weight_data(day)
+        health = health_f.result()
+        weight = weight_f.result()
         return DailySummary(date=day, sleep=sleep, activity=activity, weight_kg=weight, **health)
 
+    def _find_sleep_for_date(self, day: date) -> SleepData | None:
+        """Find the sleep that belongs to the activity date ``day``.
+
+        Prefers `day + 1` (wake-up date convention) and only queries `day` when
+        that misses, so the common case costs a single sleep request.
+        Returns None if neither has sleep hours. Rate-limit errors propagate.
+        """
+        for sleep_date in (day + timedelta(days=1), day):
+            try:
+                candidate = self.get_sleep_data(sleep_date)
+                if candidate.hours is not None:
+                    return candidate
+            except Exception as exc:
+                if _is_rate_limit(exc):
+                    self._handle_rate_limit()
+                    raise
+                logger.debug("Sleep fetch for %s failed: %s", sleep_date, exc)
+        return None
+
     def to_metrics_dict(self, summary: DailySummary) -> dict[str, Any]:
         """Convert a DailySummary to a flat dict for the database repository.
 
@@ -622,11 +821,7 @@ class GarminClient:
         Returns:
             Dict matching the DailyMetrics model columns.
         """
-        has_data = any([
-            summary.sleep.hours,
-            summary.sleep.score,
-            summary.activity.steps,
-        ])
+        has_data = bool(summary.sleep.hours or summary.sleep.score or summary.activity.steps)
         return {
             "sleep_hours": summary.sleep.hours,
             "sleep_score": summary.sleep.score,
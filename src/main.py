@@ -7,70 +7,131 @@ import logging
 import os
 import signal
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from typing import TYPE_CHECKING
 
 from .config import ConfigError, load_config
-from .database.repository import Repository
-from .garmin.client import GarminClient, _is_rate_limit
-from .scheduler.jobs import make_newsletter_job, make_report_callback, make_sync_job
-from .telegram.bot import TelegramBot
 from .utils.logger import setup_logging
+from .utils.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from .database.repository import Repository
+    from .garmin.client import GarminClient
 
 logger = logging.getLogger(__name__)
 
 
-def _run_health_checks(garmin: GarminClient, repo: Repository, bot_token: str, chat_id: int) -> None:
-    """Verify connectivity to Garmin, Telegram, and the database on startup."""
-    # Database
-    try:
-        count = repo.count_stored_days()
-        logger.info("Health: database OK (%d days stored)", count)
-    except Exception as exc:
-        logger.error("Health: database check failed: %s", exc)
-        raise
+# Per-check bounds so a hung endpoint can't stall container startup. The Garmin
+# one covers an SSO login with retries; a login that outlives it keeps holding
+# the client's auth lock, so later fetches wait for it instead of logging in again.
+_DB_CHECK_TIMEOUT_SECONDS = 5
+_GARMIN_CHECK_TIMEOUT_SECONDS = 60
+
+
+def _run_health_checks(garmin: GarminClient, repo: Repository) -> None:
+    """Verify the database and Garmin concurrently on startup.
+
+    Only a database failure is fatal. Telegram is checked by PTB itself when
+    the application initialises (see TelegramBot._post_init).
+    """
+    # Own executor so a timed-out blocking check is abandoned rather than
+    # joined when the event loop shuts down
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health")
+
+    async def _check_db() -> int:
+        return await asyncio.get_running_loop().run_in_executor(executor, repo.count_stored_days)
+
+    async def _check_garmin() -> None:
+        await asyncio.get_running_loop().run_in_executor(executor, garmin.authenticate)
+
+    async def _checks():
+        return await asyncio.gather(
+            asyncio.wait_for(_check_db(), _DB_CHECK_TIMEOUT_SECONDS),
+            asyncio.wait_for(_check_garmin(), _GARMIN_CHECK_TIMEOUT_SECONDS),
+            return_exceptions=True,
+        )
 
-    # Garmin
     try:
-        garmin.authenticate()
+        db_result, garmin_result = asyncio.run(_checks())
+    finally:
+        executor.shutdown(wait=False)
+
+    if isinstance(db_result, BaseException):
+        logger.error("Health: database check failed: %s", _describe(db_result, _DB_CHECK_TIMEOUT_SECONDS))
+        raise db_result
+    logger.info("Health: database OK (%d days stored)", db_result)
+
+    if isinstance(garmin_result, BaseException):
+        logger.warning(
+            "Health: Garmin authentication failed: %s — will retry on first sync",
+            _describe(garmin_result, _GARMIN_CHECK_TIMEOUT_SECONDS),
+        )
+    else:
         logger.info("Health: Garmin authentication OK")
-    except Exception as exc:
-        logger.warning("Health: Garmin authentication failed: %s — will retry on first sync", exc)
 
-    # Telegram (send a startup ping via the async bot)
-    try:
-        from telegram import Bot
-        async def _ping():
-            bot = Bot(token=bot_token)
-            me = await bot.get_me()
-            logger.info("Health: Telegram OK (@%s)", me.username)
-        asyncio.run(_ping())
-    except Exception as exc:
-        logger.warning("Health: Telegram check failed: %s", exc)
+
+def _describe(exc: BaseException, timeout: float) -> str:
+    if isinstance(exc, TimeoutError):
+        return f"timed out after {timeout}s"
+    return str(exc)
+
+
+# Days fetched in parallel during a backfill; kept low so Garmin isn't hammered
+_BACKFILL_CONCURRENCY = 3
+# Minimum spacing between the start of two day fetches during a backfill
+_BACKFILL_MIN_INTERVAL_SECONDS = 2.0
+
+
+def _backfill_days(garmin: GarminClient, repo: Repository, days: list, on_error) -> bool:
+    """Fetch and store *days*, at most _BACKFILL_CONCURRENCY at a time.
+
+    ``on_error(day, exc)`` is called for non-rate-limit failures. A Garmin 429
+    cancels every day that hasn't started yet. Returns False if that happened.
+    """
+    from .garmin.client import _is_rate_limit
+
+    rate_limited = threading.Event()
+    pacer = RateLimiter(_BACKFILL_MIN_INTERVAL_SECONDS)
+
+    def _backfill_one(day) -> None:
+        if rate_limited.is_set():
+            return
+        pacer.acquire()
+        if rate_limited.is_set():
+            return
+        try:
+            summary = garmin.get_summary_for_date(day)
+            metrics = garmin.to_metrics_dict(summary)
+            repo.save_daily_metrics(day, metrics)
+            repo.log_sync("success")
+            logger.info("Backfill: filled %s", day)
+        except Exception as exc:
+            if _is_rate_limit(exc):
+                rate_limited.set()
+                return
+            on_error(day, exc)
+
+    with ThreadPoolExecutor(max_workers=_BACKFILL_CONCURRENCY) as pool:
+        list(pool.map(_backfill_one, days))
+    return not rate_limited.is_set()
 
 
 def _run_startup_backfill(garmin: GarminClient, repo: Repository) -> None:
     """Fill gaps in the last 7 days silently on startup."""
-    import time
     yesterday = date.today() - timedelta(days=1)
     start = yesterday - timedelta(days=6)
     missing = repo.get_missing_dates(start, yesterday)
     if not missing:
         return
     logger.info("Startup backfill: %d missing days found (%s to %s)", len(missing), missing[0], missing[-1])
-    for day in missing:
-        try:
-            summary = garmin.get_summary_for_date(day)
-            metrics = garmin.to_metrics_dict(summary)
-            repo.save_daily_metrics(day, metrics)
-            repo.log_sync("success")
-            logger.info("Startup backfill: filled %s", day)
-            time.sleep(2)  # rate limiting
-        except Exception as exc:
-            if _is_rate_limit(exc):
-                logger.warning("Startup backfill: Garmin 429 — stopping backfill to avoid extending ban")
-                break
-            logger.warning("Startup backfill: failed for %s: %s", day, exc)
 
+    def _on_error(day, exc) -> None:
+        logger.warning("Startup backfill: failed for %s: %s", day, exc)
+
+    if not _backfill_days(garmin, repo, missing, _on_error):
+        logger.warning("Startup backfill: Garmin 429 — stopping backfill to avoid extending ban")
 
 
 def run() -> None:
@@ -87,11 +148,18 @@ def run() -> None:
     setup_logging(config.log_level, config.log_file)
     logger.info("GarminBot starting up")
 
+    # Heavy imports (SQLAlchemy, garminconnect, python-telegram-bot) only once
+    # the config is known to be valid
+    from .database.repository import Repository
+    from .garmin.client import GarminClient
+    from .scheduler.jobs import make_newsletter_job, make_report_callback, make_sync_job
+    from .telegram.bot import TelegramBot
+
     # Initialise components
     repo = Repository(config.database_path)
     repo.init_database()
 
-    garmin = GarminClient(config.garmin_email, config.garmin_password)
+    garmin = GarminClient(config.garmin_email, config.garmin_password, config.garmin_pool_size)
 
     fatsecret = None
     if config.fatsecret_consumer_key and config.fatsecret_consumer_secret:
@@ -103,26 +171,21 @@ def run() -> None:
         make_sync_job(garmin, repo, fatsecret)()
 
     def backfill_callback(missing_dates: list) -> None:
-        import time
-        for day in missing_dates:
-            try:
-                summary = garmin.get_summary_for_date(day)
-                metrics = garmin.to_metrics_dict(summary)
-                repo.save_daily_metrics(day, metrics)
-                repo.log_sync("success")
-                time.sleep(2)
-            except Exception as exc:
-                if _is_rate_limit(exc):
-                    logger.warning("Backfill: Garmin 429 — stopping to avoid extending ban")
-                    break
-                repo.log_sync("error", str(exc))
-                logger.error("Backfill failed for %s: %s", day, exc)
+        def _on_error(day, exc) -> None:
+            repo.log_sync("error", str(exc))
+            logger.error("Backfill failed for %s: %s", day, exc)
+
+        if not _backfill_days(garmin, repo, missing_dates, _on_error):
+            logger.warning("Backfill: Garmin 429 — stopping to avoid extending ban")
 
     tg_bot = TelegramBot(config, repo, garmin_sync_callback=sync_callback, garmin_backfill_callback=backfill_callback, garmin_client=garmin, fatsecret_client=fatsecret)
     tg_bot._garmin_report = make_report_callback(repo, tg_bot)
 
-    # Health checks (non-fatal for Garmin/Telegram)
-    _run_health_checks(garmin, repo, config.telegram_bot_token, int(config.telegram_chat_id))
+    # Build Telegram application (command registration runs in its post_init hook)
+    app = tg_bot.build_application()
+
+    # Health checks (non-fatal for Garmin)
+    _run_health_checks(garmin, repo)
 
     # Startup backfill: fill any gaps in the last 7 days
     _run_startup_backfill(garmin, repo)
@@ -159,9 +222,6 @@ def run() -> None:
 
         start_health_server(config.health_port, _get_health_status)
 
-    # Build Telegram application
-    app = tg_bot.build_application()
-
     # CNCSearch: register /canticos handler if configured
     _cncsearch_db = os.environ.get("CNCSEARCH_DATABASE_PATH")
     if _cncsearch_db:
@@ -220,9 +280,6 @@ def run() -> None:
     else:
         logger.info("Xread disabled (OBSIDIAN_VAULT_PATH or GROQ_API_KEY missing)")
 
-    # Register commands with BotFather
-    asyncio.run(tg_bot.register_commands())
-
     # Graceful shutdown handler
     def _shutdown(signum, frame):
         logger.info("Shutdown signal received, stopping...")
@@ -7,6 +7,10 @@ from io import BytesIO
 
 logger = logging.getLogger(__name__)
 
+# Phone photos are often 12 MP; ZBar scans every pixel, and a barcode stays
+# readable well below this size, so decode a downscaled grayscale copy first
+_MAX_DECODE_SIZE = (1600, 1600)
+
 try:
     from PIL import Image
     from pyzbar.pyzbar import decode as pyzbar_decode
@@ -31,7 +35,14 @@ def decode_barcode(image_bytes: bytes) -> str | None:
         return None
     try:
         image = Image.open(BytesIO(image_bytes))
+        # JPEG draft mode lets libjpeg decode straight at a reduced scale
+        image.draft("L", _MAX_DECODE_SIZE)
+        image = image.convert("L")
+        image.thumbnail(_MAX_DECODE_SIZE, Image.Resampling.BILINEAR)
         barcodes = pyzbar_decode(image)
+        if not barcodes:
+            # Safety net: very small or dense codes may need the full resolution
+            barcodes = pyzbar_decode(Image.open(BytesIO(image_bytes)))
         if not barcodes:
             return None
         return barcodes[0].data.decode("utf-8")
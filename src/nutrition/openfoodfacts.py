@@ -3,14 +3,34 @@
 from __future__ import annotations
 
 import logging
+import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 _HEADERS = {"User-Agent": "GarminBot/1.0"}
 _TIMEOUT = 30
+# Only the product keys _parse_nutriments reads — full OFF product documents
+# (translations, images, packaging...) are often 100 KB+
+_PRODUCT_FIELDS = "product_name,product_name_pt,abbreviated_product_name,nutriments,serving_quantity,serving_size"
+
+# Shared keep-alive session: repeated lookups reuse the TCP/TLS connection
+# instead of handshaking with world.openfoodfacts.org every time
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
 
 
 @dataclass
@@ -70,29 +90,45 @@ def lookup_barcode(barcode: str) -> NutritionData | None:
     Returns:
         NutritionData or None if not found or request fails.
     """
-    url = f"https://world.openfoodfacts.org/api/v2/product/{barcode}.json"
     try:
-        resp = requests.get(url, headers=_HEADERS, timeout=_TIMEOUT)
-        if resp.status_code == 404:
-            logger.info("OFF barcode %s: 404 not found", barcode)
-            return None
-        resp.raise_for_status()
-        data = resp.json()
-        product = data.get("product") or {}
-        status = data.get("status")
-        if status != 1:
-            # status=0 means the product entry is incomplete (e.g. missing images/categories)
-            # but it may still have valid nutrition data — try to use it.
-            if not product or not product.get("nutriments"):
-                logger.info("OFF barcode %s: status=%s, no usable nutrition data", barcode, status)
-                return None
-            logger.info("OFF barcode %s: status=%s (incomplete), but nutrition data present — using it", barcode, status)
-        return _parse_nutriments(product)
+        return _fetch_barcode(barcode)
+    except _NotFound:
+        return None
     except requests.RequestException as exc:
         logger.warning("OpenFoodFacts barcode lookup failed: %s", exc)
         return None
 
 
+class _NotFound(Exception):
+    """A definitive OpenFoodFacts miss, raised (not returned) so lru_cache doesn't keep it."""
+
+
+@lru_cache(maxsize=512)
+def _fetch_barcode(barcode: str) -> NutritionData:
+    """Fetch and parse a barcode; memoized since barcode → product rarely changes.
+
+    Misses raise _NotFound and request errors propagate, so neither is cached
+    and a product added to OpenFoodFacts later is still found.
+    """
+    url = f"https://world.openfoodfacts.org/api/v2/product/{barcode}.json"
+    resp = _SESSION.get(url, params={"fields": _PRODUCT_FIELDS}, timeout=_TIMEOUT)
+    if resp.status_code == 404:
+        logger.info("OFF barcode %s: 404 not found", barcode)
+        raise _NotFound(barcode)
+    resp.raise_for_status()
+    data = resp.json()
+    product = data.get("product") or {}
+    status = data.get("status")
+    if status != 1:
+        # status=0 means the product entry is incomplete (e.g. missing images/categories)
+        # but it may still have valid nutrition data — try to use it.
+        if not product or not product.get("nutriments"):
+            logger.info("OFF barcode %s: status=%s, no usable nutrition data", barcode, status)
+            raise _NotFound(barcode)
+        logger.info("OFF barcode %s: status=%s (incomplete), but nutrition data present — using it", barcode, status)
+    return _parse_nutriments(product)
+
+
 def search_product(query: str) -> NutritionData | None:
     """Search OpenFoodFacts for a product by name.
 
@@ -102,21 +138,35 @@ def search_product(query: str) -> NutritionData | None:
     Returns:
         NutritionData for the first match, or None if not found.
     """
+    # "Pão  Integral" and "pão integral" share one cached search
+    key = " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+    try:
+        return _search(key)
+    except _NotFound:
+        return None
+    except requests.RequestException as exc:
+        logger.warning("OpenFoodFacts search failed: %s", exc)
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _search(query: str) -> NutritionData:
+    """Run a name search and parse the first hit.
+
+    Memoized; an empty result raises _NotFound and request errors propagate,
+    so neither is cached.
+    """
     url = "https://world.openfoodfacts.org/cgi/search.pl"
     params = {
         "search_terms": query,
         "json": "1",
         "page_size": "1",
         "countries_tags": "pt",
+        "fields": _PRODUCT_FIELDS,
     }
-    try:
-        resp = requests.get(url, headers=_HEADERS, params=params, timeout=_TIMEOUT)
-        resp.raise_for_status()
-        data = resp.json()
-        products = data.get("products", [])
-        if not products:
-            return None
-        return _parse_nutriments(products[0])
-    except requests.RequestException as exc:
-        logger.warning("OpenFoodFacts search failed: %s", exc)
-        return None
+    resp = _SESSION.get(url, params=params, timeout=_TIMEOUT)
+    resp.raise_for_status()
+    products = resp.json().get("products", [])
+    if not products:
+        raise _NotFound(query)
+    return _parse_nutriments(products[0])
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
+import re
+import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 
-from groq import Groq
+from ..utils.groq_client import get_groq_client
+from ..utils.json_md import strip_md_fences
 
 logger = logging.getLogger(__name__)
 
+
+# Food parsing sits on the interactive /comi path: bound each request well below
+# the SDK's 60 s default. The SDK itself retries 429/5xx/connection errors with
+# exponential backoff up to _MAX_RETRIES times.
+_REQUEST_TIMEOUT_SECONDS = 8.0
+_MAX_RETRIES = 2
+
+
 _SYSTEM_PROMPT = """Tu és um parser de alimentos. Recebe texto em Português que descreve o que alguém comeu.
 Extrai cada alimento individual com quantidade e unidade.
 
@@ -44,6 +57,34 @@ class ParsedFoodItem:
     unit: str  # "un" | "g" | "ml"
 
 
+# Fast path for explicit weights/volumes (e.g. "150g arroz e 250 ml leite"), which
+# don't need the LLM. Counts ("2 ovos"), household measures ("1 copo de leite"),
+# dishes joined with "com", "+", or digits in the name fall through to the model.
+_ITEM_SEPARATOR_RE = re.compile(r"\s*,\s*|\s+e\s+", re.IGNORECASE)
+_FAST_ITEM_RE = re.compile(
+    r"^(?P<qty>\d+(?:[.,]\d+)?)\s*"
+    r"(?:(?P<g>g|gr|gramas?)|(?P<ml>ml|mililitros?))"
+    r"\s+(?:de\s+)?(?!(?:g|gr|gramas?|ml|mililitros?|de)$)(?!.*\bcom\b)"
+    r"(?P<name>[^\W\d_][^\d+]*)$",
+    re.IGNORECASE,
+)
+
+
+def _try_fast_parse(text: str) -> list[ParsedFoodItem] | None:
+    """Parse *text* without the LLM if every item matches _FAST_ITEM_RE, else None."""
+    items = []
+    for token in _ITEM_SEPARATOR_RE.split(text):
+        m = _FAST_ITEM_RE.match(token)
+        if not m:
+            return None
+        items.append(ParsedFoodItem(
+            name=m.group("name").strip(),
+            quantity=float(m.group("qty").replace(",", ".")),
+            unit="g" if m.group("g") else "ml",
+        ))
+    return items
+
+
 def parse_food_text(text: str, api_key: str) -> list[ParsedFoodItem]:
     """Parse Portuguese free text into a list of structured food items.
 
@@ -62,7 +103,20 @@ def parse_food_text(text: str, api_key: str) -> list[ParsedFoodItem]:
     if not text:
         return []
 
-    client = Groq(api_key=api_key)
+    fast = _try_fast_parse(text)
+    if fast is not None:
+        logger.debug("Parser fast path: %s", fast)
+        return fast
+
+    # Identical messages ("um iogurte proteico") reuse the previous LLM answer
+    key = " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+    return [dataclasses.replace(item) for item in _parse_with_llm(key, api_key)]
+
+
+@lru_cache(maxsize=256)
+def _parse_with_llm(text: str, api_key: str) -> tuple[ParsedFoodItem, ...]:
+    """Ask the model to parse *text*. Memoized; errors propagate and are not cached."""
+    client = get_groq_client(api_key, timeout=_REQUEST_TIMEOUT_SECONDS, max_retries=_MAX_RETRIES)
     response = client.chat.completions.create(
         model=_MODEL,
         max_tokens=500,
@@ -76,14 +130,20 @@ def parse_food_text(text: str, api_key: str) -> list[ParsedFoodItem]:
     logger.debug("Parser raw response: %s", raw)
 
     # Strip markdown code fences if the model wraps the JSON (e.g. ```json ... ```)
-    if raw.startswith("```"):
-        lines = raw.splitlines()
-        raw = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:]).strip()
+    raw = strip_md_fences(raw)
 
     try:
         items = json.loads(raw)
     except json.JSONDecodeError as exc:
-        raise ValueError(f"LLM returned invalid JSON: {raw!r}") from exc
+        # Models sometimes wrap the array in prose ("Aqui está: [...]") — salvage
+        # the outermost [...] before giving up
+        start, end = raw.find("["), raw.rfind("]")
+        if start == -1 or end < start:
+            raise ValueError(f"LLM returned invalid JSON: {raw!r}") from exc
+        try:
+            items = json.loads(raw[start:end + 1])
+        except json.JSONDecodeError:
+            raise ValueError(f"LLM returned invalid JSON: {raw!r}") from exc
 
     if not isinstance(items, list):
         raise ValueError(f"Expected JSON array, got: {type(items)}")
@@ -99,4 +159,4 @@ def parse_food_text(text: str, api_key: str) -> list[ParsedFoodItem]:
             unit=str(item.get("unit", "un")),
         ))
 
-    return result
+    return tuple(result)
@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
-from groq import Groq
+from ..utils.groq_client import get_groq_client
+from ..utils.json_md import strip_md_fences
 
 logger = logging.getLogger(__name__)
 
+
 _MODEL = "llama-3.3-70b-versatile"
 
+_NUTRITION_KEYS = ("calories", "protein_g", "fat_g", "carbs_g", "fiber_g")
+
+# Deterministic answer for a day with nothing logged — no point asking the LLM
+_NO_DATA_MESSAGE = (
+    "📝 Não há registos nutricionais de ontem. "
+    "Regista as tuas refeições hoje para obteres recomendações personalizadas."
+)
+
 _SYSTEM_PROMPT = """És um nutricionista desportivo. Com base nos dados de ontem e nos objetivos do utilizador, dá uma recomendação nutricional personalizada para hoje.
 
 REGRAS:
@@ -43,7 +54,8 @@ def generate_nutrition_recommendation(
         api_key: Groq API key.
 
     Returns:
-        Recommendation text ready for Telegram, or None on failure.
+        Recommendation text ready for Telegram, a fixed reminder when nothing
+        was logged, or None on failure / when there is too little data.
     """
     if not api_key:
         return None
@@ -54,13 +66,11 @@ def generate_nutrition_recommendation(
     if not macro_goals:
         return None
 
-    lines = ["Dados de ontem:"]
+    cal, prot, fat, carbs, fiber = (nutrition.get(k) or 0 for k in _NUTRITION_KEYS)
+    if not (cal or prot or fat or carbs):
+        return _NO_DATA_MESSAGE
 
-    cal = nutrition.get("calories") or 0
-    prot = nutrition.get("protein_g") or 0
-    fat = nutrition.get("fat_g") or 0
-    carbs = nutrition.get("carbs_g") or 0
-    fiber = nutrition.get("fiber_g") or 0
+    lines = ["Dados de ontem:"]
     lines.append(
         f"Ingerido: {int(cal)} kcal | P: {int(prot)}g | G: {int(fat)}g | HC: {int(carbs)}g | Fibra: {int(fiber)}g"
     )
@@ -108,23 +118,23 @@ def generate_nutrition_recommendation(
     user_prompt = "\n".join(lines)
 
     try:
-        client = Groq(api_key=api_key)
-        response = client.chat.completions.create(
-            model=_MODEL,
-            max_tokens=300,
-            messages=[
-                {"role": "system", "content": _SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
-        text = response.choices[0].message.content.strip()
-        # Strip markdown code fences if present
-        if text.startswith("```"):
-            text_lines = text.splitlines()
-            text = "\n".join(
-                text_lines[1:-1] if text_lines[-1].strip() == "```" else text_lines[1:]
-            ).strip()
-        return text
+        return _recommend(user_prompt, api_key)
     except Exception as exc:
         logger.error("Nutrition recommendation failed: %s", exc, exc_info=True)
         return None
+
+
+@lru_cache(maxsize=64)
+def _recommend(user_prompt: str, api_key: str) -> str:
+    """Ask the model for a recommendation. Memoized on the prompt (which encodes
+    every input); errors propagate and are not cached."""
+    client = get_groq_client(api_key)
+    response = client.chat.completions.create(
+        model=_MODEL,
+        max_tokens=300,
+        messages=[
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ],
+    )
+    return strip_md_fences(response.choices[0].message.content.strip())
@@ -9,16 +9,22 @@ Lookup chain for name-based searches:
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from groq import Groq
-
+from ..utils.groq_client import get_groq_client
+from ..utils.json_md import strip_md_fences
 from .barcode import decode_barcode
 from .openfoodfacts import NutritionData, lookup_barcode, search_product
 from .parser import ParsedFoodItem, parse_food_text
 
+if TYPE_CHECKING:
+    from ..database.repository import Repository
+
 logger = logging.getLogger(__name__)
 
 _ESTIMATE_SYSTEM = """Tu és um nutricionista. Dado o nome de um alimento, estima os valores nutricionais por 100g.
@@ -26,8 +32,23 @@ Responde APENAS com JSON válido, sem markdown:
 {"calories_per_100g": N, "protein_per_100g": N, "fat_per_100g": N, "carbs_per_100g": N, "fiber_per_100g": N}
 Usa valores típicos para o produto. Se for uma unidade (ex: ovo, banana), estima para 100g do alimento."""
 
+_ESTIMATE_BATCH_SYSTEM = """Tu és um nutricionista. Recebes uma lista JSON de nomes de alimentos e estimas os valores nutricionais por 100g de cada um.
+Responde APENAS com JSON válido, sem markdown — um objeto em que cada chave é o nome exatamente como recebido:
+{"nome": {"calories_per_100g": N, "protein_per_100g": N, "fat_per_100g": N, "carbs_per_100g": N, "fiber_per_100g": N}, ...}
+Usa valores típicos para o produto. Se for uma unidade (ex: ovo, banana), estima para 100g do alimento."""
+
 _MODEL = "llama-3.3-70b-versatile"
 
+# Estimates answer with several JSON fields per food (and a batch covers several
+# foods), so they get more room than the 8 s food-text parse
+_ESTIMATE_TIMEOUT_SECONDS = 30.0
+
+# Output keys of _calculate_nutrients, in NutritionData *_per_100g field order
+_NUTRIENT_KEYS = ("calories", "protein_g", "fat_g", "carbs_g", "fiber_g")
+
+# Upper bound on items looked up in parallel for one /comi message
+_MAX_LOOKUP_WORKERS = 6
+
 
 @dataclass
 class FoodItemResult:
@@ -51,10 +72,13 @@ class NutritionService:
         groq_api_key: str,
         usda_api_key: str | None = None,
         api_ninjas_key: str | None = None,
+        repo: Repository | None = None,
     ) -> None:
         self._api_key = groq_api_key
         self._usda_api_key = usda_api_key
         self._api_ninjas_key = api_ninjas_key
+        # Optional persistent cache for barcode and name lookups (survives restarts)
+        self._repo = repo
 
     # ------------------------------------------------------------------ #
     # Public API                                                           #
@@ -70,9 +94,10 @@ class NutritionService:
             List of FoodItemResult with nutritional data populated.
         """
         parsed: list[ParsedFoodItem] = parse_food_text(text, self._api_key)
+        lookups = self._lookup_many([item.name for item in parsed])
+
         results = []
-        for item in parsed:
-            nutrition, source = self._lookup_nutrition(item.name)
+        for item, (nutrition, source) in zip(parsed, lookups):
             nutrients = self._calculate_nutrients(nutrition, item.quantity, item.unit) if nutrition else {}
             results.append(FoodItemResult(
                 name=item.name,
@@ -125,7 +150,7 @@ class NutritionService:
         Returns:
             FoodItemResult or None if product not found in OpenFoodFacts.
         """
-        nutrition = lookup_barcode(code)
+        nutrition = self._lookup_barcode(code)
         if not nutrition:
             logger.info("EAN %s not found in OpenFoodFacts", code)
             return None
@@ -158,7 +183,7 @@ class NutritionService:
             logger.info("No barcode detected in image")
             return None
 
-        nutrition = lookup_barcode(code)
+        nutrition = self._lookup_barcode(code)
         if not nutrition:
             logger.info("Barcode %s not found in OpenFoodFacts", code)
             return None
@@ -181,6 +206,17 @@ class NutritionService:
     # Internal lookup chain                                                #
     # ------------------------------------------------------------------ #
 
+    def _lookup_barcode(self, code: str) -> NutritionData | None:
+        """OpenFoodFacts barcode lookup, served from the database cache when fresh."""
+        if self._repo is not None:
+            cached = self._repo.get_barcode_cache(code)
+            if cached is not None:
+                return NutritionData(**cached)
+        nutrition = lookup_barcode(code)
+        if nutrition and self._repo is not None:
+            self._repo.set_barcode_cache(code, dataclasses.asdict(nutrition))
+        return nutrition
+
     def _lookup_nutrition(self, name: str) -> tuple[NutritionData | None, str]:
         """Chain through all nutrition sources for a food name.
 
@@ -189,6 +225,69 @@ class NutritionService:
             "openfoodfacts", "usda", "api_ninjas", "llm_estimate".
             Returns (None, "llm_estimate") if all sources fail.
         """
+        cached = self._cached_lookup(name)
+        if cached:
+            return cached
+
+        nutrition, source = self._lookup_apis(name)
+        if not nutrition:
+            # 4. LLM estimate (last resort)
+            logger.info("All APIs missed for '%s', using LLM estimate", name)
+            nutrition = self._estimate_as_nutrition_data(name)
+            source = "llm_estimate"
+        self._store_lookup(name, nutrition, source)
+        return nutrition, source
+
+    def _lookup_many(self, names: list[str]) -> list[tuple[NutritionData | None, str]]:
+        """_lookup_nutrition for several names, in order, sharing the slow steps."""
+        lookups: list[tuple[NutritionData | None, str] | None] = [self._cached_lookup(n) for n in names]
+        pending = [i for i, hit in enumerate(lookups) if hit is None]
+
+        # Each lookup is a chain of blocking HTTP calls — run the items side by side
+        pending_names = [names[i] for i in pending]
+        if len(pending_names) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(pending_names), _MAX_LOOKUP_WORKERS)) as pool:
+                fetched = list(pool.map(self._lookup_apis, pending_names))
+        else:
+            fetched = [self._lookup_apis(name) for name in pending_names]
+
+        # Items every API missed share a single LLM request
+        missed = [name for name, (nutrition, _) in zip(pending_names, fetched) if nutrition is None]
+        if missed:
+            logger.info("All APIs missed for %s, using LLM estimate", missed)
+            estimates = self._estimate_many(missed)
+            fetched = [
+                (estimates.get(name), "llm_estimate") if nutrition is None else (nutrition, source)
+                for name, (nutrition, source) in zip(pending_names, fetched)
+            ]
+
+        for i, (nutrition, source) in zip(pending, fetched):
+            lookups[i] = (nutrition, source)
+            self._store_lookup(names[i], nutrition, source)
+        return lookups  # type: ignore[return-value]
+
+    def _cached_lookup(self, name: str) -> tuple[NutritionData, str] | None:
+        """Previously resolved (NutritionData, source) for *name* from the database cache."""
+        if self._repo is None:
+            return None
+        cached = self._repo.get_food_lookup_cache(name)
+        if cached is None:
+            return None
+        nutrition, source = cached
+        return NutritionData(**nutrition), source
+
+    def _store_lookup(self, name: str, nutrition: NutritionData | None, source: str) -> None:
+        # Only API answers are persisted: an LLM guess (possibly made during an API
+        # outage) must not shadow a real lookup for the life of the cache entry
+        if nutrition is not None and source != "llm_estimate" and self._repo is not None:
+            self._repo.set_food_lookup_cache(name, dataclasses.asdict(nutrition), source)
+
+    def _lookup_apis(self, name: str) -> tuple[NutritionData | None, str]:
+        """Try the nutrition APIs (steps 1-3 of the chain) without the LLM fallback.
+
+        Returns:
+            (NutritionData, source_label), or (None, "llm_estimate") if every API missed.
+        """
         # 1. OpenFoodFacts
         nutrition = search_product(name)
         if nutrition:
@@ -210,25 +309,26 @@ class NutritionService:
                 logger.info("API-Ninjas found nutrition for '%s'", name)
                 return nutrition, "api_ninjas"
 
-        # 4. LLM estimate (last resort)
-        logger.info("All APIs missed for '%s', using LLM estimate", name)
-        nutrition = self._estimate_as_nutrition_data(name)
-        return nutrition, "llm_estimate"
+        return None, "llm_estimate"
+
+    def _estimate_many(self, food_names: list[str]) -> dict[str, NutritionData]:
+        """LLM per-100g estimates for several foods, keyed by name (misses omitted)."""
+        if len(food_names) == 1:
+            nutrition = self._estimate_as_nutrition_data(food_names[0])
+            return {food_names[0]: nutrition} if nutrition else {}
+        estimates = self._estimate_nutrition_batch(food_names)
+        return {
+            name: _estimate_to_nutrition_data(name, estimates[name.strip().lower()])
+            for name in food_names
+            if estimates.get(name.strip().lower())
+        }
 
     def _estimate_as_nutrition_data(self, food_name: str) -> NutritionData | None:
         """Ask LLM to estimate nutritional values per 100g."""
         raw = self._estimate_nutrition(food_name)
         if not raw:
             return None
-        return NutritionData(
-            product_name=food_name,
-            calories_per_100g=raw.get("calories_per_100g"),
-            protein_per_100g=raw.get("protein_per_100g"),
-            fat_per_100g=raw.get("fat_per_100g"),
-            carbs_per_100g=raw.get("carbs_per_100g"),
-            fiber_per_100g=raw.get("fiber_per_100g"),
-            serving_size_g=None,
-        )
+        return _estimate_to_nutrition_data(food_name, raw)
 
     def _estimate_nutrition(self, food_name: str) -> dict:
         """Fallback: ask LLM to estimate nutritional values per 100g.
@@ -238,7 +338,7 @@ class NutritionService:
             carbs_per_100g, fiber_per_100g. Empty dict on failure.
         """
         try:
-            client = Groq(api_key=self._api_key)
+            client = get_groq_client(self._api_key, timeout=_ESTIMATE_TIMEOUT_SECONDS)
             response = client.chat.completions.create(
                 model=_MODEL,
                 max_tokens=200,
@@ -248,15 +348,41 @@ class NutritionService:
                 ],
             )
             raw = response.choices[0].message.content.strip()
-            # Strip markdown code fences if present
-            if raw.startswith("```"):
-                lines = raw.splitlines()
-                raw = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:]).strip()
-            return json.loads(raw)
+            return json.loads(strip_md_fences(raw))
         except Exception as exc:
             logger.warning("LLM nutrition estimate failed for '%s': %s", food_name, exc)
             return {}
 
+    def _estimate_nutrition_batch(self, food_names: list[str]) -> dict[str, dict]:
+        """Fallback for several foods in one LLM request.
+
+        Returns:
+            Dict mapping each lower-cased food name to the same per-100g dict
+            _estimate_nutrition returns. Empty dict on failure.
+        """
+        try:
+            client = get_groq_client(self._api_key, timeout=_ESTIMATE_TIMEOUT_SECONDS)
+            response = client.chat.completions.create(
+                model=_MODEL,
+                max_tokens=200 * len(food_names),
+                messages=[
+                    {"role": "system", "content": _ESTIMATE_BATCH_SYSTEM},
+                    {"role": "user", "content": json.dumps(food_names, ensure_ascii=False)},
+                ],
+            )
+            raw = response.choices[0].message.content.strip()
+            data = json.loads(strip_md_fences(raw))
+            if not isinstance(data, dict):
+                raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+            return {
+                str(name).strip().lower(): values
+                for name, values in data.items()
+                if isinstance(values, dict)
+            }
+        except Exception as exc:
+            logger.warning("LLM batch nutrition estimate failed for %s: %s", food_names, exc)
+            return {}
+
     def _calculate_nutrients(
         self, nutrition: NutritionData, quantity: float, unit: str
     ) -> dict:
@@ -280,15 +406,27 @@ class NutritionService:
         else:
             factor = quantity / 100.0
 
-        def _scale(val: float | None) -> float | None:
-            if val is None:
-                return None
-            return round(val * factor, 1)
-
+        per_100g = (
+            nutrition.calories_per_100g,
+            nutrition.protein_per_100g,
+            nutrition.fat_per_100g,
+            nutrition.carbs_per_100g,
+            nutrition.fiber_per_100g,
+        )
         return {
-            "calories": _scale(nutrition.calories_per_100g),
-            "protein_g": _scale(nutrition.protein_per_100g),
-            "fat_g": _scale(nutrition.fat_per_100g),
-            "carbs_g": _scale(nutrition.carbs_per_100g),
-            "fiber_g": _scale(nutrition.fiber_per_100g),
+            key: None if val is None else round(val * factor, 1)
+            for key, val in zip(_NUTRIENT_KEYS, per_100g)
         }
+
+
+def _estimate_to_nutrition_data(food_name: str, raw: dict) -> NutritionData:
+    """Wrap an LLM per-100g estimate dict as NutritionData."""
+    return NutritionData(
+        product_name=food_name,
+        calories_per_100g=raw.get("calories_per_100g"),
+        protein_per_100g=raw.get("protein_per_100g"),
+        fat_per_100g=raw.get("fat_per_100g"),
+        carbs_per_100g=raw.get("carbs_per_100g"),
+        fiber_per_100g=raw.get("fiber_per_100g"),
+        serving_size_g=None,
+    )
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import threading
 from datetime import date, timedelta
 
 from ..database.repository import Repository
@@ -24,13 +25,35 @@ except ImportError:
     logger.debug("heartbeat module not available — liveness tracking disabled")
 
 
+# One long-lived loop for all job coroutines, started on first use, instead of
+# building and tearing down a fresh loop for every send
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+# Upper bound for one job coroutine (a Telegram send, possibly with an image)
+_RUN_ASYNC_TIMEOUT_SECONDS = 120
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="jobs-loop", daemon=True).start()
+    return _loop
+
+
 def _run_async(coro) -> None:
-    """Run an async coroutine synchronously from a sync context."""
-    loop = asyncio.new_event_loop()
+    """Run an async coroutine synchronously from a sync context (never from the jobs loop itself).
+
+    A coroutine still running after _RUN_ASYNC_TIMEOUT_SECONDS is cancelled and
+    TimeoutError raised, so a hung Telegram send can't pin the calling thread.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _background_loop())
     try:
-        loop.run_until_complete(coro)
-    finally:
-        loop.close()
+        future.result(timeout=_RUN_ASYNC_TIMEOUT_SECONDS)
+    except TimeoutError:
+        future.cancel()
+        raise
 
 
 def make_sync_job(garmin: GarminClient, repo: Repository, fatsecret=None) -> callable:
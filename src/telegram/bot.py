@@ -6,8 +6,10 @@ Shared helpers (rate limiting, date parsing, row conversion) are in helpers.py.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import warnings
+import weakref
 from datetime import date, timedelta
 from typing import Any, Callable
 
@@ -90,6 +92,8 @@ class TelegramBot(HealthMixin, BodyMixin, NutritionMixin, TrainingMixin, SystemM
         self._newsletter_bulk: Callable | None = None   # Set by main.py if newsletter enabled
         self._xread_callback: Callable | None = None    # Set by main.py if xread enabled
         self._app: Application | None = None
+        # One Bot (and so one HTTP connection pool) per event loop that sends
+        self._bots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Bot] = weakref.WeakKeyDictionary()
         # NutritionService (lazy init — only if GROQ_API_KEY is set)
         self._nutrition_service = None
         if config.groq_api_key:
@@ -98,12 +102,25 @@ class TelegramBot(HealthMixin, BodyMixin, NutritionMixin, TrainingMixin, SystemM
                 config.groq_api_key,
                 usda_api_key=config.usda_api_key,
                 api_ninjas_key=config.api_ninjas_key,
+                repo=repository,
             )
 
     # ------------------------------------------------------------------ #
     # Sending                                                               #
     # ------------------------------------------------------------------ #
 
+    def _get_bot(self) -> Bot:
+        """Bot for the running event loop, created on first use and then reused.
+
+        httpx connection pools are tied to the loop that opened them, so the
+        PTB loop and the scheduler jobs loop each get their own instance.
+        """
+        loop = asyncio.get_running_loop()
+        bot = self._bots.get(loop)
+        if bot is None:
+            bot = self._bots[loop] = Bot(token=self._config.telegram_bot_token)
+        return bot
+
     @retry(
         retry=retry_if_exception_type(TelegramError),
         stop=stop_after_attempt(5),
@@ -113,8 +130,7 @@ class TelegramBot(HealthMixin, BodyMixin, NutritionMixin, TrainingMixin, SystemM
     )
     async def _send(self, text: str, chat_id: int | None = None) -> None:
         """Send a Markdown message to the configured chat."""
-        bot = Bot(token=self._config.telegram_bot_token)
-        await bot.send_message(
+        await self._get_bot().send_message(
             chat_id=chat_id or self._chat_id,
             text=text,
             parse_mode=ParseMode.MARKDOWN,
@@ -166,6 +182,7 @@ class TelegramBot(HealthMixin, BodyMixin, NutritionMixin, TrainingMixin, SystemM
         weight_stats: dict[str, Any] | None = None,
         weekly_nutrition: dict[str, Any] | None = None,
         water_weekly_avg_ml: float | None = None,
+        prev_stats: dict[str, Any] | None = None,
     ) -> None:
         """Send the weekly report message with week-over-week comparison, weight, and nutrition.
 
@@ -175,9 +192,11 @@ class TelegramBot(HealthMixin, BodyMixin, NutritionMixin, TrainingMixin, SystemM
             weekly_nutrition: Pre-computed weekly nutrition dict (with optional avg_deficit).
                               If None, it is fetched from the repository.
             water_weekly_avg_ml: Optional average daily ml of water for the week.
+            prev_stats: Pre-computed previous-week stats. If None, fetched from the repository.
         """
         end_date = stats.get("end_date")
-        prev_stats = self._repo.get_previous_weekly_stats(end_date) if end_date else None
+        if prev_stats is None:
+            prev_stats = self._repo.get_previous_weekly_stats(end_date) if end_date else None
         if weekly_nutrition is None:
             weekly_nutrition = self._repo.get_weekly_nutrition(end_date) if end_date else None
         text = format_weekly_report(
@@ -204,8 +223,7 @@ class TelegramBot(HealthMixin, BodyMixin, NutritionMixin, TrainingMixin, SystemM
             image_bytes: Raw PNG/JPEG bytes.
             caption: Optional caption for the image.
         """
-        bot = Bot(token=self._config.telegram_bot_token)
-        await bot.send_photo(
+        await self._get_bot().send_photo(
             chat_id=self._chat_id,
             photo=image_bytes,
             caption=caption,
@@ -228,7 +246,12 @@ class TelegramBot(HealthMixin, BodyMixin, NutritionMixin, TrainingMixin, SystemM
 
     def build_application(self) -> Application:
         """Build and configure the telegram Application with all command handlers."""
-        app = Application.builder().token(self._config.telegram_bot_token).build()
+        app = (
+            Application.builder()
+            .token(self._config.telegram_bot_token)
+            .post_init(self._post_init)
+            .build()
+        )
 
         # Defense-in-depth: drop all messages from unauthorized chats at the
         # framework level, before any handler code runs.  Each handler still
@@ -302,9 +325,25 @@ class TelegramBot(HealthMixin, BodyMixin, NutritionMixin, TrainingMixin, SystemM
         self._app = app
         return app
 
-    async def register_commands(self) -> None:
-        """Register command list with BotFather so they appear in the Telegram UI."""
-        bot = Bot(token=self._config.telegram_bot_token)
+    async def _post_init(self, application: Application) -> None:
+        """Runs on PTB's own loop once the bot is initialised, before polling starts.
+
+        Initialisation already called getMe, so the Telegram health check is free;
+        command registration reuses the same connected bot.
+        """
+        logger.info("Health: Telegram OK (@%s)", application.bot.username)
+        try:
+            await self.register_commands(application.bot)
+        except Exception as exc:
+            logger.warning("Failed to register bot commands: %s", exc)
+
+    async def register_commands(self, bot: Bot | None = None) -> None:
+        """Register command list with BotFather so they appear in the Telegram UI.
+
+        Pass an already-initialised *bot* (e.g. ``app.bot``) to reuse its session.
+        """
+        if bot is None:
+            bot = self._get_bot()
         commands = sorted(
             [
                 BotCommand("agua", "Registar ou ver ingestão de água (ex: /agua 250)"),
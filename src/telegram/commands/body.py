@@ -145,9 +145,11 @@ class BodyMixin:
         # Send trend chart if enough data
         trend_records = self._repo.get_weight_records_range(90)
         if len(trend_records) >= 2:
-            from ...utils.charts import generate_weight_trend_chart
+            from ...utils.charts import generate_weight_trend_chart, render_chart
             weight_goal = goals.get("weight_kg") if goals else None
-            chart = generate_weight_trend_chart(trend_records, weight_goal=weight_goal, days=90)
+            chart = await render_chart(
+                generate_weight_trend_chart, trend_records, weight_goal=weight_goal, days=90
+            )
             if chart:
                 await self.send_image(chart, caption="📊 Tendência de peso (90 dias)")
 
@@ -111,17 +111,20 @@ class HealthMixin:
         last_sunday = today - timedelta(days=days_since_monday + 1)
         last_monday = last_sunday - timedelta(days=6)
 
-        stats = self._repo.get_weekly_stats(last_sunday)
+        # One DB session for this week, the previous week and weight stats
+        stats, prev_stats, weight_stats = self._repo.get_weekly_report_stats(last_sunday)
         if not stats:
             await update.message.reply_text(
                 f"Sem dados suficientes para a semana de {last_monday} a {last_sunday}."
             )
             return
 
-        # Fetch rows early — needed for deficit calculation AND chart
-        from ...utils.charts import generate_weekly_chart
+        # Fetch rows early — needed for deficit calculation AND chart. The
+        # 14-day window for insights contains this week, so query it once
+        from ...utils.charts import generate_weekly_chart, render_chart
         from ...utils.insights import generate_insights
-        rows = self._repo.get_metrics_range(last_monday, last_sunday)
+        all_rows = self._repo.get_metrics_range(last_sunday - timedelta(days=13), last_sunday)
+        rows = [r for r in all_rows if r.date >= last_monday]
 
         # Compute per-day caloric deficit (burned - eaten; None if no food data)
         deficits: list[int | None] = []
@@ -140,18 +143,16 @@ class HealthMixin:
             valid = [d for d in deficits if d is not None]
             weekly_nutrition["avg_deficit"] = round(sum(valid) / len(valid)) if valid else None
 
-        weight_stats = self._repo.get_weekly_weight_stats(last_sunday)
         water_avg = self._repo.get_weekly_water_avg(last_sunday)
-        await self.send_weekly_report(stats, weight_stats=weight_stats or None, weekly_nutrition=weekly_nutrition, water_weekly_avg_ml=water_avg)
+        await self.send_weekly_report(stats, weight_stats=weight_stats or None, weekly_nutrition=weekly_nutrition, water_weekly_avg_ml=water_avg, prev_stats=prev_stats)
 
         # Chart
         if rows:
             goals = self._repo.get_goals()
-            chart_bytes = generate_weekly_chart(rows, goals=goals, deficits=deficits)
+            chart_bytes = await render_chart(generate_weekly_chart, rows, goals=goals, deficits=deficits)
             if chart_bytes:
                 await self.send_image(chart_bytes, caption="📊 Evolução semanal")
 
-            all_rows = self._repo.get_metrics_range(last_sunday - timedelta(days=13), last_sunday)
             insights = generate_insights(all_rows, goals=goals)
             if insights:
                 insight_text = "💡 *Insights:*\n" + "\n".join(f"• {i}" for i in insights)
@@ -178,12 +179,12 @@ class HealthMixin:
         from ..formatters import format_monthly_report
         await update.message.reply_text(format_monthly_report(stats), parse_mode=ParseMode.MARKDOWN)
         # Send monthly chart
-        from ...utils.charts import generate_monthly_chart
+        from ...utils.charts import generate_monthly_chart, render_chart
         start = stats.get("start_date", yesterday - timedelta(days=29))
         rows = self._repo.get_metrics_range(start, yesterday)
         if rows:
             goals = self._repo.get_goals()
-            chart = generate_monthly_chart(rows, goals=goals)
+            chart = await render_chart(generate_monthly_chart, rows, goals=goals)
             if chart:
                 await self.send_image(chart, caption="📈 Tendência mensal")
 
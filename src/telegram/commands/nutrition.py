@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import logging
 from datetime import date
@@ -80,7 +81,8 @@ class NutritionMixin:
                 return ConversationHandler.END
             ean_code = args[1].strip()
             await update.message.reply_text("🔍 A procurar produto...")
-            result = self._nutrition_service.lookup_ean(ean_code)
+            # OpenFoodFacts is a blocking HTTP call — keep it off the event loop
+            result = await asyncio.to_thread(self._nutrition_service.lookup_ean, ean_code)
             if result is None:
                 context.user_data["pending_ean_code"] = ean_code
                 await update.message.reply_text(
@@ -163,7 +165,7 @@ class NutritionMixin:
 
         await update.message.reply_text("⏳ A processar...")
         try:
-            items = self._nutrition_service.process_text(text)
+            items = await asyncio.to_thread(self._nutrition_service.process_text, text)
         except Exception as exc:
             logger.error("Nutrition process_text failed: %s", exc, exc_info=True)
             await update.message.reply_text("❌ Erro ao processar o texto. Tenta novamente.")
@@ -237,7 +239,7 @@ class NutritionMixin:
             }
             for item in items
         ]
-        self._repo.save_food_entries(target_date, entries)
+        self._repo.save_food_entries_no_ids(target_date, entries)
         total_cal = sum(item.calories or 0 for item in items)
 
         # Persist to food cache so the same query skips the LLM next time
@@ -292,7 +294,7 @@ class NutritionMixin:
             }
             for item in preset.items
         ]
-        self._repo.save_food_entries(target_date, entries)
+        self._repo.save_food_entries_no_ids(target_date, entries)
         total_cal = sum(_scale(item.calories) or 0 for item in preset.items)
 
         date_label = f" ({target_date.strftime('%d/%m/%Y')})" if target_date != date.today() else ""
@@ -482,7 +484,7 @@ class NutritionMixin:
         image_bytes = await file.download_as_bytearray()
 
         try:
-            result = self._nutrition_service.process_barcode(bytes(image_bytes))
+            result = await asyncio.to_thread(self._nutrition_service.process_barcode, bytes(image_bytes))
         except Exception as exc:
             logger.error("Barcode processing failed: %s", exc, exc_info=True)
             await update.message.reply_text("❌ Erro ao processar a imagem.")
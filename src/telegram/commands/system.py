@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io as _io
 import logging
@@ -30,7 +31,7 @@ class SystemMixin:
         await update.message.reply_text("⏳ A sincronizar com o Garmin Connect...")
         from ..formatters import format_error_message
         try:
-            self._garmin_sync()
+            await asyncio.to_thread(self._garmin_sync)
         except Exception as exc:
             logger.error("Manual sync failed: %s", exc)
             await update.message.reply_text(format_error_message("sync manual", exc), parse_mode=ParseMode.MARKDOWN)
@@ -47,7 +48,7 @@ class SystemMixin:
             return
         await update.message.reply_text("⏳ A verificar The Pump newsletter...")
         import asyncio as _asyncio
-        loop = _asyncio.get_event_loop()
+        loop = _asyncio.get_running_loop()
         try:
             await loop.run_in_executor(None, self._newsletter_check)
         except Exception as exc:
@@ -99,7 +100,7 @@ class SystemMixin:
         """/exportar [N|nutricao] — export Garmin or nutrition data as CSV."""
         if not self._auth_check(update) or _is_rate_limited(update.effective_chat.id):
             return
-        from telegram import Bot, InputFile
+        from telegram import InputFile
         args = context.args or []
 
         # /exportar nutricao
@@ -119,8 +120,7 @@ class SystemMixin:
                                  e.protein_g, e.fat_g, e.carbs_g, e.fiber_g, e.source, e.barcode])
             filename = f"nutricao_export_{start}_{today}.csv"
             csv_bytes = buf.getvalue().encode("utf-8")
-            bot = Bot(token=self._config.telegram_bot_token)
-            await bot.send_document(
+            await context.bot.send_document(
                 chat_id=self._chat_id,
                 document=InputFile(_io.BytesIO(csv_bytes), filename=filename),
                 caption=f"🥗 {len(entries)} registos de nutrição exportados",
@@ -131,30 +131,32 @@ class SystemMixin:
         if args and args[0].isdigit():
             limit = int(args[0])
 
-        rows = self._repo.get_all_metrics(limit_days=limit)
-        if not rows:
-            await update.message.reply_text("Sem dados para exportar.")
-            return
-
         buf = _io.StringIO()
         writer = csv.writer(buf)
         writer.writerow(["data", "sono_horas", "sono_score", "sono_qualidade", "passos",
                          "calorias_ativas", "calorias_repouso", "fc_repouso", "stress_medio",
                          "body_battery_max", "body_battery_min"])
-        for r in rows:
+        first_date = last_date = None
+        count = 0
+        for r in self._repo.iter_all_metrics(limit_days=limit):
             writer.writerow([
                 r.date, r.sleep_hours, r.sleep_score, r.sleep_quality,
                 r.steps, r.active_calories, r.resting_calories,
                 r.resting_heart_rate, r.avg_stress, r.body_battery_high, r.body_battery_low,
             ])
+            first_date = first_date or r.date
+            last_date = r.date
+            count += 1
+        if not count:
+            await update.message.reply_text("Sem dados para exportar.")
+            return
 
-        filename = f"garmin_export_{rows[0].date}_{rows[-1].date}.csv"
+        filename = f"garmin_export_{first_date}_{last_date}.csv"
         csv_bytes = buf.getvalue().encode("utf-8")
-        bot = Bot(token=self._config.telegram_bot_token)
-        await bot.send_document(
+        await context.bot.send_document(
             chat_id=self._chat_id,
             document=InputFile(_io.BytesIO(csv_bytes), filename=filename),
-            caption=f"📊 {len(rows)} dias exportados",
+            caption=f"📊 {count} dias exportados",
         )
 
     @safe_command
@@ -176,7 +178,7 @@ class SystemMixin:
             return
         await update.message.reply_text(f"⏳ A sincronizar {len(missing)} dias em falta...")
         try:
-            self._garmin_backfill(missing)
+            await asyncio.to_thread(self._garmin_backfill, missing)
         except Exception as exc:
             logger.error("Backfill failed: %s", exc, exc_info=True)
             await update.message.reply_text(f"❌ Backfill falhou: {exc}")
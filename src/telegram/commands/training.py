@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import date, timedelta
 
@@ -183,7 +184,8 @@ class TrainingMixin:
         goals = self._repo.get_goals()
         weight_goal = goals.get("weight_kg")
         from ...training.recommender import generate_workout
-        workout_text = generate_workout(
+        workout_text = await asyncio.to_thread(
+            generate_workout,
             metrics=metrics,
             nutrition=nutrition,
             equipment=equipment,
@@ -40,7 +40,7 @@ class XreadMixin:
 
         await update.message.reply_text("⏳ A analisar tweet...")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             title, takeaways = await loop.run_in_executor(None, self._xread_callback, url)
         except Exception as exc:
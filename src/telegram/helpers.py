@@ -99,28 +99,21 @@ def safe_command(func):
     return wrapper
 
 
+# DailyMetrics columns exposed to the formatters, in report order
+_METRIC_FIELDS = (
+    "date",
+    "sleep_hours", "sleep_score", "sleep_quality",
+    "sleep_deep_min", "sleep_light_min", "sleep_rem_min", "sleep_awake_min",
+    "steps", "active_calories", "resting_calories", "total_calories",
+    "floors_ascended", "intensity_moderate_min", "intensity_vigorous_min",
+    "resting_heart_rate", "avg_stress", "body_battery_high", "body_battery_low",
+    "spo2_avg", "weight_kg",
+)
+
+
 def _row_to_metrics(row: Any) -> dict[str, Any]:
-    """Convert a DailyMetrics ORM row to a flat dict for formatters."""
-    return {
-        "date": row.date,
-        "sleep_hours": row.sleep_hours,
-        "sleep_score": row.sleep_score,
-        "sleep_quality": row.sleep_quality,
-        "sleep_deep_min": getattr(row, "sleep_deep_min", None),
-        "sleep_light_min": getattr(row, "sleep_light_min", None),
-        "sleep_rem_min": getattr(row, "sleep_rem_min", None),
-        "sleep_awake_min": getattr(row, "sleep_awake_min", None),
-        "steps": row.steps,
-        "active_calories": row.active_calories,
-        "resting_calories": row.resting_calories,
-        "total_calories": row.total_calories,
-        "floors_ascended": getattr(row, "floors_ascended", None),
-        "intensity_moderate_min": getattr(row, "intensity_moderate_min", None),
-        "intensity_vigorous_min": getattr(row, "intensity_vigorous_min", None),
-        "resting_heart_rate": row.resting_heart_rate,
-        "avg_stress": row.avg_stress,
-        "body_battery_high": row.body_battery_high,
-        "body_battery_low": row.body_battery_low,
-        "spo2_avg": getattr(row, "spo2_avg", None),
-        "weight_kg": row.weight_kg,
-    }
+    """Convert a DailyMetrics ORM row to a flat dict for formatters.
+
+    Columns missing from *row* (older rows, lightweight test doubles) map to None.
+    """
+    return {field: getattr(row, field, None) for field in _METRIC_FIELDS}
@@ -5,10 +5,12 @@ from __future__ import annotations
 import logging
 from datetime import date
 
-from groq import Groq
+from ..utils.groq_client import get_groq_client
+from ..utils.json_md import strip_md_fences
 
 logger = logging.getLogger(__name__)
 
+
 _MODEL = "llama-3.3-70b-versatile"
 
 _SYSTEM_PROMPT = """És um personal trainer especializado em perda de gordura e recomposição corporal.
@@ -183,7 +185,7 @@ def generate_workout(
             metrics, nutrition, equipment, training_minutes, training_history,
             weight_history, waist_history, weight_goal,
         )
-        client = Groq(api_key=api_key)
+        client = get_groq_client(api_key)
         response = client.chat.completions.create(
             model=_MODEL,
             max_tokens=800,
@@ -193,14 +195,7 @@ def generate_workout(
                 {"role": "user", "content": user_prompt},
             ],
         )
-        raw = response.choices[0].message.content.strip()
-        # Strip markdown code fences if present
-        if raw.startswith("```"):
-            lines = raw.splitlines()
-            raw = "\n".join(
-                lines[1:-1] if lines[-1].strip() == "```" else lines[1:]
-            ).strip()
-        return raw
+        return strip_md_fences(response.choices[0].message.content.strip())
     except Exception as exc:
         logger.warning("Workout generation failed: %s", exc)
         return None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 
@@ -32,6 +33,7 @@ def create_backup(database_path: str) -> Path | None:
     dest = _BACKUP_DIR / f"garmin_data_{timestamp}.db"
 
     try:
+        _checkpoint_wal(source)
         shutil.copy2(source, dest)
         logger.info("Backup created: %s", dest)
         _prune_old_backups()
@@ -41,6 +43,17 @@ def create_backup(database_path: str) -> Path | None:
         return None
 
 
+def _checkpoint_wal(source: Path) -> None:
+    """Fold any pending WAL frames into the main file so a plain copy is complete."""
+    if not source.with_name(source.name + "-wal").exists():
+        return
+    conn = sqlite3.connect(source, timeout=30)
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+
+
 def _prune_old_backups() -> None:
     """Remove backups older than the retention limit."""
     backups = sorted(_BACKUP_DIR.glob("garmin_data_*.db"))
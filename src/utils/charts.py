@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import io
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
+# pyplot keeps global figure state, so every chart renders on this one worker
+# thread; handlers await it instead of blocking the event loop while it draws.
+_chart_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="charts")
+
+
+async def render_chart(func: Callable[..., bytes | None], *args: Any, **kwargs: Any) -> bytes | None:
+    """Run a chart generator on the dedicated chart thread and await its PNG bytes."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_chart_executor, functools.partial(func, *args, **kwargs))
+
 
 def _requires_matplotlib(func):
     """Decorator: log a warning and return None if matplotlib is unavailable."""
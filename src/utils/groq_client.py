@@ -0,0 +1,31 @@
+"""Shared Groq SDK clients, one per API key and request settings."""
+
+from __future__ import annotations
+
+import threading
+
+from groq import Groq
+
+# Reusing a client shares its HTTP keep-alive pool across calls; the Groq sync
+# client is safe to use from multiple threads
+_clients: dict[tuple[str, float | None, int | None], Groq] = {}
+_clients_lock = threading.Lock()
+
+
+def get_groq_client(api_key: str, timeout: float | None = None, max_retries: int | None = None) -> Groq:
+    """Return the cached client for *api_key*, building it on first use.
+
+    ``timeout`` and ``max_retries`` override the SDK defaults (60 s, 2 retries);
+    each combination gets its own client.
+    """
+    key = (api_key, timeout, max_retries)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            options: dict = {}
+            if timeout is not None:
+                options["timeout"] = timeout
+            if max_retries is not None:
+                options["max_retries"] = max_retries
+            client = _clients[key] = Groq(api_key=api_key, **options)
+    return client
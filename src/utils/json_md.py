@@ -0,0 +1,15 @@
+"""Helpers for cleaning up LLM replies that wrap their payload in Markdown."""
+
+from __future__ import annotations
+
+
+def strip_md_fences(text: str) -> str:
+    """Remove a surrounding ```lang ... ``` code fence, if *text* starts with one.
+
+    The closing fence is optional — models sometimes stop before emitting it.
+    Text that doesn't start with a fence is returned unchanged.
+    """
+    if not text.startswith("```"):
+        return text
+    lines = text.splitlines()
+    return "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:]).strip()
@@ -0,0 +1,29 @@
+"""Minimal-interval pacing for calls to rate-limited APIs."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Block just long enough to keep successive acquire() calls *min_interval* apart.
+
+    Unlike a fixed ``time.sleep`` after each call, time already spent waiting
+    on the network counts towards the interval. Safe to share between threads.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self._min_interval = min_interval
+        self._last_call: float | None = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._last_call is not None:
+                wait = self._min_interval - (now - self._last_call)
+                if wait > 0:
+                    time.sleep(wait)
+                    now = time.monotonic()
+            self._last_call = now
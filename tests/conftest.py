@@ -6,5 +6,26 @@ backend. Forcing Agg here prevents that failure for any test that exercises char
 """
 
 import matplotlib
+import pytest
 
 matplotlib.use("Agg")
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """load_config() is memoized — reset it so each test sees its own patched env."""
+    from src.config import load_config
+
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_groq_clients():
+    """Groq clients are shared per API key — reset them so each test's Groq patch applies."""
+    from src.utils.groq_client import _clients
+
+    _clients.clear()
+    yield
+    _clients.clear()
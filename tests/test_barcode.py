@@ -63,3 +63,28 @@ def test_decode_pyzbar_not_available():
     with patch.object(barcode_module, "_PYZBAR_AVAILABLE", False):
         result = decode_barcode(b"any_bytes")
     assert result is None
+
+
+def test_decode_barcode_uses_downscaled_grayscale_then_full_resolution():
+    """The reduced image is tried first; the original is only decoded on a miss."""
+    barcode = MagicMock()
+    barcode.data = b"5601312308027"
+
+    opened = MagicMock()
+    gray = opened.convert.return_value
+    mock_image_class = MagicMock()
+    mock_image_class.open.return_value = opened
+    decode = MagicMock(side_effect=[[], [barcode]])
+
+    with (
+        patch.object(barcode_module, "_PYZBAR_AVAILABLE", True),
+        patch.object(barcode_module, "Image", mock_image_class),
+        patch.object(barcode_module, "pyzbar_decode", decode),
+    ):
+        result = decode_barcode(b"photo")
+
+    assert result == "5601312308027"
+    opened.draft.assert_called_once_with("L", barcode_module._MAX_DECODE_SIZE)
+    opened.convert.assert_called_once_with("L")
+    assert decode.call_args_list[0].args == (gray,)
+    assert mock_image_class.open.call_count == 2
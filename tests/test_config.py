@@ -50,6 +50,39 @@ def test_load_config_bad_time_format():
             load_config()
 
 
+@pytest.mark.parametrize("value", ["07:00:00", "7:5", "07:", ":30", "07-00"])
+def test_load_config_rejects_malformed_times(value):
+    env = _base_env()
+    env["DAILY_REPORT_TIME"] = value
+    with patch.dict(os.environ, env, clear=True):
+        with pytest.raises(ConfigError, match="DAILY_REPORT_TIME"):
+            load_config()
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("sunday", "sun"),
+    ("Monday", "mon"),
+    (" FRI ", "fri"),
+    ("Domingo", "sun"),
+    ("sábado", "sat"),
+    ("quarta-feira", "wed"),
+])
+def test_load_config_weekly_day_normalised(value, expected):
+    env = _base_env()
+    env["WEEKLY_REPORT_DAY"] = value
+    with patch.dict(os.environ, env, clear=True):
+        config = load_config()
+    assert config.weekly_day == expected
+
+
+def test_load_config_rejects_unknown_weekly_day():
+    env = _base_env()
+    env["WEEKLY_REPORT_DAY"] = "someday"
+    with patch.dict(os.environ, env, clear=True):
+        with pytest.raises(ConfigError, match="WEEKLY_REPORT_DAY"):
+            load_config()
+
+
 def test_load_config_defaults():
     env = {
         "GARMIN_EMAIL": "a@b.com",
@@ -66,6 +99,7 @@ def test_load_config_defaults():
     assert config.sync_retry_delay_minutes == 30
     assert config.health_port is None
     assert config.daily_alerts is True
+    assert config.garmin_pool_size == 20
 
 
 def test_load_config_new_fields_from_env():
@@ -81,15 +115,26 @@ def test_load_config_new_fields_from_env():
 
 
 def test_load_config_daily_alerts_true_variants():
-    """DAILY_ALERTS should be True for any value other than 'false'."""
+    """DAILY_ALERTS should be True for any value not in the falsy set."""
     env = _base_env()
     for value in ("true", "True", "TRUE", "1", "yes"):
         env["DAILY_ALERTS"] = value
+        load_config.cache_clear()
         with patch.dict(os.environ, env, clear=True):
             config = load_config()
         assert config.daily_alerts is True, f"Expected True for DAILY_ALERTS={value!r}"
 
 
+def test_load_config_daily_alerts_false_variants():
+    env = _base_env()
+    for value in ("false", "FALSE", " False ", "0", "no", "off", ""):
+        env["DAILY_ALERTS"] = value
+        load_config.cache_clear()
+        with patch.dict(os.environ, env, clear=True):
+            config = load_config()
+        assert config.daily_alerts is False, f"Expected False for DAILY_ALERTS={value!r}"
+
+
 def test_load_config_health_port_invalid():
     env = _base_env()
     env["HEALTH_PORT"] = "not-a-number"
@@ -98,3 +143,63 @@ def test_load_config_health_port_invalid():
             load_config()
 
 
+@pytest.mark.parametrize("name,value", [
+    ("HEALTH_PORT", "0"),
+    ("HEALTH_PORT", "99999"),
+    ("GARMIN_API_PORT", "70000"),
+    ("SYNC_RETRY_DELAY_MINUTES", "0"),
+    ("WAKE_CHECK_INTERVAL_MINUTES", "-5"),
+    ("GARMIN_POOL_SIZE", "0"),
+])
+def test_load_config_int_out_of_range(name, value):
+    env = _base_env()
+    env[name] = value
+    with patch.dict(os.environ, env, clear=True):
+        with pytest.raises(ConfigError, match=f"{name} out of range"):
+            load_config()
+
+
+def test_load_config_sync_retry_delay_invalid():
+    env = _base_env()
+    env["SYNC_RETRY_DELAY_MINUTES"] = "soon"
+    with patch.dict(os.environ, env, clear=True):
+        with pytest.raises(ConfigError, match="SYNC_RETRY_DELAY_MINUTES"):
+            load_config()
+
+
+def test_load_config_is_memoized():
+    with patch.dict(os.environ, _base_env(), clear=True):
+        first = load_config()
+        second = load_config()
+    assert first is second
+
+
+def test_load_config_cache_clear_rereads_env():
+    env = _base_env()
+    with patch.dict(os.environ, env, clear=True):
+        first = load_config()
+    env["LOG_LEVEL"] = "WARNING"
+    load_config.cache_clear()
+    with patch.dict(os.environ, env, clear=True):
+        second = load_config()
+    assert first.log_level == "DEBUG"
+    assert second.log_level == "WARNING"
+
+
+def test_config_is_frozen():
+    import dataclasses
+
+    with patch.dict(os.environ, _base_env(), clear=True):
+        config = load_config()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.log_level = "ERROR"
+
+
+def test_load_config_creates_data_and_log_dirs(tmp_path):
+    env = _base_env()
+    env["DATABASE_PATH"] = str(tmp_path / "data" / "garmin.db")
+    env["LOG_FILE"] = str(tmp_path / "logs" / "bot.log")
+    with patch.dict(os.environ, env, clear=True):
+        load_config()
+    assert (tmp_path / "data").is_dir()
+    assert (tmp_path / "logs").is_dir()
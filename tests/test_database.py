@@ -2,9 +2,11 @@
 
 import tempfile
 import os
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, UTC
 
 import pytest
+from unittest.mock import patch
+from sqlalchemy.exc import StatementError
 
 from src.database.repository import Repository
 
@@ -24,6 +26,68 @@ def repo():
         pass  # Windows may still hold the file; not critical for test results
 
 
+# Schema as created by the original models: UNIQUE on daily_metrics.date came
+# only from the unique ix_daily_metrics_date index, not a table constraint
+_BASELINE_DDL = (
+    """CREATE TABLE daily_metrics (
+        id INTEGER NOT NULL, date DATE NOT NULL, sleep_hours FLOAT, sleep_score INTEGER,
+        sleep_quality VARCHAR(20), steps INTEGER, active_calories INTEGER,
+        resting_calories INTEGER, synced_at DATETIME, garmin_sync_success BOOLEAN,
+        PRIMARY KEY (id))""",
+    "CREATE UNIQUE INDEX ix_daily_metrics_date ON daily_metrics (date)",
+    """CREATE TABLE food_entries (
+        id INTEGER NOT NULL, date DATE NOT NULL, name VARCHAR(200) NOT NULL,
+        quantity FLOAT NOT NULL, unit VARCHAR(20) NOT NULL, calories FLOAT, protein_g FLOAT,
+        fat_g FLOAT, carbs_g FLOAT, fiber_g FLOAT, source VARCHAR(30) NOT NULL,
+        barcode VARCHAR(50), created_at DATETIME, PRIMARY KEY (id))""",
+    "CREATE INDEX ix_food_entries_date ON food_entries (date)",
+)
+
+
+@pytest.fixture
+def upgraded_repo(tmp_path):
+    """Repository over a database built with the baseline DDL, then migrated."""
+    import sqlite3
+
+    db_path = tmp_path / "baseline.db"
+    with sqlite3.connect(db_path) as conn:
+        for ddl in _BASELINE_DDL:
+            conn.execute(ddl)
+    r = Repository(str(db_path))
+    r.init_database()
+    yield r
+    r._engine.dispose()
+
+
+def test_migration_keeps_daily_metrics_date_unique(upgraded_repo):
+    from sqlalchemy import inspect
+    from sqlalchemy.exc import IntegrityError
+
+    indexes = {i["name"]: i for i in inspect(upgraded_repo._engine).get_indexes("daily_metrics")}
+    assert indexes["ix_daily_metrics_date"]["unique"]
+    assert "ix_food_entries_date" not in {
+        i["name"] for i in inspect(upgraded_repo._engine).get_indexes("food_entries")
+    }
+    with upgraded_repo._engine.begin() as conn, pytest.raises(IntegrityError):
+        conn.exec_driver_sql("INSERT INTO daily_metrics (date) VALUES ('2026-02-13')")
+        conn.exec_driver_sql("INSERT INTO daily_metrics (date) VALUES ('2026-02-13')")
+
+
+def test_upsert_on_upgraded_database(upgraded_repo):
+    day = date(2026, 2, 13)
+    upgraded_repo.save_daily_metrics(day, {"steps": 5000, "garmin_sync_success": True})
+    upgraded_repo.save_daily_metrics(day, {"steps": 9999, "weight_kg": 80.0})
+    row = upgraded_repo.get_metrics_by_date(day)
+    assert row.steps == 9999
+    assert row.weight_kg == 80.0
+
+
+def test_connections_use_wal(repo):
+    with repo._engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+
 def test_save_and_retrieve_metrics(repo):
     day = date(2026, 2, 13)
     metrics = {
@@ -61,6 +125,13 @@ def test_get_metrics_range(repo):
     assert rows[0].steps == 1000
 
 
+def test_get_missing_dates(repo):
+    repo.save_daily_metrics(date(2026, 2, 8), {"steps": 1000})
+    repo.save_daily_metrics(date(2026, 2, 10), {"steps": 2000})
+    missing = repo.get_missing_dates(date(2026, 2, 7), date(2026, 2, 11))
+    assert missing == [date(2026, 2, 7), date(2026, 2, 9), date(2026, 2, 11)]
+
+
 def test_get_weekly_stats(repo):
     end = date(2026, 2, 13)
     for i in range(7):
@@ -77,6 +148,38 @@ def test_get_weekly_stats(repo):
     assert stats["days_with_data"] == 7
     assert stats["steps_total"] == sum(10000 + i * 100 for i in range(7))
     assert stats["sleep_avg_score"] == 75
+    assert stats["steps_avg"] == 10300
+    assert stats["sleep_avg_hours"] == 7.3
+    assert stats["sleep_best_day"] == end
+    assert stats["sleep_best_hours"] == pytest.approx(7.6)
+    assert stats["sleep_worst_day"] == end - timedelta(days=6)
+    assert stats["sleep_worst_hours"] == 7.0
+
+
+def test_get_weekly_stats_sparse_columns(repo):
+    end = date(2026, 2, 13)
+    repo.save_daily_metrics(end, {"steps": 5000})
+    repo.save_daily_metrics(end - timedelta(days=1), {"sleep_hours": 0.0, "sleep_score": 40})
+    stats = repo.get_weekly_stats(end)
+    assert stats["days_with_data"] == 2
+    assert stats["sleep_avg_hours"] == 0.0
+    assert stats["sleep_best_day"] is None
+    assert stats["sleep_worst_day"] is None
+    assert stats["steps_total"] == 5000
+    assert stats["active_calories_total"] is None
+
+
+def test_get_monthly_stats(repo):
+    end = date(2026, 2, 28)
+    repo.save_daily_metrics(end, {"sleep_hours": 8.0, "steps": 9000, "active_calories": 300})
+    repo.save_daily_metrics(end - timedelta(days=29), {"sleep_hours": 6.0, "steps": 7001})
+    repo.save_daily_metrics(end - timedelta(days=30), {"steps": 99999})  # outside window
+    stats = repo.get_monthly_stats(end)
+    assert stats["days_with_data"] == 2
+    assert stats["sleep_avg_hours"] == 7.0
+    assert stats["steps_avg"] == 8000
+    assert stats["steps_total"] == 16001
+    assert stats["active_calories_total"] == 300
 
 
 def test_log_sync_and_retrieve(repo):
@@ -89,6 +192,19 @@ def test_log_sync_and_retrieve(repo):
     assert "error" in statuses
 
 
+def test_log_sync_rejects_unknown_status(repo):
+    with pytest.raises(StatementError):
+        repo.log_sync("done")
+    assert repo.get_recent_sync_logs(5) == []
+
+
+def test_log_sync_timestamp_set_by_database(repo):
+    repo.log_sync("success")
+    log = repo.get_recent_sync_logs(1)[0]
+    assert log.sync_date is not None
+    assert abs(log.sync_date - datetime.now(UTC).replace(tzinfo=None)) < timedelta(minutes=1)
+
+
 def test_count_stored_days(repo):
     assert repo.count_stored_days() == 0
     repo.save_daily_metrics(date(2026, 2, 1), {"garmin_sync_success": True})
@@ -194,3 +310,41 @@ def test_set_and_get_macro_goals(repo):
     # Existing defaults still present
     assert goals["steps"] == 10000.0
     assert goals["sleep_hours"] == 7.0
+
+
+def test_get_goals_cached_until_set_goal(repo):
+    assert repo.get_goals()["steps"] == 10000.0
+    with patch.object(repo, "_session", side_effect=AssertionError("cache miss")):
+        goals = repo.get_goals()
+    goals["steps"] = 1.0  # callers get a copy, not the cached dict
+    assert repo.get_goals()["steps"] == 10000.0
+    repo.set_goal("steps", 12000.0)
+    assert repo.get_goals()["steps"] == 12000.0
+
+
+def test_get_weekly_report_stats_matches_individual_queries(repo):
+    end = date(2026, 2, 15)
+    for i in range(14):
+        repo.save_daily_metrics(end - timedelta(days=i), {"steps": 1000 + i, "weight_kg": 80.0 - i * 0.1})
+    stats, prev_stats, weight_stats = repo.get_weekly_report_stats(end)
+    assert stats == repo.get_weekly_stats(end)
+    assert prev_stats == repo.get_previous_weekly_stats(end)
+    assert weight_stats == repo.get_weekly_weight_stats(end)
+    assert weight_stats["prev_date"] == end - timedelta(days=7)
+
+
+def test_iter_all_metrics_oldest_first_with_limit(repo):
+    for i in range(5):
+        repo.save_daily_metrics(date(2026, 2, 1) + timedelta(days=i), {"steps": i})
+    assert [r.date.day for r in repo.iter_all_metrics()] == [1, 2, 3, 4, 5]
+    assert [r.date.day for r in repo.iter_all_metrics(limit_days=2)] == [4, 5]
+
+
+def test_save_food_entries_no_ids(repo):
+    day = date(2026, 2, 13)
+    repo.save_food_entries_no_ids(day, [
+        {"name": "ovo", "quantity": 2.0, "calories": 140.0},
+        {"name": "pão", "unit": "g", "quantity": 50.0, "not_a_column": 1},
+    ])
+    rows = repo.get_food_entries(day)
+    assert [(r.name, r.unit) for r in rows] == [("ovo", "un"), ("pão", "g")]
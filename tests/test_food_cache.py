@@ -157,3 +157,59 @@ def test_get_food_cache_preserves_all_fields(repo):
     assert item["fiber_g"] == 2.6
     assert item["source"] == "llm_estimate"
     assert item["barcode"] is None
+
+
+# ------------------------------------------------------------------ #
+# Barcode cache                                                         #
+# ------------------------------------------------------------------ #
+
+_NUTRITION = {
+    "product_name": "Leite meio-gordo",
+    "calories_per_100g": 46.0,
+    "protein_per_100g": 3.2,
+    "fat_per_100g": 1.6,
+    "carbs_per_100g": 4.8,
+    "fiber_per_100g": None,
+    "serving_size_g": 250.0,
+}
+
+
+def test_get_barcode_cache_miss_returns_none(repo):
+    assert repo.get_barcode_cache("5601312308027") is None
+
+
+def test_set_then_get_barcode_cache(repo):
+    repo.set_barcode_cache("5601312308027", _NUTRITION)
+    assert repo.get_barcode_cache("5601312308027") == _NUTRITION
+
+
+def test_get_barcode_cache_ignores_stale_entries(repo):
+    from datetime import datetime, timedelta
+
+    from src.database.models import BarcodeCache
+
+    repo.set_barcode_cache("5601312308027", _NUTRITION)
+    with repo._session() as session:
+        entry = session.get(BarcodeCache, "5601312308027")
+        entry.fetched_at = datetime(2000, 1, 1)
+    assert repo.get_barcode_cache("5601312308027") is None
+
+    # Refreshing the entry makes it fresh again
+    repo.set_barcode_cache("5601312308027", _NUTRITION)
+    assert repo.get_barcode_cache("5601312308027") == _NUTRITION
+
+
+# ------------------------------------------------------------------ #
+# Food-name lookup cache                                                #
+# ------------------------------------------------------------------ #
+
+def test_food_lookup_cache_round_trip_is_case_and_space_insensitive(repo):
+    assert repo.get_food_lookup_cache("Arroz  Cozido") is None
+    repo.set_food_lookup_cache("Arroz  Cozido", _NUTRITION, "openfoodfacts")
+    assert repo.get_food_lookup_cache(" arroz cozido ") == (_NUTRITION, "openfoodfacts")
+
+
+def test_food_lookup_cache_overwrite_updates_source(repo):
+    repo.set_food_lookup_cache("bolo", _NUTRITION, "llm_estimate")
+    repo.set_food_lookup_cache("bolo", _NUTRITION, "usda")
+    assert repo.get_food_lookup_cache("bolo")[1] == "usda"
@@ -21,6 +21,14 @@ def test_assess_sleep_quality():
     assert _assess_sleep_quality(None) is None
 
 
+@pytest.mark.parametrize("score,label", [
+    (0, "Mau"), (59, "Mau"), (60, "Razoável"), (69, "Razoável"),
+    (70, "Bom"), (79, "Bom"), (80, "Excelente"), (100, "Excelente"),
+])
+def test_assess_sleep_quality_boundaries(score, label):
+    assert _assess_sleep_quality(score) == label
+
+
 def _make_client() -> GarminClient:
     return GarminClient("test@example.com", "password")
 
@@ -140,3 +148,291 @@ def test_to_metrics_dict():
     assert d["sleep_hours"] == 7.5
     assert d["steps"] == 10000
     assert d["garmin_sync_success"] is True
+
+
+def test_get_health_data_collects_all_endpoints():
+    client = _make_client()
+    mock_garmin = MagicMock()
+    mock_garmin.get_stats.return_value = {"restingHeartRate": 52}
+    mock_garmin.get_stress_data.return_value = {"avgStressLevel": 31}
+    mock_garmin.get_body_battery.return_value = [{"charged": 20}, {"charged": None}, {"charged": 85}]
+    mock_garmin.get_spo2_data.side_effect = Exception("timeout")
+    mock_garmin.get_intensity_minutes_data.return_value = {
+        "moderateIntensityMinutes": 30, "vigorousIntensityMinutes": 12,
+    }
+    client._client = mock_garmin
+
+    result = client.get_health_data(date(2026, 2, 12))
+
+    assert result["resting_heart_rate"] == 52
+    assert result["avg_stress"] == 31
+    assert result["body_battery_high"] == 85
+    assert result["body_battery_low"] == 20
+    assert result["spo2_avg"] is None  # failed endpoint doesn't affect the others
+    assert result["intensity_moderate_min"] == 30
+    assert result["intensity_vigorous_min"] == 12
+
+
+def test_get_health_data_rate_limit_propagates():
+    import garminconnect
+
+    client = _make_client()
+    mock_garmin = MagicMock()
+    mock_garmin.get_stress_data.side_effect = garminconnect.GarminConnectTooManyRequestsError("429")
+    client._client = mock_garmin
+
+    with pytest.raises(garminconnect.GarminConnectTooManyRequestsError):
+        client.get_health_data(date(2026, 2, 12))
+    assert client._rate_limit_until > 0
+
+
+def test_get_summary_for_date_falls_back_to_same_day_sleep():
+    client = _make_client()
+    mock_garmin = MagicMock()
+    day = date(2026, 2, 12)
+    sleep_by_date = {
+        "2026-02-13": {},
+        "2026-02-12": {"dailySleepDTO": {"sleepTimeSeconds": 25200, "sleepScores": {"overall": {"value": 75}}}},
+    }
+    mock_garmin.get_sleep_data.side_effect = lambda d: sleep_by_date[d]
+    mock_garmin.get_stats.return_value = {"totalSteps": 8000, "restingHeartRate": 55}
+    client._client = mock_garmin
+
+    summary = client.get_summary_for_date(day)
+
+    assert summary.date == day
+    assert summary.sleep.hours == 7.0
+    assert summary.activity.steps == 8000
+    assert summary.resting_heart_rate == 55
+
+
+def test_authenticate_sizes_connection_pool():
+    client = GarminClient("test@example.com", "password", pool_size=8)
+    mock_garmin = MagicMock()
+    with patch("src.garmin.client.create_garmin_client", return_value=mock_garmin):
+        client.authenticate()
+    mock_garmin.garth.configure.assert_called_once_with(pool_connections=8, pool_maxsize=8)
+
+
+def test_get_stats_shared_between_activity_and_health():
+    client = _make_client()
+    mock_garmin = MagicMock()
+    mock_garmin.get_stats.return_value = {"totalSteps": 5000, "restingHeartRate": 60}
+    client._client = mock_garmin
+
+    day = date(2026, 2, 12)
+    activity = client.get_activity_data(day)
+    health = client.get_health_data(day)
+
+    assert activity.steps == 5000
+    assert health["resting_heart_rate"] == 60
+    mock_garmin.get_stats.assert_called_once_with("2026-02-12")
+
+
+def test_get_stats_cache_expires():
+    client = _make_client()
+    mock_garmin = MagicMock()
+    mock_garmin.get_stats.return_value = {"totalSteps": 5000}
+    client._client = mock_garmin
+
+    with patch("src.garmin.client._time.monotonic", return_value=0.0):
+        client.get_activity_data(date(2026, 2, 12))
+    with patch("src.garmin.client._time.monotonic", return_value=301.0):
+        client.get_activity_data(date(2026, 2, 12))
+
+    assert mock_garmin.get_stats.call_count == 2
+
+
+def test_get_stats_cache_drops_expired_days():
+    client = _make_client()
+    mock_garmin = MagicMock()
+    mock_garmin.get_stats.return_value = {"totalSteps": 5000}
+    client._client = mock_garmin
+
+    with patch("src.garmin.client._time.monotonic", return_value=0.0):
+        client._get_stats_cached("2026-02-11")
+    with patch("src.garmin.client._time.monotonic", return_value=301.0):
+        client._get_stats_cached("2026-02-12")
+
+    assert list(client._stats_cache) == ["2026-02-12"]
+
+
+def test_get_stats_different_days_fetch_in_parallel():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = _make_client()
+    mock_garmin = MagicMock()
+    # Both requests must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get_stats(date_str):
+        barrier.wait()
+        return {"totalSteps": 1}
+
+    mock_garmin.get_stats.side_effect = get_stats
+    client._client = mock_garmin
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(client._get_stats_cached, ["2026-02-11", "2026-02-12"]))
+
+    assert results == [{"totalSteps": 1}, {"totalSteps": 1}]
+
+
+def test_get_stats_same_day_shares_in_flight_request():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = _make_client()
+    mock_garmin = MagicMock()
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_stats(date_str):
+        started.set()
+        release.wait(5)
+        return {"totalSteps": 1}
+
+    mock_garmin.get_stats.side_effect = get_stats
+    client._client = mock_garmin
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(client._get_stats_cached, "2026-02-12")
+        started.wait(5)
+        second = pool.submit(client._get_stats_cached, "2026-02-12")
+        release.set()
+        assert first.result() == second.result() == {"totalSteps": 1}
+
+    mock_garmin.get_stats.assert_called_once_with("2026-02-12")
+
+
+def test_fetch_waits_for_in_flight_authenticate():
+    import threading
+
+    client = _make_client()
+    mock_garmin = MagicMock()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_login(email, password):
+        started.set()
+        release.wait(5)
+        return mock_garmin
+
+    with patch("src.garmin.client.create_garmin_client", side_effect=slow_login) as create:
+        login = threading.Thread(target=client.authenticate)
+        login.start()
+        started.wait(5)
+        fetch = threading.Thread(target=client._ensure_authenticated)
+        fetch.start()
+        release.set()
+        login.join(5)
+        fetch.join(5)
+
+    assert create.call_count == 1
+    assert client._client is mock_garmin
+
+
+def test_concurrent_day_fetches_bound_in_flight_requests():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.garmin.client import _MAX_CONCURRENT_REQUESTS
+
+    client = _make_client()
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def slow_call(*args):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return {}
+
+    mock_garmin = MagicMock()
+    for name in ("get_stats", "get_sleep_data", "get_stress_data", "get_body_battery",
+                 "get_spo2_data", "get_intensity_minutes_data", "get_daily_weigh_ins",
+                 "get_body_composition"):
+        getattr(mock_garmin, name).side_effect = slow_call
+    client._client = mock_garmin
+
+    days = [date(2026, 2, d) for d in range(10, 13)]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(client.get_summary_for_date, days))
+
+    assert 1 < peak <= _MAX_CONCURRENT_REQUESTS
+
+
+def test_ensure_authenticated_logs_in_once_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = _make_client()
+    mock_garmin = MagicMock()
+    with patch("src.garmin.client.create_garmin_client", return_value=mock_garmin) as create:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: client._ensure_authenticated(), range(8)))
+
+    assert create.call_count == 1
+    assert all(r is mock_garmin for r in results)
+
+
+def test_to_metrics_dict_without_core_data_is_not_success():
+    from src.garmin.client import DailySummary
+    client = _make_client()
+    summary = DailySummary(
+        date=date(2026, 2, 12),
+        sleep=SleepData(hours=None, score=None, quality=None),
+        activity=ActivityData(steps=0, active_calories=None, resting_calories=None),
+        resting_heart_rate=58,
+    )
+    d = client.to_metrics_dict(summary)
+    assert d["garmin_sync_success"] is False
+    assert d["resting_heart_rate"] == 58
+
+
+def test_breaker_opens_after_consecutive_failures_and_is_shared():
+    from src.garmin.client import _CircuitOpenError
+
+    client = _make_client()
+    mock_garmin = MagicMock()
+    mock_garmin.get_sleep_data.side_effect = Exception("connection reset")
+    client._client = mock_garmin
+
+    with patch("src.garmin.client._time.monotonic", return_value=1000.0):
+        # 3 attempts (tenacity) → 3 consecutive failures → breaker opens for 8s
+        with patch("tenacity.nap.time.sleep"), pytest.raises(Exception, match="connection reset"):
+            client.get_sleep_data(date(2026, 2, 12))
+        with pytest.raises(_CircuitOpenError):
+            client.get_activity_data(date(2026, 2, 12))
+        with pytest.raises(_CircuitOpenError):
+            client.get_health_data(date(2026, 2, 12))
+        with pytest.raises(_CircuitOpenError):
+            client.get_summary_for_date(date(2026, 2, 12))
+    mock_garmin.get_stats.assert_not_called()
+
+    mock_garmin.get_stats.return_value = {"totalSteps": 4000}
+    with patch("src.garmin.client._time.monotonic", return_value=1009.0):
+        assert client.get_activity_data(date(2026, 2, 12)).steps == 4000
+    assert client._breaker_failures == 0
+
+
+def test_get_summary_for_date_prefers_next_day_sleep():
+    client = _make_client()
+    mock_garmin = MagicMock()
+    sleep_by_date = {
+        "2026-02-13": {"dailySleepDTO": {"sleepTimeSeconds": 28800}},
+        "2026-02-12": {"dailySleepDTO": {"sleepTimeSeconds": 18000}},
+    }
+    mock_garmin.get_sleep_data.side_effect = lambda d: sleep_by_date[d]
+    mock_garmin.get_stats.return_value = {}
+    client._client = mock_garmin
+
+    summary = client.get_summary_for_date(date(2026, 2, 12))
+
+    assert summary.sleep.hours == 8.0
+    mock_garmin.get_sleep_data.assert_called_once_with("2026-02-13")
@@ -0,0 +1,27 @@
+"""Tests for src/utils/groq_client.py."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from src.utils.groq_client import get_groq_client
+
+
+@patch("src.utils.groq_client.Groq")
+def test_client_is_reused_per_key_and_settings(mock_groq_cls):
+    first = get_groq_client("key-a")
+    assert get_groq_client("key-a") is first
+    get_groq_client("key-b")
+    get_groq_client("key-a", timeout=8.0, max_retries=2)
+
+    assert mock_groq_cls.call_count == 3
+    assert mock_groq_cls.call_args_list[0].kwargs == {"api_key": "key-a"}
+    assert mock_groq_cls.call_args.kwargs == {"api_key": "key-a", "timeout": 8.0, "max_retries": 2}
+
+
+@patch("src.utils.groq_client.Groq")
+def test_concurrent_callers_build_one_client(mock_groq_cls):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: get_groq_client("key"), range(32)))
+
+    assert mock_groq_cls.call_count == 1
+    assert all(c is clients[0] for c in clients)
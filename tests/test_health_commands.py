@@ -347,3 +347,50 @@ class TestSendDailySummaryBudgetBlock:
         all_text = "\n".join(sent_texts)
         # Budget block markers must NOT appear in scheduled morning report
         assert "Orçamento" not in all_text
+
+
+# ---------------------------------------------------------------------------
+# Bot reuse for outgoing messages
+# ---------------------------------------------------------------------------
+
+def test_get_bot_is_reused_within_a_loop_but_not_across_loops(repo):
+    import asyncio
+
+    bot = _make_bot(repo)
+
+    async def _two_bots():
+        return bot._get_bot(), bot._get_bot()
+
+    first, second = asyncio.run(_two_bots())
+    other, _ = asyncio.run(_two_bots())
+
+    assert first is second
+    assert other is not first
+
+
+# ---------------------------------------------------------------------------
+# /semana: one metrics query for chart and insights
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_semana_fetches_metrics_range_once(repo):
+    from datetime import timedelta
+
+    today = date.today()
+    last_sunday = today - timedelta(days=today.weekday() + 1)
+    for offset in range(14):
+        repo.save_daily_metrics(last_sunday - timedelta(days=offset), {"steps": 8000, "sleep_hours": 7.0})
+
+    update = _make_update()
+    bot = _make_bot(repo, chat_id=update.effective_chat.id)
+
+    with patch.object(repo, "get_metrics_range", wraps=repo.get_metrics_range) as spy, \
+         patch("src.utils.charts.generate_weekly_chart", return_value=None) as chart, \
+         patch("src.utils.insights.generate_insights", return_value=[]) as insights, \
+         patch.object(bot, "send_weekly_report", new_callable=AsyncMock), \
+         patch.object(bot, "_send", new_callable=AsyncMock):
+        await bot._cmd_semana(update, _make_context())
+
+    spy.assert_called_once()
+    assert len(chart.call_args.args[0]) == 7
+    assert len(insights.call_args.args[0]) == 14
@@ -146,6 +146,7 @@ from src.utils.charts import (
     generate_monthly_chart,
     generate_weekly_chart,
     generate_weight_trend_chart,
+    render_chart,
 )
 
 
@@ -220,6 +221,24 @@ def test_generate_weight_trend_chart_needs_at_least_2_records():
     assert generate_weight_trend_chart([(date(2026, 1, 1), 80.0)]) is None
 
 
+def test_render_chart_runs_off_the_event_loop_thread():
+    import threading
+
+    seen = {}
+
+    def fake_chart(rows, goals=None):
+        seen["thread"] = threading.current_thread().name
+        seen["args"] = (rows, goals)
+        return b"png"
+
+    async def main():
+        return await render_chart(fake_chart, [1], goals={"steps": 1})
+
+    assert _run(main()) == b"png"
+    assert seen["args"] == ([1], {"steps": 1})
+    assert seen["thread"].startswith("charts")
+
+
 # ------------------------------------------------------------------ #
 # Backup                                                               #
 # ------------------------------------------------------------------ #
@@ -269,6 +288,26 @@ def test_create_backup_creates_backup_dir_if_missing(backup_dir, source_db):
     assert backup_dir.exists()
 
 
+def test_create_backup_includes_uncheckpointed_wal_writes(backup_dir, tmp_path):
+    import sqlite3
+    from src.database.repository import Repository
+    from src.utils.backup import create_backup
+
+    db_path = tmp_path / "live.db"
+    repo = Repository(str(db_path))
+    repo.init_database()
+    repo.save_daily_metrics(date(2026, 2, 13), {"steps": 1234})
+    try:
+        result = create_backup(str(db_path))
+        conn = sqlite3.connect(result)
+        try:
+            assert conn.execute("SELECT steps FROM daily_metrics").fetchall() == [(1234,)]
+        finally:
+            conn.close()
+    finally:
+        repo._engine.dispose()
+
+
 def test_prune_keeps_last_7(backup_dir):
     import src.utils.backup as backup_mod
     backup_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,62 @@
+"""Tests for the shared event loop behind src/scheduler/jobs._run_async."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.scheduler.jobs import _run_async
+
+
+def test_run_async_reuses_one_background_loop():
+    loops = []
+
+    async def _record():
+        loops.append(asyncio.get_running_loop())
+
+    _run_async(_record())
+    _run_async(_record())
+
+    assert loops[0] is loops[1]
+    assert not loops[0].is_closed()
+
+
+def test_run_async_works_from_worker_threads():
+    seen = []
+
+    async def _record(i):
+        seen.append(i)
+
+    threads = [threading.Thread(target=_run_async, args=(_record(i),)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert sorted(seen) == [0, 1, 2, 3]
+
+
+def test_run_async_propagates_exceptions():
+    async def _boom():
+        raise RuntimeError("send failed")
+
+    with pytest.raises(RuntimeError, match="send failed"):
+        _run_async(_boom())
+
+
+def test_run_async_times_out_and_cancels_hung_coroutine(monkeypatch):
+    import src.scheduler.jobs as jobs
+
+    monkeypatch.setattr(jobs, "_RUN_ASYNC_TIMEOUT_SECONDS", 0.05)
+    cancelled = threading.Event()
+
+    async def _hang():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        _run_async(_hang())
+    assert cancelled.wait(timeout=5)
@@ -0,0 +1,17 @@
+"""Tests for src/utils/json_md.py."""
+
+import pytest
+
+from src.utils.json_md import strip_md_fences
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ('```json\n[{"a": 1}]\n```', '[{"a": 1}]'),
+    ("```\nplain text\n```", "plain text"),
+    ('```json\n[{"a": 1}]', '[{"a": 1}]'),
+    ("```\n```", ""),
+    ('[{"a": 1}]', '[{"a": 1}]'),
+    ("no fence ``` here", "no fence ``` here"),
+])
+def test_strip_md_fences(raw, expected):
+    assert strip_md_fences(raw) == expected
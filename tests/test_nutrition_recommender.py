@@ -2,7 +2,17 @@
 
 from unittest.mock import MagicMock, patch
 
-from src.nutrition.recommender import generate_nutrition_recommendation
+import pytest
+
+from src.nutrition.recommender import _recommend, generate_nutrition_recommendation
+
+
+@pytest.fixture(autouse=True)
+def _clear_recommendations():
+    """Recommendations are memoized — drop them so each test's patch applies."""
+    _recommend.cache_clear()
+    yield
+    _recommend.cache_clear()
 
 
 def _sample_nutrition():
@@ -34,7 +44,7 @@ def test_generate_recommendation_success():
     mock_response.choices = [MagicMock()]
     mock_response.choices[0].message.content = "Recomendo aumentar a proteína ao pequeno-almoço."
 
-    with patch("src.nutrition.recommender.Groq") as mock_groq:
+    with patch("src.utils.groq_client.Groq") as mock_groq:
         mock_client = MagicMock()
         mock_groq.return_value = mock_client
         mock_client.chat.completions.create.return_value = mock_response
@@ -68,7 +78,7 @@ def test_returns_none_without_macro_goals():
 
 
 def test_api_error_returns_none():
-    with patch("src.nutrition.recommender.Groq") as mock_groq:
+    with patch("src.utils.groq_client.Groq") as mock_groq:
         mock_client = MagicMock()
         mock_groq.return_value = mock_client
         mock_client.chat.completions.create.side_effect = Exception("API error")
@@ -87,7 +97,7 @@ def test_prompt_contains_nutrition_data():
     mock_response.choices = [MagicMock()]
     mock_response.choices[0].message.content = "recomendação"
 
-    with patch("src.nutrition.recommender.Groq") as mock_groq:
+    with patch("src.utils.groq_client.Groq") as mock_groq:
         mock_client = MagicMock()
         mock_groq.return_value = mock_client
         mock_client.chat.completions.create.return_value = mock_response
@@ -111,7 +121,7 @@ def test_prompt_contains_weekly_averages():
     mock_response.choices = [MagicMock()]
     mock_response.choices[0].message.content = "recomendação"
 
-    with patch("src.nutrition.recommender.Groq") as mock_groq:
+    with patch("src.utils.groq_client.Groq") as mock_groq:
         mock_client = MagicMock()
         mock_groq.return_value = mock_client
         mock_client.chat.completions.create.return_value = mock_response
@@ -133,7 +143,7 @@ def test_strips_code_fences():
     mock_response.choices = [MagicMock()]
     mock_response.choices[0].message.content = "```\nRecomendação aqui\n```"
 
-    with patch("src.nutrition.recommender.Groq") as mock_groq:
+    with patch("src.utils.groq_client.Groq") as mock_groq:
         mock_client = MagicMock()
         mock_groq.return_value = mock_client
         mock_client.chat.completions.create.return_value = mock_response
@@ -145,3 +155,51 @@ def test_strips_code_fences():
         )
 
     assert result == "Recomendação aqui"
+
+
+def test_empty_day_skips_llm():
+    with patch("src.utils.groq_client.Groq") as mock_groq:
+        result = generate_nutrition_recommendation(
+            nutrition={"calories": 0, "protein_g": None, "entry_count": 0},
+            goals=_sample_goals(),
+            metrics=_sample_metrics(),
+            api_key="test-key",
+        )
+
+    assert result is not None
+    assert "Não há registos" in result
+    mock_groq.assert_not_called()
+
+
+def test_identical_inputs_reuse_previous_answer():
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "Mantém a proteína."
+
+    with patch("src.utils.groq_client.Groq") as mock_groq:
+        mock_client = MagicMock()
+        mock_groq.return_value = mock_client
+        mock_client.chat.completions.create.return_value = mock_response
+
+        kwargs = dict(nutrition=_sample_nutrition(), goals=_sample_goals(), api_key="test-key")
+        first = generate_nutrition_recommendation(**kwargs)
+        second = generate_nutrition_recommendation(**kwargs)
+        generate_nutrition_recommendation(**kwargs, metrics=_sample_metrics())
+
+    assert first == second == "Mantém a proteína."
+    # Different context (Garmin metrics) is a different prompt → a second call
+    assert mock_client.chat.completions.create.call_count == 2
+
+
+def test_failed_call_is_not_cached():
+    with patch("src.utils.groq_client.Groq") as mock_groq:
+        mock_client = MagicMock()
+        mock_groq.return_value = mock_client
+        ok = MagicMock()
+        ok.choices = [MagicMock()]
+        ok.choices[0].message.content = "ok"
+        mock_client.chat.completions.create.side_effect = [Exception("API error"), ok]
+
+        kwargs = dict(nutrition=_sample_nutrition(), goals=_sample_goals(), api_key="test-key")
+        assert generate_nutrition_recommendation(**kwargs) is None
+        assert generate_nutrition_recommendation(**kwargs) == "ok"
@@ -8,7 +8,7 @@ import pytest
 
 from src.nutrition.openfoodfacts import NutritionData
 from src.nutrition.parser import ParsedFoodItem
-from src.nutrition.service import FoodItemResult, NutritionService
+from src.nutrition.service import _ESTIMATE_TIMEOUT_SECONDS, FoodItemResult, NutritionService
 
 
 def _make_nutrition(kcal=200.0, protein=10.0, fat=5.0, carbs=30.0, fiber=2.0, serving=None):
@@ -103,6 +103,35 @@ def test_process_barcode_found(mock_decode, mock_lookup):
     assert result.barcode == "3017620422003"
 
 
+@patch("src.nutrition.service.lookup_barcode")
+def test_lookup_ean_uses_persistent_cache(mock_lookup):
+    """A barcode already in the repository cache skips OpenFoodFacts entirely."""
+    import dataclasses
+
+    repo = MagicMock()
+    repo.get_barcode_cache.return_value = dataclasses.asdict(_make_nutrition(kcal=120.0))
+
+    svc = NutritionService("fake-key", repo=repo)
+    result = svc.lookup_ean("5601312308027")
+
+    assert result.calories == 120.0
+    mock_lookup.assert_not_called()
+    repo.set_barcode_cache.assert_not_called()
+
+
+@patch("src.nutrition.service.lookup_barcode")
+def test_lookup_ean_stores_off_hit_in_cache(mock_lookup):
+    repo = MagicMock()
+    repo.get_barcode_cache.return_value = None
+    mock_lookup.return_value = _make_nutrition()
+
+    svc = NutritionService("fake-key", repo=repo)
+    svc.lookup_ean("5601312308027")
+
+    repo.set_barcode_cache.assert_called_once()
+    assert repo.set_barcode_cache.call_args.args[0] == "5601312308027"
+
+
 @patch("src.nutrition.service.decode_barcode")
 def test_process_barcode_decode_fails(mock_decode):
     """Barcode not detected returns None."""
@@ -271,3 +300,128 @@ def test_get_nutrition_per_100g_uses_chain(mock_off, mock_usda):
     assert result is not None
     assert result.calories_per_100g == pytest.approx(389.0)
     mock_usda.assert_called_once_with("oats", "usda-key")
+
+
+@patch("src.nutrition.service.search_product")
+@patch("src.nutrition.service.parse_food_text")
+def test_process_text_looks_up_items_concurrently_in_order(mock_parse, mock_search):
+    """Lookups overlap, but results keep the parsed item order."""
+    import threading
+
+    names = ["arroz", "frango", "brócolos"]
+    mock_parse.return_value = [ParsedFoodItem(name=n, quantity=100, unit="g") for n in names]
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def _search(name):
+        barrier.wait()  # only passes if all lookups are in flight at once
+        return _make_nutrition(kcal=100.0 + names.index(name))
+
+    mock_search.side_effect = _search
+
+    results = NutritionService("fake-key").process_text("arroz, frango e brócolos")
+
+    assert [r.name for r in results] == names
+    assert [r.calories for r in results] == [100.0, 101.0, 102.0]
+
+
+@patch("src.nutrition.service.get_groq_client")
+@patch("src.nutrition.service.search_product")
+@patch("src.nutrition.service.parse_food_text")
+def test_process_text_batches_llm_fallbacks(mock_parse, mock_search, mock_get_client):
+    """Several API misses are estimated in one LLM call and mapped back by name."""
+    import json
+
+    mock_parse.return_value = [
+        ParsedFoodItem(name="bolo da avó", quantity=100, unit="g"),
+        ParsedFoodItem(name="arroz", quantity=100, unit="g"),
+        ParsedFoodItem(name="Sopa da casa", quantity=200, unit="g"),
+    ]
+    mock_search.side_effect = lambda name: _make_nutrition(kcal=130.0) if name == "arroz" else None
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices = [MagicMock()]
+    client.chat.completions.create.return_value.choices[0].message.content = json.dumps({
+        "sopa da casa": {"calories_per_100g": 40.0, "protein_per_100g": 2.0},
+        "bolo da avó": {"calories_per_100g": 350.0, "protein_per_100g": 5.0},
+    })
+    mock_get_client.return_value = client
+
+    results = NutritionService("fake-key").process_text("bolo, arroz e sopa")
+
+    assert client.chat.completions.create.call_count == 1
+    mock_get_client.assert_called_with("fake-key", timeout=_ESTIMATE_TIMEOUT_SECONDS)
+    assert [r.source for r in results] == ["llm_estimate", "openfoodfacts", "llm_estimate"]
+    assert [r.calories for r in results] == [350.0, 130.0, 80.0]
+
+
+@patch("src.nutrition.service.get_groq_client")
+@patch("src.nutrition.service.search_product")
+@patch("src.nutrition.service.parse_food_text")
+def test_process_text_batch_failure_leaves_items_without_data(mock_parse, mock_search, mock_get_client):
+    mock_parse.return_value = [
+        ParsedFoodItem(name="a", quantity=1, unit="un"),
+        ParsedFoodItem(name="b", quantity=1, unit="un"),
+    ]
+    mock_search.return_value = None
+    mock_get_client.return_value.chat.completions.create.side_effect = Exception("API error")
+
+    results = NutritionService("fake-key").process_text("a e b")
+
+    assert [r.source for r in results] == ["llm_estimate", "llm_estimate"]
+    assert all(r.calories is None for r in results)
+
+
+@patch("src.nutrition.service.get_groq_client")
+@patch("src.nutrition.service.search_product")
+@patch("src.nutrition.service.parse_food_text")
+def test_process_text_serves_repeat_foods_from_cache(mock_parse, mock_search, mock_get_client):
+    """Cached names skip every API; fresh results are written back."""
+    import dataclasses
+
+    repo = MagicMock()
+    repo.get_food_lookup_cache.side_effect = lambda name: (
+        (dataclasses.asdict(_make_nutrition(kcal=155.0)), "openfoodfacts") if name == "ovo" else None
+    )
+    mock_parse.return_value = [
+        ParsedFoodItem(name="ovo", quantity=100, unit="g"),
+        ParsedFoodItem(name="arroz", quantity=100, unit="g"),
+    ]
+    mock_search.return_value = _make_nutrition(kcal=130.0)
+
+    results = NutritionService("fake-key", repo=repo).process_text("ovo e arroz")
+
+    assert [r.calories for r in results] == [155.0, 130.0]
+    mock_search.assert_called_once_with("arroz")
+    mock_get_client.assert_not_called()
+    repo.set_food_lookup_cache.assert_called_once()
+    assert repo.set_food_lookup_cache.call_args.args[0] == "arroz"
+    assert repo.set_food_lookup_cache.call_args.args[2] == "openfoodfacts"
+
+
+@patch("src.nutrition.service.get_groq_client")
+@patch("src.nutrition.service.search_product")
+@patch("src.nutrition.service.parse_food_text")
+def test_llm_estimate_is_not_cached_over_a_later_api_hit(mock_parse, mock_search, mock_get_client, tmp_path):
+    import json
+
+    from src.database.repository import Repository
+
+    repo = Repository(str(tmp_path / "cache.db"))
+    repo.init_database()
+    mock_parse.return_value = [ParsedFoodItem(name="bolo da avó", quantity=100, unit="g")]
+    client = mock_get_client.return_value
+    client.chat.completions.create.return_value.choices = [MagicMock()]
+    client.chat.completions.create.return_value.choices[0].message.content = json.dumps(
+        {"calories_per_100g": 500.0, "protein_per_100g": 5.0}
+    )
+    service = NutritionService("fake-key", repo=repo)
+
+    mock_search.return_value = None  # APIs down / no match: LLM guess
+    first = service.process_text("bolo da avó")
+    mock_search.return_value = _make_nutrition(kcal=350.0)
+    second = service.process_text("bolo da avó")
+
+    assert (first[0].source, first[0].calories) == ("llm_estimate", 500.0)
+    assert (second[0].source, second[0].calories) == ("openfoodfacts", 350.0)
+    assert repo.get_food_lookup_cache("bolo da avó")[1] == "openfoodfacts"
+    repo._engine.dispose()
+
@@ -6,7 +6,23 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.nutrition.openfoodfacts import NutritionData, lookup_barcode, search_product
+from src.nutrition.openfoodfacts import (
+    _PRODUCT_FIELDS,
+    NutritionData,
+    _fetch_barcode,
+    _search,
+    lookup_barcode,
+    search_product,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_lookup_caches():
+    _fetch_barcode.cache_clear()
+    _search.cache_clear()
+    yield
+    _fetch_barcode.cache_clear()
+    _search.cache_clear()
 
 
 def _mock_response(json_data: dict, status_code: int = 200):
@@ -34,7 +50,7 @@ def _product_json(name="Test Product", kcal=150.0, protein=10.0, fat=5.0, carbs=
     }
 
 
-@patch("src.nutrition.openfoodfacts.requests.get")
+@patch("src.nutrition.openfoodfacts._SESSION.get")
 def test_lookup_barcode_found(mock_get):
     mock_get.return_value = _mock_response(_product_json("Babybel Light"))
 
@@ -47,7 +63,22 @@ def test_lookup_barcode_found(mock_get):
     assert result.serving_size_g == 30.0
 
 
-@patch("src.nutrition.openfoodfacts.requests.get")
+@patch("src.nutrition.openfoodfacts._SESSION.get")
+def test_requests_only_needed_fields(mock_get):
+    mock_get.return_value = _mock_response(_product_json())
+
+    lookup_barcode("3017620422003")
+    search_product("babybel")
+
+    for call in mock_get.call_args_list:
+        assert call.kwargs["params"]["fields"] == _PRODUCT_FIELDS
+    # Every key _parse_nutriments reads must be requested
+    for key in ("product_name", "product_name_pt", "abbreviated_product_name",
+                "nutriments", "serving_quantity", "serving_size"):
+        assert key in _PRODUCT_FIELDS.split(",")
+
+
+@patch("src.nutrition.openfoodfacts._SESSION.get")
 def test_lookup_barcode_not_found(mock_get):
     mock_get.return_value = _mock_response({"status": 0}, status_code=404)
     mock_get.return_value.raise_for_status = MagicMock()
@@ -56,7 +87,19 @@ def test_lookup_barcode_not_found(mock_get):
     assert result is None
 
 
-@patch("src.nutrition.openfoodfacts.requests.get")
+@patch("src.nutrition.openfoodfacts._SESSION.get")
+def test_lookup_barcode_does_not_memoize_not_found(mock_get):
+    mock_get.side_effect = [
+        _mock_response({"status": 0}, status_code=404),
+        _mock_response(_product_json("Leite")),
+    ]
+
+    assert lookup_barcode("5601234567890") is None
+    assert lookup_barcode("5601234567890").product_name == "Leite"  # added to OFF since
+    assert mock_get.call_count == 2
+
+
+@patch("src.nutrition.openfoodfacts._SESSION.get")
 def test_lookup_barcode_status_zero_no_data(mock_get):
     """status=0 with no product/nutriments → None."""
     mock_get.return_value = _mock_response({"status": 0})
@@ -65,7 +108,7 @@ def test_lookup_barcode_status_zero_no_data(mock_get):
     assert result is None
 
 
-@patch("src.nutrition.openfoodfacts.requests.get")
+@patch("src.nutrition.openfoodfacts._SESSION.get")
 def test_lookup_barcode_status_zero_with_nutriments(mock_get):
     """status=0 (incomplete entry) but nutriments present → still usable."""
     data = {
@@ -90,7 +133,7 @@ def test_lookup_barcode_status_zero_with_nutriments(mock_get):
     assert result.calories_per_100g == 148.0
 
 
-@patch("src.nutrition.openfoodfacts.requests.get")
+@patch("src.nutrition.openfoodfacts._SESSION.get")
 def test_search_product_found(mock_get):
     mock_get.return_value = _mock_response({
         "products": [_product_json("Arroz Cozido")["product"]]
@@ -103,7 +146,7 @@ def test_search_product_found(mock_get):
     assert result.calories_per_100g == 150.0
 
 
-@patch("src.nutrition.openfoodfacts.requests.get")
+@patch("src.nutrition.openfoodfacts._SESSION.get")
 def test_search_product_no_results(mock_get):
     mock_get.return_value = _mock_response({"products": []})
 
@@ -111,7 +154,7 @@ def test_search_product_no_results(mock_get):
     assert result is None
 
 
-@patch("src.nutrition.openfoodfacts.requests.get")
+@patch("src.nutrition.openfoodfacts._SESSION.get")
 def test_network_timeout_returns_none(mock_get):
     import requests as req
     mock_get.side_effect = req.Timeout("timeout")
@@ -121,3 +164,42 @@ def test_network_timeout_returns_none(mock_get):
 
     result2 = search_product("qualquer coisa")
     assert result2 is None
+
+
+@patch("src.nutrition.openfoodfacts._SESSION.get")
+def test_lookup_barcode_memoizes_hits_but_not_failures(mock_get):
+    import requests as req
+    mock_get.side_effect = [req.ConnectionError("down"), _mock_response(_product_json("Leite"))]
+
+    assert lookup_barcode("5601234567890") is None  # failure is not cached
+    assert lookup_barcode("5601234567890").product_name == "Leite"
+    assert lookup_barcode("5601234567890").product_name == "Leite"
+    assert mock_get.call_count == 2
+
+
+@patch("src.nutrition.openfoodfacts._SESSION.get")
+def test_search_product_memoizes_on_normalised_name(mock_get):
+    import requests as req
+    mock_get.side_effect = [
+        req.ConnectionError("down"),
+        _mock_response({"products": [_product_json("Pão Integral")["product"]]}),
+    ]
+
+    assert search_product("pão integral") is None  # failure is not cached
+    assert search_product("Pão  Integral").product_name == "Pão Integral"
+    assert search_product(" PÃO INTEGRAL ").product_name == "Pão Integral"
+    assert mock_get.call_count == 2
+    assert mock_get.call_args.kwargs["params"]["search_terms"] == "pão integral"
+
+
+@patch("src.nutrition.openfoodfacts._SESSION.get")
+def test_search_product_does_not_memoize_empty_results(mock_get):
+    mock_get.side_effect = [
+        _mock_response({"products": []}),
+        _mock_response({"products": [_product_json("Kefir")["product"]]}),
+    ]
+
+    assert search_product("kefir") is None
+    assert search_product("kefir").product_name == "Kefir"
+    assert mock_get.call_count == 2
+
@@ -7,7 +7,22 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.nutrition.parser import ParsedFoodItem, parse_food_text
+from src.nutrition.parser import (
+    _MAX_RETRIES,
+    _REQUEST_TIMEOUT_SECONDS,
+    ParsedFoodItem,
+    _parse_with_llm,
+    _try_fast_parse,
+    parse_food_text,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_answers():
+    """LLM answers are memoized — drop them so each test's patch applies."""
+    _parse_with_llm.cache_clear()
+    yield
+    _parse_with_llm.cache_clear()
 
 
 def _make_response(text: str):
@@ -27,7 +42,7 @@ def _mock_client(response_text: str):
     return client
 
 
-@patch("src.nutrition.parser.Groq")
+@patch("src.utils.groq_client.Groq")
 def test_parse_two_items(mock_groq_cls):
     """Two items separated by 'e' are parsed correctly."""
     payload = json.dumps([
@@ -46,7 +61,7 @@ def test_parse_two_items(mock_groq_cls):
     assert result[1].quantity == 2.0
 
 
-@patch("src.nutrition.parser.Groq")
+@patch("src.utils.groq_client.Groq")
 def test_parse_grams(mock_groq_cls):
     """Weight in grams is parsed with unit='g'."""
     payload = json.dumps([{"name": "arroz cozido", "quantity": 150, "unit": "g"}])
@@ -60,7 +75,7 @@ def test_parse_grams(mock_groq_cls):
     assert result[0].name == "arroz cozido"
 
 
-@patch("src.nutrition.parser.Groq")
+@patch("src.utils.groq_client.Groq")
 def test_parse_single_item_no_quantity(mock_groq_cls):
     """Item without explicit quantity defaults to 1 un."""
     payload = json.dumps([{"name": "maçã", "quantity": 1, "unit": "un"}])
@@ -85,7 +100,7 @@ def test_whitespace_input_returns_empty_list():
     assert result == []
 
 
-@patch("src.nutrition.parser.Groq")
+@patch("src.utils.groq_client.Groq")
 def test_invalid_json_raises_value_error(mock_groq_cls):
     """Invalid JSON from LLM raises ValueError."""
     mock_groq_cls.return_value = _mock_client("not json at all")
@@ -94,7 +109,25 @@ def test_invalid_json_raises_value_error(mock_groq_cls):
         parse_food_text("something", "fake-key")
 
 
-@patch("src.nutrition.parser.Groq")
+@patch("src.utils.groq_client.Groq")
+def test_array_is_salvaged_from_surrounding_prose(mock_groq_cls):
+    payload = json.dumps([{"name": "queijo fresco", "quantity": 1, "unit": "un"}])
+    mock_groq_cls.return_value = _mock_client(f"Aqui está: {payload} Bom apetite!")
+
+    result = parse_food_text("um queijo fresco", "fake-key")
+
+    assert [i.name for i in result] == ["queijo fresco"]
+
+
+@patch("src.utils.groq_client.Groq")
+def test_unsalvageable_brackets_still_raise(mock_groq_cls):
+    mock_groq_cls.return_value = _mock_client("Aqui está: [nada de útil]")
+
+    with pytest.raises(ValueError, match="invalid JSON"):
+        parse_food_text("something", "fake-key")
+
+
+@patch("src.utils.groq_client.Groq")
 def test_parse_strips_markdown_code_fence(mock_groq_cls):
     """JSON wrapped in ```json ... ``` is parsed correctly."""
     payload = json.dumps([{"name": "babybel light", "quantity": 2, "unit": "un"}])
@@ -106,3 +139,81 @@ def test_parse_strips_markdown_code_fence(mock_groq_cls):
     assert len(result) == 1
     assert result[0].name == "babybel light"
     assert result[0].quantity == 2.0
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("150g arroz e 250 ml leite", [("arroz", 150.0, "g"), ("leite", 250.0, "ml")]),
+    ("200 gramas de frango grelhado", [("frango grelhado", 200.0, "g")]),
+    ("250 ml leite", [("leite", 250.0, "ml")]),
+    ("120g pão, 30g amêndoas", [("pão", 120.0, "g"), ("amêndoas", 30.0, "g")]),
+])
+def test_fast_parse_handles_simple_shapes(text, expected):
+    result = _try_fast_parse(text)
+    assert [(i.name, i.quantity, i.unit) for i in result] == expected
+
+
+@pytest.mark.parametrize("text", [
+    "uma maçã",
+    "1 pudim continente +proteína de chocolate",
+    "2 iogurtes 0%",
+    "1 ovo e arroz",
+    "2 ovos e 150g arroz",
+    "2 babybel light",
+    "200 g",
+    "1 copo de leite",
+    "2 fatias de pão",
+    "2 colheres de azeite",
+    "1 chávena de café",
+    "2 kg batata",
+    "1 l de leite",
+    "3 unidades de bolacha",
+    "2 torradas com manteiga",
+    "150g arroz com feijão",
+])
+def test_fast_parse_defers_ambiguous_text_to_llm(text):
+    assert _try_fast_parse(text) is None
+
+
+@patch("src.utils.groq_client.Groq")
+def test_measure_words_go_to_llm(mock_groq_cls):
+    payload = json.dumps([{"name": "leite", "quantity": 250, "unit": "ml"}])
+    client = _mock_client(payload)
+    mock_groq_cls.return_value = client
+
+    result = parse_food_text("1 copo de leite", "fake-key")
+
+    assert [(i.name, i.quantity, i.unit) for i in result] == [("leite", 250.0, "ml")]
+    client.chat.completions.create.assert_called_once()
+
+
+@patch("src.utils.groq_client.Groq")
+def test_fast_path_skips_llm(mock_groq_cls):
+    result = parse_food_text("150g arroz e 250 ml leite", "fake-key")
+
+    assert [i.name for i in result] == ["arroz", "leite"]
+    mock_groq_cls.assert_not_called()
+
+
+@patch("src.utils.groq_client.Groq")
+def test_identical_llm_inputs_are_memoized(mock_groq_cls):
+    payload = json.dumps([{"name": "iogurte proteico", "quantity": 1, "unit": "un"}])
+    client = _mock_client(payload)
+    mock_groq_cls.return_value = client
+
+    first = parse_food_text("um iogurte proteico", "fake-key")
+    second = parse_food_text("  Um iogurte  proteico ", "fake-key")
+
+    assert first == second
+    assert first[0] is not second[0]  # callers get their own copies
+    assert client.chat.completions.create.call_count == 1
+
+
+@patch("src.utils.groq_client.Groq")
+def test_client_has_bounded_timeout(mock_groq_cls):
+    mock_groq_cls.return_value = _mock_client(json.dumps([{"name": "x", "quantity": 1, "unit": "un"}]))
+
+    parse_food_text("um produto qualquer", "fake-key")
+
+    kwargs = mock_groq_cls.call_args.kwargs
+    assert kwargs["timeout"] == _REQUEST_TIMEOUT_SECONDS
+    assert kwargs["max_retries"] == _MAX_RETRIES
@@ -0,0 +1,30 @@
+"""Tests for src/utils/rate_limiter.py."""
+
+from unittest.mock import patch
+
+from src.utils.rate_limiter import RateLimiter
+
+
+def test_first_acquire_does_not_wait():
+    limiter = RateLimiter(2.0)
+    with patch("src.utils.rate_limiter.time.sleep") as sleep:
+        limiter.acquire()
+    sleep.assert_not_called()
+
+
+def test_acquire_waits_only_for_the_remaining_interval():
+    limiter = RateLimiter(2.0)
+    with patch("src.utils.rate_limiter.time.monotonic", side_effect=[10.0, 10.5, 12.0]), \
+         patch("src.utils.rate_limiter.time.sleep") as sleep:
+        limiter.acquire()
+        limiter.acquire()
+    sleep.assert_called_once_with(1.5)
+
+
+def test_acquire_skips_sleep_when_interval_already_elapsed():
+    limiter = RateLimiter(2.0)
+    with patch("src.utils.rate_limiter.time.monotonic", side_effect=[10.0, 15.0]), \
+         patch("src.utils.rate_limiter.time.sleep") as sleep:
+        limiter.acquire()
+        limiter.acquire()
+    sleep.assert_not_called()
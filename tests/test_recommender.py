@@ -112,7 +112,7 @@ class TestBuildUserPrompt:
 class TestGenerateWorkout:
     def test_returns_text_on_success(self):
         mock_client = _make_groq_response("🏋️ TREINO — Push\nBench press 4x8")
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             result = generate_workout(_make_metrics(), None, "halteres", 45, [], "fake")
         assert result is not None
         assert "TREINO" in result
@@ -120,13 +120,13 @@ class TestGenerateWorkout:
     def test_returns_none_on_api_error(self):
         mock_client = MagicMock()
         mock_client.chat.completions.create.side_effect = Exception("API down")
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             result = generate_workout(_make_metrics(), None, "halteres", 45, [], "fake")
         assert result is None
 
     def test_strips_markdown_code_fences(self):
         mock_client = _make_groq_response("```\n🏋️ TREINO\nBench press\n```")
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             result = generate_workout(_make_metrics(), None, "halteres", 45, [], "fake")
         assert result is not None
         assert "```" not in result
@@ -134,7 +134,7 @@ class TestGenerateWorkout:
 
     def test_strips_code_fence_without_closing(self):
         mock_client = _make_groq_response("```\n🏋️ TREINO\nBench press")
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             result = generate_workout(_make_metrics(), None, "halteres", 45, [], "fake")
         assert result is not None
         assert "```" not in result
@@ -143,7 +143,7 @@ class TestGenerateWorkout:
         """Verify equipment ends up in the actual API call."""
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(_make_metrics(), None, "SPECIAL_EQUIPMENT_XYZ", 45, [], "fake")
         call_kwargs = mock_client.chat.completions.create.call_args
         messages = call_kwargs.kwargs["messages"]
@@ -153,7 +153,7 @@ class TestGenerateWorkout:
     def test_prompt_contains_training_minutes(self):
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(_make_metrics(), None, "halteres", 75, [], "fake")
         call_kwargs = mock_client.chat.completions.create.call_args
         messages = call_kwargs.kwargs["messages"]
@@ -163,7 +163,7 @@ class TestGenerateWorkout:
     def test_uses_correct_model(self):
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(_make_metrics(), None, "halteres", 45, [], "fake")
         call_kwargs = mock_client.chat.completions.create.call_args
         assert call_kwargs.kwargs["model"] == "llama-3.3-70b-versatile"
@@ -172,7 +172,7 @@ class TestGenerateWorkout:
         nutrition = {"calories": 1800, "protein_g": 120, "fat_g": 60, "carbs_g": 200}
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(_make_metrics(), nutrition, "halteres", 45, [], "fake")
         call_kwargs = mock_client.chat.completions.create.call_args
         messages = call_kwargs.kwargs["messages"]
@@ -183,7 +183,7 @@ class TestGenerateWorkout:
         history = [{"date": "2026-02-24", "description": "Deadlift 4x5"}]
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(_make_metrics(), None, "halteres", 45, history, "fake")
         call_kwargs = mock_client.chat.completions.create.call_args
         messages = call_kwargs.kwargs["messages"]
@@ -195,7 +195,7 @@ class TestGenerateWorkout:
         weight_history = [(_date(2026, 2, 25), 81.2), (_date(2026, 2, 22), 81.5)]
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(
                 _make_metrics(), None, "halteres", 45, [], "fake",
                 weight_history=weight_history,
@@ -211,7 +211,7 @@ class TestGenerateWorkout:
         waist_history = [(_date(2026, 2, 25), 94.0), (_date(2026, 2, 10), 95.5)]
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(
                 _make_metrics(), None, "halteres", 45, [], "fake",
                 waist_history=waist_history,
@@ -227,7 +227,7 @@ class TestGenerateWorkout:
         weight_history = [(_date(2026, 2, 25), 81.0)]
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(
                 _make_metrics(), None, "halteres", 45, [], "fake",
                 weight_history=weight_history,
@@ -241,7 +241,7 @@ class TestGenerateWorkout:
     def test_no_weight_or_waist_history_shows_sem_registos(self):
         mock_client = MagicMock()
         mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
-        with patch("src.training.recommender.Groq", return_value=mock_client):
+        with patch("src.utils.groq_client.Groq", return_value=mock_client):
             generate_workout(_make_metrics(), None, "halteres", 45, [], "fake")
         call_kwargs = mock_client.chat.completions.create.call_args
         messages = call_kwargs.kwargs["messages"]
@@ -95,6 +95,21 @@ def test_has_report_sent_today_ignores_sync_logs(repo):
     assert repo.has_report_sent_today() is False
 
 
+def test_log_report_sent_is_idempotent_per_day(repo):
+    repo.log_report_sent()
+    repo.log_report_sent()
+    logs = repo.get_recent_sync_logs(5)
+    assert [l.status for l in logs] == ["report_sent"]
+
+
+def test_has_successful_sync_today_ignores_report_logs(repo):
+    assert repo.has_successful_sync_today() is False
+    repo.log_report_sent()
+    assert repo.has_successful_sync_today() is False
+    repo.log_sync("success")
+    assert repo.has_successful_sync_today() is True
+
+
 # ------------------------------------------------------------------ #
 # GarminClient: check_sleep_available                                  #
 # ------------------------------------------------------------------ #
@@ -157,3 +172,21 @@ def test_check_sleep_available_false_on_exception():
     assert client.check_sleep_available(date(2026, 2, 15)) is False
 
 
+def test_check_sleep_available_caches_negative_briefly():
+    client = _make_client()
+    mock_garmin = MagicMock()
+    mock_garmin.get_sleep_data.return_value = {}
+    client._client = mock_garmin
+    day = date(2026, 2, 15)
+
+    with patch("src.garmin.client._time.monotonic", return_value=100.0):
+        assert client.check_sleep_available(day) is False
+        assert client.check_sleep_available(day) is False
+    assert mock_garmin.get_sleep_data.call_count == 1
+
+    mock_garmin.get_sleep_data.return_value = {"dailySleepDTO": {"sleepTimeSeconds": 27000}}
+    with patch("src.garmin.client._time.monotonic", return_value=161.0):
+        assert client.check_sleep_available(day) is True
+    with patch("src.garmin.client._time.monotonic", return_value=10_000.0):
+        assert client.check_sleep_available(day) is True
+    assert mock_garmin.get_sleep_data.call_count == 2